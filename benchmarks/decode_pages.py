@@ -0,0 +1,118 @@
+"""Benchmark wanted-list page decoding on synthetic payloads.
+
+Builds 50,000 Radarr-like and Sonarr-like wanted records, splits them
+into pages and decodes every page with each available backend of
+``fetcharr.clients.decode``.  Reports CPU time per full pass -- the
+decode cost of one cycle that reads the whole list.
+
+Run with ``python -m benchmarks.decode_pages [records] [page_size]``.
+Install ``fetcharr[fast]`` (msgspec) and/or orjson to compare backends.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Any
+
+from fetcharr.clients import decode
+from fetcharr.clients.decode import decode_page
+from fetcharr.clients.radarr import MOVIE_PROJECTION
+from fetcharr.clients.sonarr import EPISODE_PROJECTION
+
+
+def _movie(i: int) -> dict[str, Any]:
+    return {
+        "id": i,
+        "title": f"Synthetic Movie {i}",
+        "originalTitle": f"Synthetic Movie {i}",
+        "sortTitle": f"synthetic movie {i}",
+        "monitored": i % 7 != 0,
+        "year": 1950 + i % 75,
+        "runtime": 90 + i % 60,
+        "overview": "A synthetic overview sentence that pads the record. " * 3,
+        "images": [{"coverType": "poster", "url": f"/MediaCover/{i}/poster.jpg"}],
+        "genres": ["Drama", "Thriller"],
+        "ratings": {"imdb": {"votes": i, "value": 6.5}, "tmdb": {"votes": i, "value": 7.1}},
+        "lastSearchTime": None,
+    }
+
+
+def _episode(i: int) -> dict[str, Any]:
+    return {
+        "id": i,
+        "seriesId": i // 100,
+        "tvdbId": 1_000_000 + i,
+        "episodeFileId": 0,
+        "seasonNumber": (i // 10) % 12,
+        "episodeNumber": i % 10 + 1,
+        "title": f"Synthetic Episode {i}",
+        "airDate": "2021-03-04",
+        "airDateUtc": "2021-03-04T02:00:00Z",
+        "overview": "A synthetic overview sentence that pads the record. " * 2,
+        "hasFile": False,
+        "monitored": i % 5 != 0,
+        "unverifiedSceneNumbering": False,
+        "lastSearchTime": "2024-01-01T00:00:00Z",
+    }
+
+
+def _pages(records: list[dict[str, Any]], page_size: int) -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "page": start // page_size + 1,
+                "pageSize": page_size,
+                "sortKey": "id",
+                "totalRecords": len(records),
+                "records": records[start : start + page_size],
+            }
+        ).encode()
+        for start in range(0, len(records), page_size)
+    ]
+
+
+def _cpu_seconds(pages: list[bytes], projection: Any, backend: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for page in pages:
+            decode_page(page, projection, backend=backend)
+        best = min(best, time.process_time() - started)
+    return best
+
+
+def _backends() -> list[tuple[str, str, Any, Any]]:
+    """(label, backend argument, msgspec module, orjson module) per installed path."""
+    found = [("pydantic", "pydantic", decode.msgspec, decode.orjson)]
+    if decode.orjson is not None:
+        found.append(("orjson", "auto", None, decode.orjson))
+    if decode.msgspec is not None:
+        found.append(("msgspec", "auto", decode.msgspec, None))
+    return found
+
+
+def main(count: int = 50_000, page_size: int = 1000) -> None:
+    original = decode.msgspec, decode.orjson
+    for label, make, projection in (
+        ("Radarr movies", _movie, MOVIE_PROJECTION),
+        ("Sonarr episodes", _episode, EPISODE_PROJECTION),
+    ):
+        pages = _pages([make(i) for i in range(1, count + 1)], page_size)
+        size_mb = sum(len(page) for page in pages) / 1_000_000
+        print(f"{label}: {count} records, {len(pages)} pages, {size_mb:.1f} MB")
+        baseline = None
+        for name, backend, msgspec_module, orjson_module in _backends():
+            decode.msgspec, decode.orjson = msgspec_module, orjson_module
+            try:
+                seconds = _cpu_seconds(pages, projection, backend)
+            finally:
+                decode.msgspec, decode.orjson = original
+            baseline = baseline or seconds
+            saved = baseline - seconds
+            print(f"  {name:<9} {seconds * 1000:8.1f} ms CPU per pass  ({saved * 1000:+8.1f} ms saved vs pydantic)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,51 @@
+"""Backlog size trend for one *arr application.
+
+The wanted-missing and wanted-cutoff sizes are sampled by every search
+cycle and, in between, by a cheap count probe that reads
+``totalRecords`` from a one-record page of each list (see
+``ArrClient.count_wanted``).  The samples kept here let the dashboard
+show how the backlog moved recently without fetching any records.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+
+# Samples kept; at one probe a minute this covers about a day.
+BACKLOG_WINDOW = 1440
+
+# Default span, in seconds, that ``change`` compares over.
+TREND_SECONDS = 3600
+
+
+class BacklogTrend:
+    """Recent (time, missing, cutoff) backlog samples for one app."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._samples: deque[tuple[float, int, int]] = deque(maxlen=BACKLOG_WINDOW)
+
+    def record(self, missing: int, cutoff: int) -> None:
+        """Add a sample of both queue sizes."""
+        self._samples.append((self._clock(), missing, cutoff))
+
+    def change(self, queue: str, seconds: float = TREND_SECONDS) -> int | None:
+        """Growth of ``queue`` over the last ``seconds`` (None with fewer than two samples).
+
+        Compares the latest sample with the oldest one inside the span.
+
+        Args:
+            queue: ``"missing"`` or ``"cutoff"``.
+            seconds: How far back to look.
+        """
+        if len(self._samples) < 2:
+            return None
+        column = 1 if queue == "missing" else 2
+        latest = self._samples[-1]
+        since = latest[0] - seconds
+        oldest = next(sample for sample in self._samples if sample[0] >= since)
+        if oldest is latest:
+            return None
+        return latest[column] - oldest[column]
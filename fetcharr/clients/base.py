@@ -3,31 +3,126 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import contextlib
+import functools
+import inspect
+import math
+import operator
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import httpx
 import pydantic
 from loguru import logger
 
-from fetcharr.models.arr import PaginatedResponse, SystemStatus
+from fetcharr.clients.backlog import BacklogTrend
+from fetcharr.clients.breaker import CircuitBreaker, CircuitState
+from fetcharr.clients.cache import CachedResponse, CacheKey, ResponseCache, body_digest, cache_key
+from fetcharr.clients.capabilities import ApiCapabilities
+from fetcharr.clients.decode import decode_page
+from fetcharr.clients.flight import SingleFlight
+from fetcharr.clients.health import HealthRecord
+from fetcharr.clients.hedge import Hedger
+from fetcharr.clients.keyset import RecordWindow, WindowCollector, window_from_records
+from fetcharr.clients.metrics import ClientMetrics
+from fetcharr.clients.retry import RetryPolicy
+from fetcharr.clients.transport import build_timeout, build_transport
+from fetcharr.clients.tuning import PageSample, PageSizeTuner
+from fetcharr.models.arr import CommandResource, PaginatedResponse, SystemStatus
+from fetcharr.models.config import ArrConfig
+
+# Seconds before a capability probe that could not reach the app is repeated.
+CAPABILITY_RETRY_SECONDS = 300
+
+# Bodies (bytes) and pages (records) at least this large are decoded,
+# hashed and filtered in the worker pool instead of on the event loop.
+OFFLOAD_MIN_BYTES = 256 * 1024
+OFFLOAD_MIN_RECORDS = 500
+
+# Most pages a page walk keeps requested ahead of its consumer, per unit
+# of ``page_concurrency``.
+PAGE_LOOKAHEAD = 2
+
+# Errors after which a single page is retried once more and, where the
+# caller tolerates gaps, skipped.
+PAGE_ERRORS = (httpx.HTTPError, pydantic.ValidationError)
+
+T = TypeVar("T")
+
+
+def _accept_flags(accept: Callable[[Any], bool], records: list[Any]) -> list[bool]:
+    """Evaluate ``accept`` for every record (run in the decode worker pool)."""
+    return [accept(record) for record in records]
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """Raise for error statuses, treating ``304 Not Modified`` as success."""
+    if response.status_code != 304:
+        response.raise_for_status()
 
 
 class ArrClient:
     """Base httpx async client wrapping *arr API communication.
 
-    Provides paginated fetching, retry logic, and connection validation.
-    Subclasses set ``_app_name`` and define endpoint-specific methods.
+    Provides paginated fetching, retry logic, response caching, and
+    connection validation.  Subclasses set ``_app_name`` and define
+    endpoint-specific methods.
+    Per-app tuning (concurrency limits, transport etc.) is read from
+    ``config``; when omitted, ``ArrConfig`` defaults apply.  ``timeout``,
+    when given, overrides the configured connect and read timeouts.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0) -> None:
+    # First major app version whose wanted endpoints honour ``monitored=true``
+    # (None = never; the engine's client-side filter does the work instead)
+    MONITORED_FILTER_MIN_MAJOR: int | None = None
+    # Server-side sort key for least-recently-searched ordering (None = none)
+    LAST_SEARCH_SORT_KEY: str | None = None
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float | None = None,
+        *,
+        config: ArrConfig | None = None,
+    ) -> None:
         self._app_name: str = ""
+        self._config = config or ArrConfig()
+        self._capabilities: ApiCapabilities | None = None
+        self._decode_backend = "auto" if self._config.fast_decode else "pydantic"
+        self._decode_pool = (
+            ThreadPoolExecutor(self._config.decode_workers, thread_name_prefix="fetcharr-decode")
+            if self._config.decode_workers > 0
+            else None
+        )
+        self._probed_at = 0.0
+        self._page_semaphore = asyncio.Semaphore(self._config.page_concurrency)
+        self._page_sizes = PageSizeTuner(
+            minimum=self._config.page_size_min,
+            maximum=self._config.page_size_max,
+        )
+        self.response_cache = ResponseCache(self._config.response_cache_size)
+        self._flights = SingleFlight()
+        self._retry_policy = RetryPolicy.from_config(self._config)
+        self.metrics = ClientMetrics()
+        self._hedger = Hedger.from_config(self._config, self.metrics)
+        self.health = HealthRecord()
+        self.backlog = BacklogTrend()
+        self._breaker = CircuitBreaker(
+            failure_threshold=self._config.breaker_failure_threshold,
+            reset_timeout=self._config.breaker_reset_timeout,
+        )
         self._client = httpx.AsyncClient(
             base_url=base_url,
             headers={
                 "X-Api-Key": api_key,
                 "Content-Type": "application/json",
             },
-            timeout=httpx.Timeout(timeout),
+            timeout=build_timeout(self._config, timeout),
+            transport=build_transport(self._config),
         )
 
     # ------------------------------------------------------------------
@@ -37,98 +132,705 @@ class ArrClient:
     async def _request_with_retry(
         self, method: str, path: str, **kwargs: Any
     ) -> httpx.Response:
-        """Execute an HTTP request with a single retry on failure.
+        """Execute an HTTP request, retrying per the client's ``RetryPolicy``.
 
-        On the first failure (HTTP status error, connection error, or timeout),
-        wait 2 seconds and retry once.  If the retry also fails, log a warning
-        and re-raise the exception.
+        Transport errors and transient statuses (429, 5xx, ...) are retried
+        with exponential backoff and jitter, honouring ``Retry-After``, until
+        the policy's attempt limit or time budget runs out.  Other HTTP
+        errors (e.g. 400, 401, 404) are raised immediately.  When the request
+        finally fails, a warning is logged and the exception re-raised.
+
+        Every attempt passes through the circuit breaker: while it is open,
+        ``CircuitOpenError`` is raised without sending anything.
         """
-        try:
-            response = await self._client.request(method, path, **kwargs)
-            response.raise_for_status()
-            return response
-        except (httpx.HTTPStatusError, httpx.TransportError):
-            logger.debug(
-                "{app}: Request to {path} failed, retrying in 2s",
-                app=self._app_name,
-                path=path,
-            )
-            await asyncio.sleep(2)
+        policy = self._retry_policy
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._breaker.before_request()
+            self.metrics.requests += 1
             try:
-                response = await self._client.request(method, path, **kwargs)
-                response.raise_for_status()
+                try:
+                    response = await self._client.request(method, path, **kwargs)
+                except httpx.TransportError:
+                    self._breaker.record_failure()
+                    raise
+                self._breaker.record_success()
+                _raise_for_status(response)
                 return response
             except (httpx.HTTPStatusError, httpx.TransportError) as exc:
-                logger.warning(
-                    "{app}: Retry failed for {path}: {exc}",
+                delay = policy.next_delay(attempt, exc, time.monotonic() - started)
+                if delay is None:
+                    if attempt > 1:
+                        self.metrics.retries_exhausted += 1
+                        logger.warning(
+                            "{app}: Retry failed for {path}: {exc}",
+                            app=self._app_name,
+                            path=path,
+                            exc=exc,
+                        )
+                    else:
+                        logger.warning(
+                            "{app}: Request to {path} failed: {exc}",
+                            app=self._app_name,
+                            path=path,
+                            exc=exc,
+                        )
+                    raise
+                self.metrics.retries += 1
+                logger.debug(
+                    "{app}: Request to {path} failed, retrying in {delay:.1f}s",
                     app=self._app_name,
                     path=path,
-                    exc=exc,
+                    delay=delay,
                 )
-                raise
+                await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a GET request to the *arr API, hedged when ``hedge_requests`` is on."""
+        if self._hedger is None:
+            return await self._request_with_retry("GET", path, params=params, headers=headers)
+        return await self._hedged_get(self._hedger, path, params, headers)
+
+    async def _hedged_get(
+        self,
+        hedger: Hedger,
+        path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> httpx.Response:
+        """GET ``path``, sending a duplicate once it outlasts the usual latency of such requests.
+
+        Whichever copy answers first is returned and the other cancelled;
+        if one copy fails, the other is still awaited.  See
+        ``fetcharr.clients.hedge``.
+        """
+        started = time.monotonic()
+        key = hedger.key_for(path, params)
+        delay = hedger.delay_for(key)
+        primary = asyncio.ensure_future(
+            self._request_with_retry("GET", path, params=params, headers=headers)
+        )
+        racing = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(racing, timeout=delay)
+                if not done and hedger.try_hedge():
+                    logger.debug(
+                        "{app}: Hedging GET {path} after {delay:.2f}s",
+                        app=self._app_name,
+                        path=path,
+                        delay=delay,
+                    )
+                    racing.add(
+                        asyncio.ensure_future(
+                            self._request_with_retry("GET", path, params=params, headers=headers)
+                        )
+                    )
+            while True:
+                done, racing = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                answered = [task for task in done if task.exception() is None]
+                if answered or not racing:
+                    break
+            if not answered:
+                return await done.pop()  # every copy failed: raise the error
+            winner = answered[0]
+            if winner is not primary:
+                self.metrics.hedge_wins += 1
+            hedger.observe(key, time.monotonic() - started)
+            return winner.result()
+        finally:
+            for task in racing:
+                task.cancel()
+
+    async def get_cached(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        parse: Callable[[httpx.Response], Any],
+    ) -> Any:
+        """GET *path* and return ``parse(response)``, reusing cached results.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` when the previous
+        response carried an ``ETag`` / ``Last-Modified``.  On a ``304`` or
+        a body identical to the cached one, the cached parsed value is
+        returned and ``parse`` is skipped.  Callers must treat the returned
+        value as read-only since it may be shared between calls.
+
+        Concurrent calls for the same path and params are coalesced: the
+        later callers wait for the request already in flight and share its
+        parsed result, so they must all parse the response the same way.
+        ``parse`` may be a coroutine function (e.g. one that decodes in
+        the worker pool via ``offload``).
+        """
+        key = cache_key(path, params)
+        if self._flights.in_flight(key):
+            self.metrics.coalesced += 1
+        return await self._flights.do(key, lambda: self._fetch_cached(key, path, params, parse))
+
+    async def _fetch_cached(
+        self,
+        key: CacheKey,
+        path: str,
+        params: dict[str, Any] | None,
+        parse: Callable[[httpx.Response], Any],
+    ) -> Any:
+        """Send the (conditional) GET behind ``get_cached`` and update the cache."""
+        cache = self.response_cache
+        entry = cache.get(key)
+        response = await self.get(path, params=params, headers=cache.conditional_headers(entry))
+
+        if entry is not None and response.status_code == 304:
+            self.metrics.cache_hits += 1
+            return entry.value
 
-    async def get(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
-        """Send a GET request to the *arr API."""
-        return await self._request_with_retry("GET", path, params=params)
+        digest = await self.offload(len(response.content) >= OFFLOAD_MIN_BYTES, body_digest, response.content)
+        if entry is not None and entry.digest == digest:
+            self.metrics.cache_hits += 1
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+            return entry.value
+
+        self.metrics.cache_misses += 1
+        value = parse(response)
+        if inspect.isawaitable(value):
+            value = await value
+        cache.put(
+            key,
+            CachedResponse(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                digest=digest,
+                value=value,
+            ),
+        )
+        return value
+
+    async def offload(self, heavy: bool, fn: Callable[..., T], *args: Any) -> T:
+        """Return ``fn(*args)``, computed in the decode worker pool when ``heavy``.
+
+        Keeps CPU-bound decoding, hashing and filtering of large pages
+        off the event loop so the web UI stays responsive during a fetch.
+        Light work, and all work when ``decode_workers = 0``, runs inline.
+        """
+        if not heavy or self._decode_pool is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._decode_pool, fn, *args)
 
     async def post(self, path: str, json_data: dict[str, Any]) -> httpx.Response:
         """Send a POST request to the *arr API."""
         return await self._request_with_retry("POST", path, json=json_data)
 
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Current circuit breaker state for this app."""
+        return self._breaker.state
+
     # ------------------------------------------------------------------
     # Paginated fetching
     # ------------------------------------------------------------------
 
+    async def _fetch_page(
+        self,
+        path: str,
+        page: int,
+        page_size: int,
+        extra_params: dict[str, Any] | None = None,
+        project: Callable[[dict[str, Any]], Any] | None = None,
+        sample: PageSample | None = None,
+        sort_key: str = "id",
+    ) -> tuple[int, list[Any], str]:
+        """Fetch one page sorted ascending by ``sort_key``.
+
+        Returns ``(totalRecords, records, sortKey)``, where ``sortKey`` is
+        the order the *arr reports for the page.  Freshly downloaded pages
+        are measured into ``sample`` (when given) for the page-size tuner;
+        cached pages are not.
+        """
+        params: dict[str, Any] = {
+            "page": page,
+            "pageSize": page_size,
+            "sortKey": sort_key,
+            "sortDirection": "ascending",
+            **(extra_params or {}),
+        }
+
+        async def parse_page(response: httpx.Response) -> tuple[int, list[Any], str]:
+            if sample is not None:
+                sample.seconds += time.monotonic() - started
+            total, records, reported = await self.offload(
+                len(response.content) >= OFFLOAD_MIN_BYTES,
+                functools.partial(decode_page, backend=self._decode_backend),
+                response.content,
+                project,
+            )
+            self.metrics.page_records += len(records)
+            self.metrics.page_bytes += len(response.content)
+            if sample is not None:
+                sample.pages += 1
+                sample.records += len(records)
+                sample.bytes += len(response.content)
+            return total, records, reported
+
+        async with self._page_semaphore:
+            started = time.monotonic()
+            return await self.get_cached(path, params, parse_page)
+
+    async def _fetch_page_retried(
+        self, path: str, page: int, *args: Any, **kwargs: Any
+    ) -> tuple[int, list[Any], str]:
+        """``_fetch_page`` with one more try for a page that failed.
+
+        Only the failed page is requested again; the pages already
+        fetched by the walk are kept.
+        """
+        try:
+            return await self._fetch_page(path, page, *args, **kwargs)
+        except PAGE_ERRORS as exc:
+            logger.debug(
+                "{app}: Retrying page {page} of {path} -- {exc}",
+                app=self._app_name,
+                page=page,
+                path=path,
+                exc=exc,
+            )
+        return await self._fetch_page(path, page, *args, **kwargs)
+
+    def _skip_page(self, skipped: list[int], path: str, page: int, exc: Exception) -> None:
+        """Record a page left out of a walk after its retry failed."""
+        logger.warning(
+            "{app}: Skipping page {page} of {path} -- {exc}",
+            app=self._app_name,
+            page=page,
+            path=path,
+            exc=exc,
+        )
+        skipped.append(page)
+
+    async def _stream_pages(
+        self,
+        first: int,
+        last: int,
+        fetch: Callable[[int], Awaitable[T]],
+        *,
+        ramp: bool = False,
+    ) -> AsyncIterator[tuple[int, T]]:
+        """Yield ``(page, await fetch(page))`` for pages ``first..last`` in page order.
+
+        Pages are requested ahead of the consumer, at most ``PAGE_LOOKAHEAD``
+        times ``page_concurrency`` of them (``_fetch_page`` still bounds how
+        many are on the wire).  With ``ramp`` the lookahead starts at one
+        page and doubles with every page consumed, so a walk that stops
+        after a page or two requests little beyond it.  A consumer that
+        stops early (``aclose()``, e.g. via ``contextlib.aclosing``) cancels
+        the pages in flight and nothing further is requested.
+        """
+        in_flight: deque[tuple[int, asyncio.Task[T]]] = deque()
+        next_page = first
+        limit = self._config.page_concurrency * PAGE_LOOKAHEAD
+        lookahead = 1 if ramp else limit
+        try:
+            while next_page <= last or in_flight:
+                while next_page <= last and len(in_flight) < lookahead:
+                    in_flight.append((next_page, asyncio.ensure_future(fetch(next_page))))
+                    next_page += 1
+                page, task = in_flight.popleft()
+                result = await task
+                lookahead = min(limit, lookahead * 2)
+                yield page, result
+        finally:
+            # Failed page or early stop -- don't leave the others running
+            for _, task in in_flight:
+                task.cancel()
+
+    def _observe_page_size(self, path: str, page_size: int, sample: PageSample) -> None:
+        """Feed one walk's page timings to the page-size tuner."""
+        new_size = self._page_sizes.observe(path, page_size, sample)
+        if new_size != page_size:
+            logger.debug(
+                "{app}: Page size for {path} tuned {old} -> {new}",
+                app=self._app_name,
+                path=path,
+                old=page_size,
+                new=new_size,
+            )
+
     async def get_paginated(
         self,
         path: str,
-        page_size: int = 50,
+        page_size: int | None = None,
         extra_params: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
+        project: Callable[[dict[str, Any]], Any] | None = None,
+        skipped: list[int] | None = None,
+    ) -> list[Any]:
         """Fetch all pages from a paginated *arr endpoint.
 
-        Pages are 1-indexed.  Pagination terminates when the response
-        contains zero records or when all records have been retrieved.
+        Pages are 1-indexed.  The first page is fetched alone to learn
+        ``totalRecords``; the remaining pages are then streamed by
+        ``_stream_pages`` (bounded by ``page_concurrency``) and reassembled
+        in page order, so the result matches a serial walk sorted by ``id``.
+
+        When ``page_size`` is None the size is tuned per endpoint from the
+        latency and body size of previous complete walks (see
+        ``PageSizeTuner``).  When ``project`` is given it is applied to
+        every record as its page arrives.
+
+        A failing page raises, unless ``skipped`` is given: then a page
+        after the first that still fails after one retry is recorded there
+        and left out of the returned (partial) list.
         """
-        all_records: list[dict[str, Any]] = []
-        page = 1
-        extra = extra_params or {}
+        tuned = page_size is None
+        if page_size is None:
+            page_size = self._page_sizes.size_for(path)
+        sample = self._page_sizes.start()
 
-        while True:
-            params: dict[str, Any] = {
-                "page": page,
-                "pageSize": page_size,
-                "sortKey": "id",
-                **extra,
-            }
-            response = await self.get(path, params=params)
-            data = PaginatedResponse.model_validate(response.json())
-
-            total_records = data.totalRecords
-
-            # Handle zero total records immediately
-            if total_records == 0:
+        async def fetch_page(page: int) -> tuple[int, list[Any], str] | None:
+            args = (page_size, extra_params, project, sample)
+            if skipped is None or page == 1:
+                return await self._fetch_page(path, page, *args)
+            try:
+                return await self._fetch_page_retried(path, page, *args)
+            except PAGE_ERRORS as exc:
+                self._skip_page(skipped, path, page, exc)
+                return None
+
+        total_records, records, _ = await fetch_page(1)
+        last_page = math.ceil(total_records / page_size) if records else 1
+        records = list(records)  # the first page may be shared through the response cache
+        async with contextlib.aclosing(self._stream_pages(2, last_page, fetch_page)) as pages:
+            async for _, fetched in pages:
+                if fetched is not None:
+                    records.extend(fetched[1])
+
+        if tuned and total_records and not skipped:
+            self._observe_page_size(path, page_size, sample)
+
+        logger.debug(
+            "Fetched {count} items from {path} ({total} total, cache {hits} hits / {misses} misses)",
+            count=len(records),
+            path=path,
+            total=total_records,
+            hits=self.metrics.cache_hits,
+            misses=self.metrics.cache_misses,
+        )
+        return records
+
+    async def get_window(
+        self,
+        path: str,
+        after_id: int | None,
+        size: int,
+        *,
+        project: Callable[[dict[str, Any]], Any],
+        accept: Callable[[Any], bool] | None = None,
+        group: Callable[[Any], Hashable] | None = None,
+        position_hint: int = 0,
+        sort_key: str = "id",
+        extra_params: dict[str, Any] | None = None,
+    ) -> RecordWindow:
+        """Fetch only the pages covering the next ``size`` records after ``after_id``.
+
+        ``project`` must return records with an ``id``.  The first page
+        of the window is found by binary search over the id-sorted pages,
+        probing the page holding ``position_hint`` (the cursor's last known
+        position) first so an unchanged list costs one probe.  Pages are
+        then walked forward until ``WindowCollector`` is satisfied (see
+        ``fetcharr.clients.keyset`` for ``accept`` and ``group``), with the
+        following pages prefetched by ``_stream_pages`` once the window
+        spans more than one page.  The pages' timings feed the page-size
+        tuner, so later windows of ``path`` use the tuned size.
+
+        Every page gets one retry.  A binary-search probe that still fails
+        is stepped around: the search goes on with the nearest page not yet
+        tried.  A page of the forward walk that still fails (or a failed
+        probe the walk reaches) is skipped and listed in ``skipped_pages``,
+        so the window is built from the pages that did arrive.  The error
+        is raised instead when no record could be collected at all, or when
+        page 1 fails, since it carries ``totalRecords`` and the sort order.
+
+        The seek relies on the pages really being in id order, so the
+        first page's reported ``sortKey`` is checked.  An instance that
+        ignores ``sortKey=id`` gets the whole list fetched and the window
+        selected from it sorted locally, as ``window_from_records`` does.
+
+        With any other ``sort_key`` (e.g. ``lastSearchTime``) there is no
+        id order to seek in: ``after_id`` must be None and the window is
+        the head of the list in that order.
+        """
+        if sort_key != "id" and after_id is not None:
+            msg = f"after_id requires sort_key='id', not {sort_key!r}"
+            raise ValueError(msg)
+        page_size = self._page_sizes.size_for(path)
+        sample = self._page_sizes.start()
+        collector = WindowCollector(after_id, size, accept, group)
+        pages: dict[int, list[Any]] = {}
+        reported: dict[int, str] = {}
+        failed: dict[int, Exception] = {}
+
+        async def load(page: int) -> list[Any]:
+            if page in failed:
+                raise failed[page]
+            if page not in pages:
+                try:
+                    collector.window.total_records, pages[page], reported[page] = await self._fetch_page_retried(
+                        path, page, page_size, extra_params, project=project, sample=sample, sort_key=sort_key
+                    )
+                except PAGE_ERRORS as exc:
+                    failed[page] = exc
+                    raise
+            return pages[page]
+
+        async def load_forward(page: int) -> list[Any] | Exception:
+            try:
+                return await load(page)
+            except PAGE_ERRORS as exc:
+                self._skip_page(collector.window.skipped_pages, path, page, exc)
+                return exc
+
+        await load(1)
+        if sort_key == "id" and reported[1] != "id":
+            logger.warning(
+                "{app}: {path} ignored sortKey=id (sorted by {reported}) -- selecting from the whole list",
+                app=self._app_name,
+                path=path,
+                reported=reported[1],
+            )
+            return await self._window_from_full_list(
+                path, after_id, size, project=project, accept=accept, group=group, extra_params=extra_params
+            )
+        last_page = max(1, math.ceil(collector.window.total_records / page_size))
+
+        # Smallest page whose last record is past the cursor.  The first
+        # probe is the page that held the cursor record; if the cursor was
+        # the last record on it, its successor page is probed next.
+        lo, hi = 1, last_page
+        probe = min(max(1, (position_hint - 1) // page_size + 1), last_page)
+        first_probe = True
+        while after_id is not None and lo < hi:
+            try:
+                records = await load(probe)
+            except PAGE_ERRORS as exc:
+                # Nothing known about this page: go on with its nearest untried
+                # neighbour; if none is left, the walk starts at ``lo`` and skips it
                 logger.debug(
-                    "Fetched 0 items from {path} (0 total)",
+                    "{app}: Probe of page {page} of {path} failed, searching around it -- {exc}",
+                    app=self._app_name,
+                    page=probe,
                     path=path,
+                    exc=exc,
                 )
-                return []
+                untried = [page for page in range(lo, hi) if page not in failed]
+                if not untried:
+                    break
+                probe = min(untried, key=lambda page: abs(page - probe))
+                first_probe = False
+                continue
+            if records and records[-1].id > after_id:
+                hi = probe
+                if records[0].id <= after_id:
+                    lo = probe
+                probe = (lo + hi) // 2
+            else:
+                lo = probe + 1
+                probe = lo if first_probe else (lo + hi) // 2
+            first_probe = False
 
-            all_records.extend(data.records)
+        error: Exception | None = None
+        walk = self._stream_pages(lo, last_page, load_forward, ramp=True)
+        async with contextlib.aclosing(walk) as forward:
+            async for page, records in forward:
+                if isinstance(records, Exception):
+                    error = records
+                    continue
+                offset = (page - 1) * page_size
+                # Large pages are filtered in the worker pool; small ones lazily by the collector
+                flags = (
+                    await self.offload(True, _accept_flags, accept, records)
+                    if accept is not None and len(records) >= OFFLOAD_MIN_RECORDS
+                    else None
+                )
+                if any(
+                    collector.feed(record, offset + index, None if flags is None else flags[index - 1])
+                    for index, record in enumerate(records, start=1)
+                ):
+                    break
+        if error is not None and not collector.window.records:
+            raise error
+        if collector.window.total_records and not collector.window.skipped_pages:
+            self._observe_page_size(path, page_size, sample)
+        return collector.window
 
-            # Terminate when we have all records or page came back empty
-            if len(data.records) == 0 or page * page_size >= total_records:
-                break
+    async def _window_from_full_list(
+        self,
+        path: str,
+        after_id: int | None,
+        size: int,
+        *,
+        project: Callable[[dict[str, Any]], Any],
+        accept: Callable[[Any], bool] | None,
+        group: Callable[[Any], Hashable] | None,
+        extra_params: dict[str, Any] | None,
+    ) -> RecordWindow:
+        """Select the window from the whole list, for pages not in id order.
 
-            page += 1
+        Pages that keep failing are skipped, as in the forward walk of
+        ``get_window``.
+        """
+        skipped: list[int] = []
+        records = await self.get_paginated(path, None, extra_params, project, skipped)
+        records.sort(key=operator.attrgetter("id"))
+        window = window_from_records(records, after_id, size, accept=accept, group=group)
+        window.skipped_pages = skipped
+        return window
 
-        logger.debug(
-            "Fetched {count} items from {path} ({total} total)",
-            count=len(all_records),
-            path=path,
-            total=total_records,
+    # ------------------------------------------------------------------
+    # Capabilities
+    # ------------------------------------------------------------------
+
+    async def capabilities(self) -> ApiCapabilities:
+        """Return the instance's capabilities, probing them on first use.
+
+        A probe that could not read the version is repeated after
+        ``CAPABILITY_RETRY_SECONDS``; until then the baseline applies.
+        """
+        now = time.monotonic()
+        if self._capabilities is None or (
+            self._capabilities.version is None and now - self._probed_at >= CAPABILITY_RETRY_SECONDS
+        ):
+            self._capabilities = await self.probe_capabilities()
+            self._probed_at = now
+        return self._capabilities
+
+    async def probe_capabilities(self) -> ApiCapabilities:
+        """Probe the instance's version, wanted-list sort keys and filters.
+
+        Never raises: anything that cannot be confirmed is reported as
+        unsupported, which keeps the engine on plain v3 behaviour.
+        """
+        try:
+            response = await self.get("/api/v3/system/status")
+            version = SystemStatus.model_validate(response.json()).version
+        except (httpx.HTTPError, pydantic.ValidationError) as exc:
+            logger.debug("{app}: Capability probe failed: {exc}", app=self._app_name, exc=exc)
+            return ApiCapabilities()
+
+        major = ApiCapabilities(version=version).major
+        min_major = self.MONITORED_FILTER_MIN_MAJOR
+        sort_keys = [self.LAST_SEARCH_SORT_KEY] if self.LAST_SEARCH_SORT_KEY else []
+        capabilities = ApiCapabilities(
+            version=version,
+            monitored_filter=min_major is not None and major is not None and major >= min_major,
+            sort_keys=frozenset([key for key in sort_keys if await self._accepts_sort_key(key)]),
         )
-        return all_records
+        logger.info(
+            "{app}: Capabilities -- {summary}",
+            app=self._app_name,
+            summary=capabilities.describe(),
+        )
+        return capabilities
+
+    async def _accepts_sort_key(self, sort_key: str) -> bool:
+        """Return True if a one-record wanted page comes back sorted by ``sort_key``."""
+        params = {"page": 1, "pageSize": 1, "sortKey": sort_key, "sortDirection": "ascending"}
+        try:
+            response = await self.get("/api/v3/wanted/missing", params)
+            return PaginatedResponse.model_validate(response.json()).sortKey == sort_key
+        except (httpx.HTTPError, pydantic.ValidationError):
+            return False
+
+    async def wanted_filter_params(self) -> dict[str, Any]:
+        """Return the query parameters that filter wanted lists to monitored items.
+
+        Empty unless the instance is known to honour them.
+        """
+        if not (await self.capabilities()).monitored_filter:
+            return {}
+        return {"monitored": "true"}
+
+    async def count_unmonitored(self, queue: str) -> int:
+        """Count the unmonitored records a server-side filter keeps off a wanted queue.
+
+        Reads ``totalRecords`` from a one-record page of ``monitored=false``;
+        returns 0 without a request when server-side filtering is off.
+        The count only feeds diagnostics, so a failed request is logged
+        and also reported as 0 instead of raised.
+
+        Args:
+            queue: ``"missing"`` or ``"cutoff"``.
+        """
+        if not await self.wanted_filter_params():
+            return 0
+        try:
+            total, _, _ = await self._fetch_page(f"/api/v3/wanted/{queue}", 1, 1, {"monitored": "false"})
+        except PAGE_ERRORS as exc:
+            logger.warning(
+                "{app}: Could not count unmonitored {queue} items -- {exc}",
+                app=self._app_name,
+                queue=queue,
+                exc=exc,
+            )
+            return 0
+        return total
+
+    async def count_wanted(self, queue: str) -> int:
+        """Return the size of a wanted queue as a search cycle lists it.
+
+        Applies ``wanted_filter_params``, so unmonitored items are left
+        out when the instance filters them (see ``count_unmonitored``).
+        Reads ``totalRecords`` from a one-record page, so the count costs
+        a few hundred bytes instead of the whole list.
+
+        Args:
+            queue: ``"missing"`` or ``"cutoff"``.
+        """
+        total, _, _ = await self._fetch_page(f"/api/v3/wanted/{queue}", 1, 1, await self.wanted_filter_params())
+        return total
+
+    # ------------------------------------------------------------------
+    # Command queue
+    # ------------------------------------------------------------------
+
+    async def get_commands(self) -> list[CommandResource]:
+        """Fetch the app's recent, queued and running commands."""
+        response = await self.get("/api/v3/command")
+        return [CommandResource.model_validate(item) for item in response.json()]
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    async def probe_health(self) -> bool:
+        """Probe ``/api/v3/system/status`` once and record the result in ``health``.
+
+        Uses ``health_check_timeout`` and no retries, so an outage costs
+        one short timeout.  Any response counts as alive (it also closes
+        an open circuit breaker); only an HTTP error status or a network
+        failure counts as down.  Changes of state are logged.
+        """
+        was_down = self.health.down
+        started = time.monotonic()
+        try:
+            response = await self._client.get(
+                "/api/v3/system/status", timeout=self._config.health_check_timeout
+            )
+        except httpx.TransportError as exc:
+            ok, error = False, exc
+        else:
+            self._breaker.record_success()
+            ok = response.status_code < 400
+            error = None if ok else f"HTTP {response.status_code}"
+        self.health.record(ok, time.monotonic() - started)
+        if self.health.down and not was_down:
+            logger.warning("{app}: Health probe failed -- marking unreachable: {exc}", app=self._app_name, exc=error)
+        elif was_down and ok:
+            logger.info("{app}: Health probe answered -- reachable again", app=self._app_name)
+        return ok
 
     # ------------------------------------------------------------------
     # Connection validation
@@ -172,8 +874,10 @@ class ArrClient:
             return False
         except httpx.TimeoutException:
             logger.warning(
-                "{app}: Connection timed out (30s)",
+                "{app}: Connection timed out (connect {connect}s, read {read}s)",
                 app=self._app_name,
+                connect=self._client.timeout.connect,
+                read=self._client.timeout.read,
             )
             return False
         except pydantic.ValidationError as exc:
@@ -189,8 +893,10 @@ class ArrClient:
     # ------------------------------------------------------------------
 
     async def close(self) -> None:
-        """Close the underlying httpx client."""
+        """Close the underlying httpx client and the decode worker pool."""
         await self._client.aclose()
+        if self._decode_pool is not None:
+            self._decode_pool.shutdown(wait=False, cancel_futures=True)
 
     async def __aenter__(self) -> ArrClient:
         return self
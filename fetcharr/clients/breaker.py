@@ -0,0 +1,108 @@
+"""Circuit breaker for *arr API clients.
+
+After ``failure_threshold`` consecutive transport failures (connection
+refused, timeouts, ...) the circuit opens and requests fail immediately
+with ``CircuitOpenError`` instead of each waiting out its own timeout and
+retries.  Once ``reset_timeout`` has passed the circuit goes half-open and
+lets a single probe request through: success closes the circuit, failure
+re-opens it with the wait doubled (up to ``MAX_RESET_TIMEOUT``).
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+import httpx
+
+# Longest wait between half-open probes while an app stays down.
+MAX_RESET_TIMEOUT = 300.0
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states, as shown on the dashboard."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while the circuit is open.
+
+    Subclasses ``httpx.TransportError`` so callers that already handle
+    network failures treat a fast failure the same way.
+    """
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with exponential probe backoff.
+
+    A ``failure_threshold`` of 0 disables the breaker (always closed).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = failure_threshold
+        self._base_reset_timeout = reset_timeout
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its wait elapses."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_request(self) -> None:
+        """Admit a request or raise ``CircuitOpenError``.
+
+        In the half-open state only one probe is admitted at a time.  A
+        probe that never reports back (e.g. it was cancelled) stops
+        blocking new probes after another ``reset_timeout``.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight():
+            self._probe_started_at = self._clock()
+            return
+        msg = "circuit open -- skipping request until the next probe"
+        raise CircuitOpenError(msg)
+
+    def _probe_in_flight(self) -> bool:
+        if self._probe_started_at is None:
+            return False
+        return self._clock() - self._probe_started_at < self._reset_timeout
+
+    def record_success(self) -> None:
+        """A response arrived (any status): the app is reachable."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+        self._reset_timeout = self._base_reset_timeout
+
+    def record_failure(self) -> None:
+        """A transport failure occurred; open the circuit if warranted."""
+        if self._threshold <= 0:
+            return
+        if self._probe_started_at is not None:
+            # Failed probe: stay open and wait longer before the next one
+            self._probe_started_at = None
+            self._reset_timeout = min(MAX_RESET_TIMEOUT, self._reset_timeout * 2)
+            self._opened_at = self._clock()
+            return
+        self._failures += 1
+        if self._failures >= self._threshold and self._opened_at is None:
+            self._opened_at = self._clock()
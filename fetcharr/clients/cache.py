@@ -0,0 +1,85 @@
+"""Bounded cache of parsed GET responses for *arr API clients.
+
+Each entry keeps the validators the server sent (``ETag`` and
+``Last-Modified``) plus a digest of the response body, alongside the
+already parsed value.  A ``304 Not Modified`` or an identical body lets
+the client reuse the parsed value without decoding or validating JSON
+again.  Entries are evicted least-recently-used once ``max_entries`` is
+reached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A parsed GET response and the data needed to revalidate it."""
+
+    etag: str | None
+    last_modified: str | None
+    digest: bytes
+    value: Any
+
+
+def cache_key(path: str, params: dict[str, Any] | None) -> CacheKey:
+    """Build a hashable key from a request path and its query params."""
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (path, items)
+
+
+def body_digest(content: bytes) -> bytes:
+    """Return a short, fast digest of a response body."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ResponseCache:
+    """LRU cache of ``CachedResponse`` entries.
+
+    A ``max_entries`` of 0 disables caching entirely.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self._max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        """Return the entry for *key* (marking it recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, entry: CachedResponse) -> None:
+        """Store *entry*, evicting the least recently used entries if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def conditional_headers(self, entry: CachedResponse | None) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for *entry*."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
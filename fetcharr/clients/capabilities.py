@@ -0,0 +1,45 @@
+"""Per-instance *arr API capabilities.
+
+Radarr and Sonarr instances in the wild span several major versions.
+Each client probes its instance once and caches an ``ApiCapabilities``
+record; the engine reads it to pick the cheapest fetch strategy the
+instance supports, and falls back to the plain v3 behaviour for
+anything not confirmed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ApiCapabilities:
+    """What one *arr instance supports beyond the baseline v3 API.
+
+    Attributes:
+        version: App version string (None when it could not be read).
+        monitored_filter: Wanted endpoints honour ``monitored=true``.
+        sort_keys: Optional wanted-list sort keys the instance accepted.
+    """
+
+    version: str | None = None
+    monitored_filter: bool = False
+    sort_keys: frozenset[str] = frozenset()
+
+    @property
+    def major(self) -> int | None:
+        """Major version number, or None when unknown."""
+        head = (self.version or "").split(".", 1)[0]
+        return int(head) if head.isdigit() else None
+
+    def supports_sort(self, sort_key: str) -> bool:
+        """Return True if wanted lists can be sorted by ``sort_key``."""
+        return sort_key in self.sort_keys
+
+    def describe(self) -> str:
+        """One-line summary for logs."""
+        parts = [f"v{self.version}" if self.version else "version unknown"]
+        if self.monitored_filter:
+            parts.append("monitored filter")
+        parts.extend(f"sort {key}" for key in sorted(self.sort_keys))
+        return "; ".join(parts)
@@ -0,0 +1,163 @@
+"""Decoding of paginated *arr responses.
+
+The baseline path parses a page with the stdlib JSON decoder, validates
+the envelope with ``PaginatedResponse`` (which copies every record dict)
+and then projects each record.  Two faster paths are used when their
+optional dependencies are installed (``pip install fetcharr[fast]``):
+
+- msgspec: the page is decoded in one pass straight into typed structs
+  holding only the fields a ``TypedProjection`` lists; everything else
+  in the payload is skipped without being materialised.
+- orjson: a faster JSON parse, then a cheap shape check instead of the
+  pydantic envelope copy, then the usual projection.
+
+Both fast paths require the same envelope fields as ``PaginatedResponse``.
+A page they reject is handed to the pydantic path, so malformed
+responses raise ``pydantic.ValidationError`` whichever backend is used.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import operator
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fetcharr.models.arr import PaginatedResponse
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Marks a TypedProjection field that has no default.
+REQUIRED: Any = object()
+
+
+def available_backend() -> str:
+    """Name of the fastest installed decoder: msgspec, orjson or pydantic."""
+    if msgspec is not None:
+        return "msgspec"
+    if orjson is not None:
+        return "orjson"
+    return "pydantic"
+
+
+@dataclass(frozen=True, slots=True)
+class TypedProjection:
+    """A record projection that msgspec can also decode directly.
+
+    Calling it applies ``project`` to a raw record dict, so it can be
+    passed anywhere a plain projection function is accepted.
+
+    Attributes:
+        record_type: Class built from the decoded fields, positionally.
+        project: Raw record dict -> record (orjson and pydantic paths).
+        fields: ``(json_key, type, default)`` per ``record_type`` argument,
+            in order; ``REQUIRED`` marks fields without a default.
+    """
+
+    record_type: type
+    project: Callable[[dict[str, Any]], Any]
+    fields: tuple[tuple[str, Any, Any], ...]
+
+    def __call__(self, record: dict[str, Any]) -> Any:
+        return self.project(record)
+
+
+@functools.cache
+def _typed_decoder(projection: TypedProjection) -> tuple[Any, Callable[[Any], tuple]]:
+    """Build (and cache) the msgspec page decoder for ``projection``."""
+    record_struct = msgspec.defstruct(
+        f"{projection.record_type.__name__}Fields",
+        [(key, typ) if default is REQUIRED else (key, typ, default) for key, typ, default in projection.fields],
+    )
+    page_struct = msgspec.defstruct(
+        "TypedPage",
+        [
+            ("page", int),
+            ("pageSize", int),
+            ("sortKey", str),
+            ("totalRecords", int),
+            ("records", list[record_struct]),
+        ],
+    )
+    getter = operator.attrgetter(*(key for key, _, _ in projection.fields))
+    return msgspec.json.Decoder(page_struct), getter
+
+
+def _loads_fast(content: bytes) -> Any:
+    """Parse JSON with orjson or msgspec; malformed input raises ``json.JSONDecodeError``."""
+    if orjson is not None:
+        return orjson.loads(content)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    try:
+        return msgspec.json.decode(content)
+    except msgspec.DecodeError:
+        return json.loads(content)
+
+
+def _decode_pydantic(
+    data: Any, project: Callable[[dict[str, Any]], Any] | None
+) -> tuple[int, list[Any], str]:
+    page = PaginatedResponse.model_validate(data)
+    if project is None:
+        return page.totalRecords, page.records, page.sortKey
+    return page.totalRecords, [project(record) for record in page.records], page.sortKey
+
+
+def decode_page(
+    content: bytes,
+    project: Callable[[dict[str, Any]], Any] | None = None,
+    *,
+    backend: str = "auto",
+) -> tuple[int, list[Any], str]:
+    """Decode one paginated response body into ``(totalRecords, records, sortKey)``.
+
+    ``sortKey`` is the order the *arr reports the page in.
+
+    Args:
+        content: Raw response body.
+        project: Optional projection applied to each record; a
+            ``TypedProjection`` enables the msgspec typed path.
+        backend: ``"auto"`` for the fastest installed decoder, or
+            ``"pydantic"`` to force the baseline path.
+    """
+    if backend == "auto" and msgspec is not None and isinstance(project, TypedProjection):
+        decoder, getter = _typed_decoder(project)
+        try:
+            page = decoder.decode(content)
+        except msgspec.DecodeError:
+            pass
+        else:
+            build = project.record_type
+            if len(project.fields) == 1:
+                return page.totalRecords, [build(getter(record)) for record in page.records], page.sortKey
+            return page.totalRecords, [build(*getter(record)) for record in page.records], page.sortKey
+
+    if backend == "auto" and (msgspec is not None or orjson is not None):
+        data = _loads_fast(content)
+        envelope = data if isinstance(data, dict) else {}
+        total = envelope.get("totalRecords")
+        records = envelope.get("records")
+        sort_key = envelope.get("sortKey")
+        if (
+            type(total) is int
+            and type(envelope.get("page")) is int
+            and type(envelope.get("pageSize")) is int
+            and type(sort_key) is str
+            and isinstance(records, list)
+            and all(type(record) is dict for record in records)
+        ):
+            if project is None:
+                return total, records, sort_key
+            return total, [project(record) for record in records], sort_key
+        return _decode_pydantic(data, project)
+
+    return _decode_pydantic(json.loads(content), project)
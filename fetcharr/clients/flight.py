@@ -0,0 +1,57 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same key while a fetch for it is still
+running, they all await that one fetch and share its result (or error)
+instead of each sending their own request.  The fetch is cancelled only
+once every caller waiting on it has been cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Group of keyed in-flight fetches shared between concurrent callers."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a fetch for *key* is currently running."""
+        return key in self._flights
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of ``fetch()``, joining a running fetch for *key*."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fetch()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda task: self._land(key, task))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                # Last caller gave up -- nobody needs the result any more
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _land(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            task.exception()
@@ -0,0 +1,84 @@
+"""Rolling liveness record for one *arr application.
+
+A background job probes ``/api/v3/system/status`` with a short timeout
+between search cycles (see ``ArrClient.probe_health``).  Each result is
+kept here, so the dashboard reflects outages and recoveries within one
+probe interval, and a cycle can skip its fetch outright instead of
+paying full timeouts against an app that is known to be down.
+"""
+
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+# Probe results remembered for availability and latency.
+HEALTH_WINDOW = 20
+
+# Consecutive failed probes after which the app counts as down.
+DOWN_AFTER_FAILURES = 2
+
+
+def _utc_now() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeResult:
+    """One liveness probe: whether it was answered and how fast."""
+
+    ok: bool
+    seconds: float
+
+
+class HealthRecord:
+    """Recent liveness probe results for one app."""
+
+    def __init__(self, clock: Callable[[], str] = _utc_now) -> None:
+        self._clock = clock
+        self._results: deque[ProbeResult] = deque(maxlen=HEALTH_WINDOW)
+        self.consecutive_failures = 0
+        self.down_since: str | None = None
+        self._first_failure: str | None = None
+
+    def record(self, ok: bool, seconds: float) -> None:
+        """Add a probe result."""
+        self._results.append(ProbeResult(ok, seconds))
+        if ok:
+            self.consecutive_failures = 0
+            self.down_since = None
+            return
+        self.consecutive_failures += 1
+        if self.consecutive_failures == 1:
+            self._first_failure = self._clock()
+        if self.down and self.down_since is None:
+            # Down since the first failure of the run, not the confirming one
+            self.down_since = self._first_failure
+
+    @property
+    def probed(self) -> bool:
+        """Whether any probe has completed yet."""
+        return bool(self._results)
+
+    @property
+    def down(self) -> bool:
+        """True once ``DOWN_AFTER_FAILURES`` probes in a row have failed."""
+        return self.consecutive_failures >= DOWN_AFTER_FAILURES
+
+    @property
+    def availability(self) -> float | None:
+        """Share of recent probes that were answered (None before any probe)."""
+        if not self._results:
+            return None
+        return sum(result.ok for result in self._results) / len(self._results)
+
+    @property
+    def latency_ms(self) -> float | None:
+        """Median latency of recent answered probes, in milliseconds."""
+        answered = [result.seconds for result in self._results if result.ok]
+        if not answered:
+            return None
+        return statistics.median(answered) * 1000
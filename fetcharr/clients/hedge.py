@@ -0,0 +1,79 @@
+"""Hedged GET requests for *arr API clients.
+
+A loaded *arr instance answers most page requests quickly but lets a
+few stall, and one stalled page holds up the whole wanted-list fetch.
+When hedging is on, a GET that is still outstanding after the
+``hedge_percentile`` latency of recent requests to the same endpoint
+with the same ``pageSize`` is sent a second time, and whichever copy
+answers first is used.  Only idempotent GETs are hedged, and the share
+of requests that may be hedged is capped by ``hedge_budget`` so a
+uniformly slow instance is not sent twice the load.
+
+Latency is learnt per ``(path, pageSize)`` key: one-record count probes
+of a wanted list answer far faster than its full pages, and sharing a
+window with them would get every full page hedged.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Hashable
+from typing import Any
+
+from fetcharr.clients.metrics import ClientMetrics
+from fetcharr.models.config import ArrConfig
+
+# Latencies remembered per key.
+LATENCY_WINDOW = 100
+
+# A key needs this many samples before its requests are hedged.
+MIN_SAMPLES = 10
+
+
+class Hedger:
+    """Learns per-endpoint, per-page-size latency and decides when a GET is hedged.
+
+    The budget is checked against the client's ``ClientMetrics``: hedges
+    sent may not exceed ``budget`` times the requests sent.
+    """
+
+    def __init__(self, percentile: float, budget: float, metrics: ClientMetrics) -> None:
+        self._percentile = percentile
+        self._budget = budget
+        self._metrics = metrics
+        self._latencies: dict[Hashable, deque[float]] = {}
+
+    @classmethod
+    def from_config(cls, config: ArrConfig, metrics: ClientMetrics) -> Hedger | None:
+        """Build a hedger from an app's ``hedge_*`` settings (None when hedging is off)."""
+        if not config.hedge_requests:
+            return None
+        return cls(percentile=config.hedge_percentile, budget=config.hedge_budget, metrics=metrics)
+
+    @staticmethod
+    def key_for(path: str, params: dict[str, Any] | None) -> Hashable:
+        """Latency key of a GET: its path and requested ``pageSize``."""
+        return (path, (params or {}).get("pageSize"))
+
+    def delay_for(self, key: Hashable) -> float | None:
+        """Seconds after which a GET with latency ``key`` should be hedged, or None to never hedge it."""
+        samples = self._latencies.get(key)
+        if samples is None or len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(self._percentile / 100 * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+    def try_hedge(self) -> bool:
+        """Reserve a hedge if the budget allows one; return whether it may be sent."""
+        metrics = self._metrics
+        if metrics.hedges + 1 > self._budget * metrics.requests:
+            return False
+        metrics.hedges += 1
+        return True
+
+    def observe(self, key: Hashable, seconds: float) -> None:
+        """Record how long a GET with latency ``key`` took to be answered."""
+        samples = self._latencies.setdefault(key, deque(maxlen=LATENCY_WINDOW))
+        samples.append(seconds)
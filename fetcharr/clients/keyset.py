@@ -0,0 +1,116 @@
+"""Keyset windows over id-sorted wanted lists.
+
+Instead of materialising a whole wanted list to slice one batch out of
+it, a search cycle asks for the next *window*: the records that follow
+the last processed id (the keyset cursor), up to the batch size.  The
+client locates the first page of the window by binary search over the
+``sortKey=id`` pages and walks forward only as far as the window needs.
+
+``WindowCollector`` holds the selection rules so the client's page walk
+and ``window_from_records`` (a whole list at once) pick the same records.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class RecordWindow:
+    """The next batch of wanted records after a keyset cursor.
+
+    Attributes:
+        after_id: The keyset cursor the window starts after (None = start).
+        records: Accepted records in id order, covering at most ``size``
+            groups.
+        total_records: ``totalRecords`` of the whole (unfiltered) list.
+        reached_end: True when no accepted record follows the window, so
+            the cursor should wrap to the start after it.
+        positions: 1-based position in the unfiltered list of each
+            record in ``records``, keyed by record id.
+        skipped_pages: Pages of the walk that failed and were left out;
+            records on them were not considered.
+    """
+
+    after_id: int | None = None
+    records: list[Any] = field(default_factory=list)
+    total_records: int = 0
+    reached_end: bool = True
+    positions: dict[int, int] = field(default_factory=dict)
+    skipped_pages: list[int] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        """True when some pages of the window could not be read."""
+        return bool(self.skipped_pages)
+
+
+class WindowCollector:
+    """Accumulates records into a window, one id-ordered record at a time.
+
+    Records with an id at or below ``after_id`` are ignored, as are
+    records ``accept`` rejects.  Accepted records are grouped by ``group``
+    (default: one group per record); the window is complete once a
+    record from group ``size + 1`` is seen, so all records of the first
+    ``size`` groups that sit within the walked id range are included.
+    """
+
+    def __init__(
+        self,
+        after_id: int | None,
+        size: int,
+        accept: Callable[[Any], bool] | None = None,
+        group: Callable[[Any], Hashable] | None = None,
+    ) -> None:
+        self._after_id = after_id
+        self._size = size
+        self._accept = accept
+        self._group = group
+        self._groups: set[Hashable] = set()
+        # A zero-size window never reaches the end (the cursor stays put)
+        self.window = RecordWindow(after_id=after_id, reached_end=size > 0)
+        self.done = size <= 0
+
+    def feed(self, record: Any, position: int, accepted: bool | None = None) -> bool:
+        """Offer the record at 1-based ``position``; return True once complete.
+
+        ``accepted`` is ``accept(record)`` when the caller already computed
+        it (e.g. off the event loop); None evaluates ``accept`` here.
+        """
+        if self.done:
+            return True
+        if self._after_id is not None and record.id <= self._after_id:
+            return False
+        if accepted is None:
+            accepted = self._accept is None or self._accept(record)
+        if not accepted:
+            return False
+        key = self._group(record) if self._group is not None else record.id
+        if key not in self._groups:
+            if len(self._groups) >= self._size:
+                self.window.reached_end = False
+                self.done = True
+                return True
+            self._groups.add(key)
+        self.window.records.append(record)
+        self.window.positions[record.id] = position
+        return False
+
+
+def window_from_records(
+    records: Sequence[Any],
+    after_id: int | None,
+    size: int,
+    *,
+    accept: Callable[[Any], bool] | None = None,
+    group: Callable[[Any], Hashable] | None = None,
+) -> RecordWindow:
+    """Select the window after ``after_id`` from an id-sorted list of records."""
+    collector = WindowCollector(after_id, size, accept, group)
+    for position, record in enumerate(records, start=1):
+        if collector.feed(record, position):
+            break
+    collector.window.total_records = len(records)
+    return collector.window
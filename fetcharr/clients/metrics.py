@@ -0,0 +1,34 @@
+"""Per-client request counters for *arr API clients."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass(slots=True)
+class ClientMetrics:
+    """Running totals for one client since it was created."""
+
+    requests: int = 0  # HTTP attempts sent, retries included
+    retries: int = 0  # Attempts that were a retry of a failed attempt
+    retries_exhausted: int = 0  # Requests that failed after retrying
+    coalesced: int = 0  # Cached GETs that joined an identical request in flight
+    hedges: int = 0  # Duplicate GETs sent because the first was slow
+    hedge_wins: int = 0  # Hedged GETs answered by the duplicate first
+    cache_hits: int = 0  # Cached GETs answered by a 304 or an unchanged body
+    cache_misses: int = 0  # Cached GETs whose response had to be parsed
+    page_records: int = 0  # Records in freshly downloaded wanted-list pages
+    page_bytes: int = 0  # Body bytes of those pages
+
+    @property
+    def bytes_per_record(self) -> float:
+        """Average downloaded page bytes per record (0.0 before any page)."""
+        return self.page_bytes / self.page_records if self.page_records else 0.0
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the counters as a plain dict."""
+        return asdict(self)
+
+    def since(self, before: dict[str, int]) -> dict[str, int]:
+        """Counter increases since ``before`` (an earlier ``snapshot``)."""
+        return {name: value - before[name] for name, value in asdict(self).items()}
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import httpx
 
 from fetcharr.clients.base import ArrClient
+from fetcharr.clients.decode import REQUIRED, TypedProjection
+from fetcharr.clients.keyset import RecordWindow
+from fetcharr.models.arr import MovieRecord
+from fetcharr.models.config import ArrConfig
+
+
+def project_movie(record: dict[str, Any]) -> MovieRecord:
+    """Reduce a raw Radarr movie record to the fields the engine reads."""
+    return MovieRecord(
+        id=record["id"],
+        title=record.get("title", "unknown"),
+        monitored=bool(record.get("monitored", False)),
+    )
+
+
+# Typed fast path for project_movie (see fetcharr.clients.decode)
+MOVIE_PROJECTION = TypedProjection(
+    MovieRecord,
+    project_movie,
+    (("id", int, REQUIRED), ("title", str, "unknown"), ("monitored", bool, False)),
+)
 
 
 class RadarrClient(ArrClient):
@@ -16,17 +38,48 @@ class RadarrClient(ArrClient):
     endpoint paths for wanted/missing and wanted/cutoff movie lists.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0) -> None:
-        super().__init__(base_url, api_key, timeout)
+    MONITORED_FILTER_MIN_MAJOR = 4
+    LAST_SEARCH_SORT_KEY = "movies.lastSearchTime"
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float | None = None,
+        *,
+        config: ArrConfig | None = None,
+    ) -> None:
+        super().__init__(base_url, api_key, timeout, config=config)
         self._app_name = "Radarr"
 
-    async def get_wanted_missing(self) -> list[dict[str, Any]]:
-        """Fetch all wanted/missing movies from Radarr."""
-        return await self.get_paginated("/api/v3/wanted/missing")
+    async def get_wanted_window(
+        self,
+        queue: str,
+        after_id: int | None,
+        size: int,
+        *,
+        accept: Callable[[MovieRecord], bool] | None = None,
+        position_hint: int = 0,
+        order: str = "id",
+    ) -> RecordWindow:
+        """Fetch the next ``size`` accepted movies after ``after_id`` from a wanted queue.
 
-    async def get_wanted_cutoff(self) -> list[dict[str, Any]]:
-        """Fetch all movies that don't meet their quality cutoff."""
-        return await self.get_paginated("/api/v3/wanted/cutoff")
+        Args:
+            queue: ``"missing"`` or ``"cutoff"``.
+            order: ``"id"`` for the keyset walk, or ``"last_searched"`` for
+                the least recently searched records (``after_id`` unused).
+        """
+        last_searched = order == "last_searched"
+        return await self.get_window(
+            f"/api/v3/wanted/{queue}",
+            None if last_searched else after_id,
+            size,
+            project=MOVIE_PROJECTION,
+            accept=accept,
+            position_hint=position_hint,
+            sort_key=self.LAST_SEARCH_SORT_KEY if last_searched else "id",
+            extra_params=await self.wanted_filter_params(),
+        )
 
     async def search_movies(self, movie_ids: list[int]) -> httpx.Response:
         """Trigger a MoviesSearch command for the given movie IDs."""
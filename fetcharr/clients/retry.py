@@ -0,0 +1,97 @@
+"""Retry policy for *arr API requests.
+
+Decides whether a failed request is worth retrying and how long to wait
+first: transport errors and transient HTTP statuses are retried with
+exponential backoff and jitter, a ``Retry-After`` header overrides the
+computed delay, and every request has a total time budget.  Client
+errors such as 400/401/404 are never retried.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from fetcharr.models.config import ArrConfig
+
+# Statuses that may succeed if the same request is sent again.
+RETRYABLE_STATUSES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How many times, and how patiently, a request is retried.
+
+    ``max_attempts`` counts the first try, so the default of 2 matches
+    the historical "retry once" behaviour.  ``budget`` caps the total
+    wall time of one request, attempts and waits included: a retry whose
+    wait would end past the budget is not made.
+    """
+
+    max_attempts: int = 2
+    base_delay: float = 2.0
+    max_delay: float = 30.0
+    budget: float = 60.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+
+    @classmethod
+    def from_config(cls, config: ArrConfig) -> RetryPolicy:
+        """Build a policy from an app's ``retry_*`` settings."""
+        return cls(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            budget=config.retry_budget,
+        )
+
+    def is_retryable(self, exc: httpx.HTTPError) -> bool:
+        """Transport failures and transient statuses are retryable."""
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in self.retry_statuses
+        return isinstance(exc, httpx.TransportError)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), with equal jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def next_delay(self, attempt: int, exc: httpx.HTTPError, elapsed: float) -> float | None:
+        """Return the wait before the next attempt, or None to give up.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure).
+            exc: The error from the latest attempt.
+            elapsed: Seconds since the first attempt of this request started.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = self.backoff(attempt)
+        if isinstance(exc, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+        if elapsed + delay > self.budget:
+            return None
+        return delay
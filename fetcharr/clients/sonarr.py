@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable, Hashable, Iterable
 from typing import Any
 
 import httpx
-import pydantic
 from loguru import logger
 
 from fetcharr.clients.base import ArrClient
+from fetcharr.clients.decode import REQUIRED, TypedProjection
+from fetcharr.clients.keyset import RecordWindow
+from fetcharr.models.arr import EpisodeRecord, SeriesInfo, SeriesSummary
+from fetcharr.models.config import ArrConfig
+
+# Minimum age of the series cache before an unknown seriesId triggers a reload.
+SERIES_UNKNOWN_RELOAD_SECONDS = 60
 
 
 class SonarrClient(ArrClient):
@@ -16,59 +24,111 @@ class SonarrClient(ArrClient):
 
     Thin wrapper around ArrClient that defines Sonarr-specific
     endpoint paths for wanted/missing and wanted/cutoff episode lists.
-    Always includes ``includeSeries=true`` for human-readable log
-    messages and season-level deduplication in the search engine.
+    Wanted lists are fetched without ``includeSeries`` -- series titles
+    and per-season episode counts come from a series index cached from
+    ``/api/v3/series`` instead of being repeated per episode.
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 30.0) -> None:
-        super().__init__(base_url, api_key, timeout)
+    MONITORED_FILTER_MIN_MAJOR = 4
+    LAST_SEARCH_SORT_KEY = "episodes.lastSearchTime"
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float | None = None,
+        *,
+        config: ArrConfig | None = None,
+    ) -> None:
+        super().__init__(base_url, api_key, timeout, config=config)
         self._app_name = "Sonarr"
-
-    async def detect_api_version(self) -> str:
-        """Detect whether the Sonarr instance is running v3 or v4.
-
-        Calls ``/api/v3/system/status`` and inspects the ``version``
-        field.  This is purely informational -- no behaviour changes
-        based on the result.
-
-        Returns:
-            ``"v4"`` if the major version is 4+, otherwise ``"v3"``.
+        # Series metadata cache: seriesId -> title and season episode counts
+        self._series: dict[int, SeriesInfo] = {}
+        self._series_loaded_at: float | None = None
+
+    async def refresh_series(self) -> None:
+        """Reload the series metadata cache from ``/api/v3/series``."""
+        def parse(response: httpx.Response) -> dict[int, SeriesInfo]:
+            series = [SeriesSummary.model_validate(item) for item in response.json()]
+            return {
+                item.id: SeriesInfo(
+                    title=item.title,
+                    season_episode_counts={
+                        season.seasonNumber: season.statistics.episodeCount
+                        for season in item.seasons
+                        if season.statistics is not None
+                    },
+                )
+                for item in series
+            }
+
+        self._series = await self.get_cached("/api/v3/series", None, parse)
+        self._series_loaded_at = time.monotonic()
+        logger.debug("Sonarr: Cached metadata for {count} series", count=len(self._series))
+
+    async def get_series(self, series_ids: Iterable[int]) -> dict[int, SeriesInfo]:
+        """Return the cached seriesId -> ``SeriesInfo`` mapping, refreshing when needed.
+
+        The cache is reloaded when it is older than ``series_cache_ttl``
+        minutes, or when one of ``series_ids`` is unknown (a series added
+        since the last load).  Unknown-id reloads are rate-limited to one
+        per minute so a deleted series cannot force a reload every cycle.
         """
-        try:
-            response = await self._client.get("/api/v3/system/status")
-            response.raise_for_status()
-            data = response.json()
-            version = data["version"]
-            if version.startswith("4"):
-                return "v4"
-            return "v3"
-        except (httpx.HTTPError, pydantic.ValidationError, KeyError, Exception) as exc:
-            logger.warning(
-                "Sonarr: API version detection failed -- assuming v3: {exc}",
-                exc=exc,
-            )
-            return "v3"
-
-    async def get_wanted_missing(self) -> list[dict[str, Any]]:
-        """Fetch all wanted/missing episodes from Sonarr.
-
-        Includes series data (``includeSeries=true``) for human-readable
-        log messages and season-level deduplication.
-        """
-        return await self.get_paginated(
-            "/api/v3/wanted/missing",
-            extra_params={"includeSeries": "true"},
+        now = time.monotonic()
+        age = None if self._series_loaded_at is None else now - self._series_loaded_at
+        stale = age is None or age >= self._config.series_cache_ttl * 60
+        unknown = any(sid not in self._series for sid in series_ids)
+        if stale or (unknown and age >= SERIES_UNKNOWN_RELOAD_SECONDS):
+            await self.refresh_series()
+        return self._series
+
+    @staticmethod
+    def _project_episode(record: dict[str, Any]) -> EpisodeRecord:
+        """Reduce a raw episode record to the fields the engine reads."""
+        return EpisodeRecord(
+            id=record["id"],
+            series_id=record.get("seriesId"),
+            season_number=record.get("seasonNumber"),
+            monitored=bool(record.get("monitored", False)),
+            air_date_utc=record.get("airDateUtc"),
         )
 
-    async def get_wanted_cutoff(self) -> list[dict[str, Any]]:
-        """Fetch all episodes that don't meet their quality cutoff.
-
-        Includes series data (``includeSeries=true``) for human-readable
-        log messages and season-level deduplication.
+    async def get_wanted_window(
+        self,
+        queue: str,
+        after_id: int | None,
+        size: int,
+        *,
+        accept: Callable[[EpisodeRecord], bool] | None = None,
+        group: Callable[[EpisodeRecord], Hashable] | None = None,
+        position_hint: int = 0,
+        order: str = "id",
+    ) -> RecordWindow:
+        """Fetch the next ``size`` accepted episode groups after ``after_id``.
+
+        Args:
+            queue: ``"missing"`` or ``"cutoff"``.
+            order: ``"id"`` for the keyset walk, or ``"last_searched"`` for
+                the least recently searched records (``after_id`` unused).
         """
-        return await self.get_paginated(
-            "/api/v3/wanted/cutoff",
-            extra_params={"includeSeries": "true"},
+        last_searched = order == "last_searched"
+        return await self.get_window(
+            f"/api/v3/wanted/{queue}",
+            None if last_searched else after_id,
+            size,
+            project=EPISODE_PROJECTION,
+            accept=accept,
+            group=group,
+            position_hint=position_hint,
+            sort_key=self.LAST_SEARCH_SORT_KEY if last_searched else "id",
+            extra_params=await self.wanted_filter_params(),
+        )
+
+    async def search_episodes(self, episode_ids: list[int]) -> httpx.Response:
+        """Trigger an EpisodeSearch command for specific episodes."""
+        return await self.post(
+            "/api/v3/command",
+            json_data={"name": "EpisodeSearch", "episodeIds": episode_ids},
         )
 
     async def search_season(self, series_id: int, season_number: int) -> httpx.Response:
@@ -81,3 +141,24 @@ class SonarrClient(ArrClient):
                 "seasonNumber": season_number,
             },
         )
+
+    async def search_series(self, series_id: int) -> httpx.Response:
+        """Trigger a SeriesSearch command for every monitored season of a series."""
+        return await self.post(
+            "/api/v3/command",
+            json_data={"name": "SeriesSearch", "seriesId": series_id},
+        )
+
+
+# Typed fast path for SonarrClient._project_episode (see fetcharr.clients.decode)
+EPISODE_PROJECTION = TypedProjection(
+    EpisodeRecord,
+    SonarrClient._project_episode,
+    (
+        ("id", int, REQUIRED),
+        ("seriesId", int | None, None),
+        ("seasonNumber", int | None, None),
+        ("monitored", bool, False),
+        ("airDateUtc", str | None, None),
+    ),
+)
@@ -0,0 +1,44 @@
+"""HTTP transport setup for *arr API clients.
+
+Builds the ``httpx.AsyncClient`` behind each ``ArrClient`` from the app's
+transport settings: connection pool size and keep-alive, separate
+connect and read timeouts, opt-in HTTP/2 (``pip install fetcharr[http2]``)
+and an optional Unix domain socket for an *arr on the same host.
+"""
+
+from __future__ import annotations
+
+import httpx
+from loguru import logger
+
+from fetcharr.models.config import ArrConfig
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+
+def build_timeout(config: ArrConfig, timeout: float | None = None) -> httpx.Timeout:
+    """Per-phase timeouts from ``config``; ``timeout`` overrides all of them."""
+    if timeout is not None:
+        return httpx.Timeout(timeout)
+    return httpx.Timeout(config.read_timeout, connect=config.connect_timeout)
+
+
+def build_transport(config: ArrConfig) -> httpx.AsyncHTTPTransport:
+    """Connection pool (TCP or Unix socket) for one app.
+
+    HTTP/2 is only negotiated when the ``h2`` package is installed;
+    otherwise a warning is logged and HTTP/1.1 is used.
+    """
+    http2 = config.http2
+    if http2 and h2 is None:
+        logger.warning("http2 = true needs the h2 package (pip install fetcharr[http2]) -- using HTTP/1.1")
+        http2 = False
+    limits = httpx.Limits(
+        max_connections=config.pool_max_connections,
+        max_keepalive_connections=config.pool_max_keepalive,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    return httpx.AsyncHTTPTransport(limits=limits, http2=http2, uds=config.socket_path or None)
@@ -0,0 +1,74 @@
+"""Runtime page-size tuning for paginated *arr endpoints.
+
+Each endpoint starts at the historical page size of 50 and is nudged up
+or down after every full fetch based on how long pages took and how
+large they were.  Tuned sizes live on the client, which is long-lived,
+so they carry over from one search cycle to the next.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+DEFAULT_PAGE_SIZE = 50
+
+# A page should take about this long to come back.  Faster pages grow,
+# slower pages shrink.
+TARGET_PAGE_SECONDS = 1.0
+
+# Upper bound on response body size per page, regardless of latency.
+MAX_PAGE_BYTES = 4 * 1024 * 1024
+
+# Largest step taken in either direction after one fetch.
+MAX_STEP_FACTOR = 2.0
+
+
+@dataclass(slots=True)
+class PageSample:
+    """Accumulated measurements for one endpoint during one fetch."""
+
+    pages: int = 0
+    records: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+
+
+@dataclass
+class PageSizeTuner:
+    """Tracks a tuned page size per endpoint path within ``[minimum, maximum]``."""
+
+    minimum: int
+    maximum: int
+    _sizes: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def size_for(self, path: str) -> int:
+        """Return the current page size for *path*."""
+        default = max(self.minimum, min(self.maximum, DEFAULT_PAGE_SIZE))
+        return self._sizes.get(path, default)
+
+    def start(self) -> PageSample:
+        """Return an empty sample to accumulate one fetch's page timings."""
+        return PageSample()
+
+    def observe(self, path: str, page_size: int, sample: PageSample) -> int:
+        """Update the page size for *path* from one fetch and return it.
+
+        Only full-size pages say anything useful about throughput, so a
+        fetch that fit on one partial page leaves the size unchanged.
+        """
+        if sample.pages == 0 or sample.records < page_size:
+            return self.size_for(path)
+
+        avg_seconds = sample.seconds / sample.pages
+        bytes_per_record = sample.bytes / sample.records if sample.records else 0
+
+        # Zero elapsed time (e.g. a local mock) counts as "very fast"
+        avg_seconds = max(avg_seconds, 1e-6)
+        proposed = page_size * TARGET_PAGE_SECONDS / avg_seconds
+        proposed = max(page_size / MAX_STEP_FACTOR, min(page_size * MAX_STEP_FACTOR, proposed))
+        if bytes_per_record > 0:
+            proposed = min(proposed, MAX_PAGE_BYTES / bytes_per_record)
+
+        new_size = max(self.minimum, min(self.maximum, int(proposed)))
+        self._sizes[path] = new_size
+        return new_size
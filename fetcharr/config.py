@@ -27,6 +27,39 @@ enabled = false
 # search_interval = 30       # Minutes between search cycles
 # search_missing_count = 5   # Missing items to search per cycle
 # search_cutoff_count = 5    # Cutoff items to search per cycle
+# search_order = "id"       # "id" = round robin by id; "last_searched" = least recently searched first
+# movies_per_command = 1     # Movies per MoviesSearch command (0 = whole batch in one)
+# command_queue_limit = 10   # Queued search commands before dispatch pauses (0 = off)
+# command_queue_max_wait = 120  # Seconds per cycle to wait for the command queue
+# command_queue_poll_interval = 10  # Seconds between command queue checks
+# search_concurrency = 4     # Search commands sent at the same time
+# search_rate_limit = 2.0    # Search commands started per second (0 = unlimited)
+# search_rate_burst = 5      # Commands sent back-to-back before the rate limit applies
+# page_concurrency = 4       # Concurrent page requests when fetching wanted lists
+# page_size_min = 10         # Smallest page size the auto-tuner may pick
+# page_size_max = 1000       # Largest page size the auto-tuner may pick
+# response_cache_size = 256  # Cached wanted-list pages kept in memory (0 = off)
+# fast_decode = true         # Use msgspec/orjson for wanted-list pages when installed
+# decode_workers = 2         # Threads for decoding large pages off the event loop (0 = inline)
+# retry_max_attempts = 2     # Attempts per request (429/5xx/network errors only)
+# retry_base_delay = 2.0     # Seconds before the first retry; doubles each retry
+# retry_max_delay = 30.0     # Cap on one backoff delay (Retry-After takes precedence)
+# retry_budget = 60.0        # Max seconds one request may spend retrying
+# breaker_failure_threshold = 5  # Network failures in a row before failing fast (0 = off)
+# breaker_reset_timeout = 30.0  # Seconds before a probe request; doubles while still down
+# health_check_interval = 30 # Seconds between liveness probes; cycles skip while down (0 = off)
+# health_check_timeout = 5.0 # Seconds a liveness probe may take
+# count_probe_interval = 60  # Seconds between backlog count refreshes for the dashboard (0 = off)
+# hedge_requests = false     # Resend slow GETs (past hedge_percentile latency); first answer wins
+# hedge_percentile = 95.0    # Latency percentile of recent GETs to the same endpoint that triggers a hedge
+# hedge_budget = 0.1         # Max hedged GETs as a share of all requests sent
+# connect_timeout = 30.0     # Seconds to establish a connection
+# read_timeout = 30.0        # Seconds to wait for response data
+# pool_max_connections = 20  # Open connections to the app
+# pool_max_keepalive = 10    # Idle connections kept open for reuse
+# keepalive_expiry = 30.0    # Seconds an idle connection stays open
+# http2 = false              # Negotiate HTTP/2 (needs the http2 extra)
+# socket_path = ""           # Unix socket of an app on the same host (url still sets the path)
 
 [sonarr]
 # Sonarr connection settings
@@ -36,6 +69,41 @@ enabled = false
 # search_interval = 30       # Minutes between search cycles
 # search_missing_count = 5   # Missing items to search per cycle
 # search_cutoff_count = 5    # Cutoff items to search per cycle
+# search_order = "id"       # "id" = round robin by id; "last_searched" = least recently searched first
+# season_search_threshold = 0.5  # Missing share of a season that uses SeasonSearch (0 = always, above 1 = never)
+# series_search_threshold = 0.75 # Missing share of a series that uses SeriesSearch (above 1 = never)
+# command_queue_limit = 10   # Queued search commands before dispatch pauses (0 = off)
+# command_queue_max_wait = 120  # Seconds per cycle to wait for the command queue
+# command_queue_poll_interval = 10  # Seconds between command queue checks
+# search_concurrency = 4     # Search commands sent at the same time
+# search_rate_limit = 2.0    # Search commands started per second (0 = unlimited)
+# search_rate_burst = 5      # Commands sent back-to-back before the rate limit applies
+# page_concurrency = 4       # Concurrent page requests when fetching wanted lists
+# page_size_min = 10         # Smallest page size the auto-tuner may pick
+# page_size_max = 1000       # Largest page size the auto-tuner may pick
+# response_cache_size = 256  # Cached wanted-list pages kept in memory (0 = off)
+# fast_decode = true         # Use msgspec/orjson for wanted-list pages when installed
+# decode_workers = 2         # Threads for decoding large pages off the event loop (0 = inline)
+# retry_max_attempts = 2     # Attempts per request (429/5xx/network errors only)
+# retry_base_delay = 2.0     # Seconds before the first retry; doubles each retry
+# retry_max_delay = 30.0     # Cap on one backoff delay (Retry-After takes precedence)
+# retry_budget = 60.0        # Max seconds one request may spend retrying
+# breaker_failure_threshold = 5  # Network failures in a row before failing fast (0 = off)
+# breaker_reset_timeout = 30.0  # Seconds before a probe request; doubles while still down
+# health_check_interval = 30 # Seconds between liveness probes; cycles skip while down (0 = off)
+# health_check_timeout = 5.0 # Seconds a liveness probe may take
+# count_probe_interval = 60  # Seconds between backlog count refreshes for the dashboard (0 = off)
+# hedge_requests = false     # Resend slow GETs (past hedge_percentile latency); first answer wins
+# hedge_percentile = 95.0    # Latency percentile of recent GETs to the same endpoint that triggers a hedge
+# hedge_budget = 0.1         # Max hedged GETs as a share of all requests sent
+# connect_timeout = 30.0     # Seconds to establish a connection
+# read_timeout = 30.0        # Seconds to wait for response data
+# pool_max_connections = 20  # Open connections to the app
+# pool_max_keepalive = 10    # Idle connections kept open for reuse
+# keepalive_expiry = 30.0    # Seconds an idle connection stays open
+# http2 = false              # Negotiate HTTP/2 (needs the http2 extra)
+# socket_path = ""           # Unix socket of an app on the same host (url still sets the path)
+# series_cache_ttl = 60      # Minutes between series title cache reloads
 """
 
 
@@ -84,12 +84,46 @@ async def insert_search_entry(
         outcome: Search outcome (e.g. "searched", "failed").
         detail: Additional detail text (e.g. error message).
     """
-    timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    await insert_search_entries(
+        db_path,
+        [
+            {
+                "app": app,
+                "queue_type": queue_type,
+                "name": item_name,
+                "outcome": outcome,
+                "detail": detail,
+            }
+        ],
+    )
+
+
+async def insert_search_entries(db_path: Path, entries: list[dict]) -> None:
+    """Insert several search log entries in one transaction, then prune to 500.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        entries: Dicts with app, queue_type, name, outcome and detail keys,
+            plus an optional ISO ``timestamp`` (defaults to now).
+    """
+    if not entries:
+        return
+    now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
     async with aiosqlite.connect(db_path) as db:
-        await db.execute(
+        await db.executemany(
             "INSERT INTO search_history (timestamp, app, queue_type, item_name, outcome, detail) "
             "VALUES (?, ?, ?, ?, ?, ?)",
-            (timestamp, app, queue_type, item_name, outcome, detail),
+            [
+                (
+                    entry.get("timestamp") or now,
+                    entry["app"],
+                    entry["queue_type"],
+                    entry["name"],
+                    entry.get("outcome", "searched"),
+                    entry.get("detail", ""),
+                )
+                for entry in entries
+            ],
         )
         await db.execute(
             """
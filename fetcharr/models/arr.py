@@ -1,7 +1,14 @@
-"""Response models for *arr API data."""
+"""Response models for *arr API data.
+
+Pydantic models validate API envelopes; the slotted record dataclasses
+are the compact per-item form that clients project raw records into as
+each page arrives, so full API payloads are never held for a whole cycle.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
@@ -31,3 +38,93 @@ class SystemStatus(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     version: str
+
+
+class CommandResource(BaseModel):
+    """One entry from the /api/v3/command list.
+
+    ``body`` holds the command's arguments (``movieIds``, ``seriesId``,
+    ``seasonNumber``, ``episodeIds``, ...) as sent when it was queued.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    name: str
+    status: str
+    body: dict[str, Any] = {}
+
+
+class SeasonStatistics(BaseModel):
+    """Episode counts Sonarr reports for one season.
+
+    ``episodeCount`` counts monitored episodes that have aired or have a
+    file -- the episodes a search could actually find.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    episodeCount: int = 0
+
+
+class SeasonSummary(BaseModel):
+    """One season of a Sonarr series, with its statistics when present."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    seasonNumber: int
+    statistics: SeasonStatistics | None = None
+
+
+class SeriesSummary(BaseModel):
+    """One entry from Sonarr's /api/v3/series list.
+
+    Only the fields the series metadata cache needs are kept; images,
+    overview and the rest are ignored.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: int
+    title: str
+    seasons: list[SeasonSummary] = []
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesInfo:
+    """Cached Sonarr series metadata used for display names and search planning.
+
+    ``season_episode_counts`` maps season number to Sonarr's
+    ``episodeCount`` statistic; it is empty when statistics are unavailable.
+    """
+
+    title: str
+    season_episode_counts: Mapping[int, int] = field(default_factory=dict)
+
+    @property
+    def episode_count(self) -> int:
+        """Searchable episodes across all seasons of the series."""
+        return sum(self.season_episode_counts.values())
+
+
+@dataclass(frozen=True, slots=True)
+class MovieRecord:
+    """The fields of a Radarr wanted movie that the search engine reads."""
+
+    id: int
+    title: str
+    monitored: bool
+
+
+@dataclass(frozen=True, slots=True)
+class EpisodeRecord:
+    """The fields of a Sonarr wanted episode that the search engine reads.
+
+    Series titles are not stored per episode; they are resolved from the
+    Sonarr client's series metadata cache.
+    """
+
+    id: int
+    series_id: int | None
+    season_number: int | None
+    monitored: bool
+    air_date_utc: str | None
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
-from pydantic import BaseModel, SecretStr, model_validator
+from pydantic import BaseModel, Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, TomlConfigSettingsSource
 
 CONFIG_PATH = Path("/config/fetcharr.toml")
@@ -22,6 +23,46 @@ class ArrConfig(BaseModel):
     search_missing_count: int = 5  # Missing items to search per cycle
     search_cutoff_count: int = 5  # Cutoff items to search per cycle
 
+    # Search dispatch tuning (TOML only -- not exposed in the web UI)
+    search_order: Literal["id", "last_searched"] = "id"  # Round robin by id, or least recently searched first
+    movies_per_command: int = Field(default=1, ge=0)  # Radarr: movies per MoviesSearch command (0 = whole batch)
+    season_search_threshold: float = Field(default=0.5, ge=0.0)  # Sonarr: missing share of a season for SeasonSearch
+    series_search_threshold: float = Field(default=0.75, ge=0.0)  # Sonarr: missing share of a series for SeriesSearch
+    command_queue_limit: int = Field(default=10, ge=0)  # Outstanding search commands before dispatch pauses (0 = off)
+    command_queue_max_wait: float = Field(default=120.0, ge=0.0)  # Seconds per cycle to wait for the queue to drain
+    command_queue_poll_interval: float = Field(default=10.0, gt=0.0)  # Seconds between command queue checks
+    search_concurrency: int = Field(default=4, ge=1)  # Search commands sent at the same time
+    search_rate_limit: float = Field(default=2.0, ge=0.0)  # Search commands started per second (0 = unlimited)
+    search_rate_burst: int = Field(default=5, ge=1)  # Commands that may start back-to-back before the rate applies
+
+    # HTTP tuning (TOML only -- not exposed in the web UI)
+    connect_timeout: float = Field(default=30.0, gt=0)  # Seconds to establish a connection
+    read_timeout: float = Field(default=30.0, gt=0)  # Seconds to wait for response data
+    pool_max_connections: int = Field(default=20, ge=1)  # Open connections per app
+    pool_max_keepalive: int = Field(default=10, ge=0)  # Idle connections kept warm for reuse
+    keepalive_expiry: float = Field(default=30.0, ge=0)  # Seconds an idle connection stays open
+    http2: bool = False  # Negotiate HTTP/2 when the app offers it (needs the http2 extra)
+    socket_path: str = ""  # Unix socket of a co-located app; url still sets host and path ("" = TCP)
+    page_concurrency: int = Field(default=4, ge=1)  # Concurrent page requests per wanted-list fetch
+    page_size_min: int = Field(default=10, ge=1)  # Lower bound for tuned page size
+    page_size_max: int = Field(default=1000, ge=1)  # Upper bound for tuned page size
+    response_cache_size: int = Field(default=256, ge=0)  # Cached GET responses (pages) kept per app; 0 = off
+    fast_decode: bool = True  # Decode pages with msgspec/orjson when installed (False = always pydantic)
+    decode_workers: int = Field(default=2, ge=0)  # Threads that decode/filter large pages off the event loop
+    series_cache_ttl: int = Field(default=60, ge=1)  # Minutes before the Sonarr series index is refetched
+    retry_max_attempts: int = Field(default=2, ge=1)  # Attempts per request, first try included
+    retry_base_delay: float = Field(default=2.0, ge=0)  # Seconds before the first retry (doubles each retry)
+    retry_max_delay: float = Field(default=30.0, ge=0)  # Cap on a single backoff delay
+    retry_budget: float = Field(default=60.0, ge=0)  # Total seconds one request may spend retrying
+    breaker_failure_threshold: int = Field(default=5, ge=0)  # Consecutive network failures that open the circuit
+    breaker_reset_timeout: float = Field(default=30.0, gt=0)  # Seconds before the first half-open probe
+    health_check_interval: int = Field(default=30, ge=0)  # Seconds between liveness probes (0 = off)
+    health_check_timeout: float = Field(default=5.0, gt=0)  # Seconds a liveness probe may take
+    count_probe_interval: int = Field(default=60, ge=0)  # Seconds between backlog count probes (0 = off)
+    hedge_requests: bool = False  # Resend GETs slower than hedge_percentile of recent ones; first answer wins
+    hedge_percentile: float = Field(default=95.0, gt=0, le=100)  # Per-endpoint latency percentile that triggers a hedge
+    hedge_budget: float = Field(default=0.1, ge=0, le=1)  # Max hedged GETs as a share of all requests sent
+
     @model_validator(mode="after")
     def at_least_one_search_count(self) -> ArrConfig:
         """Enforce that at least one search count is >= 1 when app is enabled."""
@@ -30,6 +71,14 @@ class ArrConfig(BaseModel):
             raise ValueError(msg)
         return self
 
+    @model_validator(mode="after")
+    def page_size_bounds_ordered(self) -> ArrConfig:
+        """Enforce ``page_size_min <= page_size_max``."""
+        if self.page_size_min > self.page_size_max:
+            msg = "page_size_min must not exceed page_size_max"
+            raise ValueError(msg)
+        return self
+
 
 class GeneralConfig(BaseModel):
     """Global application settings."""
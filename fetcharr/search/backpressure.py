@@ -0,0 +1,153 @@
+"""Backpressure from the *arr command queue.
+
+Before a cycle dispatches searches it reads the app's queued and started
+commands from ``/api/v3/command``.  Dispatch then pauses while the number
+of outstanding search commands is at ``command_queue_limit``, polling
+until the queue drains or the cycle's ``command_queue_max_wait`` is spent,
+and searches identical to one already outstanding are skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+import pydantic
+from loguru import logger
+
+from fetcharr.clients.base import ArrClient
+from fetcharr.models.config import ArrConfig
+
+# Commands that send indexer searches (the only ones counted or matched).
+SEARCH_COMMANDS = frozenset({"MoviesSearch", "EpisodeSearch", "SeasonSearch", "SeriesSearch"})
+
+# Command statuses that mean the work has not finished yet.
+OUTSTANDING_STATUSES = frozenset({"queued", "started"})
+
+CommandTarget = tuple[Any, ...]
+
+
+def command_targets(name: str, body: Mapping[str, Any]) -> set[CommandTarget]:
+    """Return hashable keys for what a search command searches.
+
+    Commands with the same keys are identical searches; multi-item
+    commands (``movieIds``, ``episodeIds``) yield one key per item.
+    """
+    if name == "MoviesSearch":
+        return {("movie", movie_id) for movie_id in body.get("movieIds") or []}
+    if name == "EpisodeSearch":
+        return {("episode", episode_id) for episode_id in body.get("episodeIds") or []}
+    if name == "SeasonSearch":
+        return {("season", body.get("seriesId"), body.get("seasonNumber"))}
+    if name == "SeriesSearch":
+        return {("series", body.get("seriesId"))}
+    return set()
+
+
+class CommandQueueGate:
+    """Throttles search dispatch against one app's command queue.
+
+    A ``limit`` of 0 disables the gate: the queue is never read and every
+    search is admitted immediately.
+    """
+
+    def __init__(
+        self,
+        client: ArrClient,
+        limit: int,
+        max_wait: float,
+        poll_interval: float,
+    ) -> None:
+        self._client = client
+        self._limit = limit
+        self._max_wait = max_wait
+        self._poll_interval = poll_interval
+        self._outstanding = 0
+        self._queued: set[CommandTarget] = set()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    @classmethod
+    def from_config(cls, client: ArrClient, config: ArrConfig) -> CommandQueueGate:
+        """Build a gate from an app's ``command_queue_*`` settings."""
+        return cls(
+            client,
+            limit=config.command_queue_limit,
+            max_wait=config.command_queue_max_wait,
+            poll_interval=config.command_queue_poll_interval,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether dispatch is gated on the command queue at all."""
+        return self._limit > 0
+
+    async def refresh(self) -> None:
+        """Re-read outstanding search commands from the app."""
+        if not self.enabled:
+            return
+        commands = await self._client.get_commands()
+        outstanding = [
+            command
+            for command in commands
+            if command.name in SEARCH_COMMANDS and command.status in OUTSTANDING_STATUSES
+        ]
+        self._outstanding = len(outstanding)
+        self._queued = set()
+        for command in outstanding:
+            self._queued |= command_targets(command.name, command.body)
+
+    async def start(self) -> None:
+        """Read the queue before a cycle dispatches.
+
+        A failed read turns the gate off for the cycle (searches are
+        dispatched without backpressure) instead of aborting it.
+        """
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, pydantic.ValidationError) as exc:
+            logger.warning("Command queue check failed -- dispatching anyway: {exc}", exc=exc)
+            self._limit = 0
+
+    def is_queued(self, name: str, body: Mapping[str, Any]) -> bool:
+        """Whether an identical search is already queued or running."""
+        targets = command_targets(name, body)
+        return bool(targets) and targets <= self._queued
+
+    async def acquire(self) -> bool:
+        """Wait until the queue has room for another search command.
+
+        A successful acquire reserves the room, so concurrent dispatchers
+        cannot overshoot ``limit``; waits are serialised so ``waited``
+        is wall time.
+
+        Returns:
+            True when the search may be sent, False when the cycle's wait
+            budget ran out with the queue still full.
+        """
+        if not self.enabled:
+            return True
+        async with self._lock:
+            while self.enabled and self._outstanding >= self._limit:
+                remaining = self._max_wait - self.waited
+                if remaining <= 0:
+                    return False
+                started = time.monotonic()
+                await asyncio.sleep(min(self._poll_interval, remaining))
+                try:
+                    await self.refresh()
+                except (httpx.HTTPError, pydantic.ValidationError) as exc:
+                    # Can't see the queue any more -- stop holding searches back
+                    logger.warning("Command queue check failed -- dispatching anyway: {exc}", exc=exc)
+                    self._limit = 0
+                finally:
+                    self.waited += time.monotonic() - started
+            self._outstanding += 1
+            return True
+
+    def sent(self, name: str, body: Mapping[str, Any]) -> None:
+        """Remember a just-sent search so identical ones are skipped."""
+        self._queued |= command_targets(name, body)
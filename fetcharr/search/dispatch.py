@@ -0,0 +1,92 @@
+"""Bounded-concurrency dispatch of search commands.
+
+A ``SearchDispatcher`` runs a cycle's search jobs with at most
+``search_concurrency`` in flight at once, and a ``TokenBucket`` caps how
+many commands per second are started so bursts stay under what the
+app's indexers tolerate.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+from fetcharr.models.config import ArrConfig
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Tokens refill at ``rate`` per second up to ``capacity``; each
+    ``acquire`` takes one, waiting for a refill when the bucket is empty.
+    A ``rate`` of 0 disables limiting.  Waiters are served in FIFO order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._capacity = max(1.0, capacity)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        if self._rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class SearchDispatcher:
+    """Runs search jobs concurrently under a concurrency limit and rate cap."""
+
+    def __init__(self, concurrency: int, rate: float, burst: int) -> None:
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._bucket = TokenBucket(rate, burst)
+
+    @classmethod
+    def from_config(cls, config: ArrConfig) -> SearchDispatcher:
+        """Build a dispatcher from an app's ``search_*`` dispatch settings."""
+        return cls(
+            concurrency=config.search_concurrency,
+            rate=config.search_rate_limit,
+            burst=config.search_rate_burst,
+        )
+
+    async def run(self, jobs: Sequence[Callable[[], Awaitable[T]]]) -> list[T]:
+        """Run ``jobs`` and return their results in job order.
+
+        Jobs are started in order; each waits for a free slot and a rate
+        token before it runs.  Jobs are expected to handle their own
+        errors -- an exception cancels the remaining jobs and propagates.
+        """
+
+        async def run_one(job: Callable[[], Awaitable[T]]) -> T:
+            async with self._semaphore:
+                await self._bucket.acquire()
+                return await job()
+
+        tasks = [asyncio.create_task(run_one(job)) for job in jobs]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
@@ -1,25 +1,34 @@
 """Core search engine: utility functions and search cycle orchestrators.
 
-Pure functions for filtering, batching, and deduplication, plus async
-cycle functions that compose them with API client calls to drive the
-automated search behaviour for Radarr and Sonarr.  Search history is
+Pure functions for batching, keyset cursors and Sonarr search planning,
+plus async cycle functions that compose them with API client calls to
+drive the automated search behaviour for Radarr and Sonarr.  Search history is
 persisted to SQLite via the ``fetcharr.db`` module.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import time
+from collections.abc import Awaitable, Mapping
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import httpx
 import pydantic
 from loguru import logger
 
+from fetcharr.clients.capabilities import ApiCapabilities
+from fetcharr.clients.keyset import RecordWindow
 from fetcharr.clients.radarr import RadarrClient
 from fetcharr.clients.sonarr import SonarrClient
-from fetcharr.db import insert_search_entry
+from fetcharr.db import insert_search_entries
+from fetcharr.models.arr import EpisodeRecord, MovieRecord, SeriesInfo
 from fetcharr.models.config import Settings
+from fetcharr.search.backpressure import CommandQueueGate
+from fetcharr.search.dispatch import SearchDispatcher
 from fetcharr.state import FetcharrState
 
 
@@ -50,108 +59,476 @@ def cap_batch_sizes(missing_count: int, cutoff_count: int, hard_max: int) -> tup
     return (effective_missing, effective_cutoff)
 
 
-def filter_monitored(items: list[dict]) -> list[dict]:
-    """Filter out items where ``monitored`` is not True.
+def chunk_items(items: list, size: int) -> list[list]:
+    """Split items into consecutive chunks of at most ``size`` items.
 
-    Works for both Radarr movies and Sonarr episodes.
+    A ``size`` of 0 or less returns all items as a single chunk.
 
     Args:
-        items: List of item dicts from the *arr API.
+        items: Items to split (order is preserved).
+        size: Maximum chunk length (0 = no limit).
 
     Returns:
-        Only items with ``monitored`` set to True.
+        List of non-empty chunks; empty when ``items`` is empty.
     """
-    return [item for item in items if item.get("monitored", False)]
+    if not items:
+        return []
+    if size <= 0:
+        return [items]
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def plan_sonarr_searches(
+    episodes: list[EpisodeRecord],
+    series: Mapping[int, SeriesInfo] | None = None,
+    season_threshold: float = 0.5,
+    series_threshold: float = 0.75,
+) -> list[dict]:
+    """Choose the cheapest Sonarr search command covering each wanted season.
+
+    Episodes are grouped by (seriesId, seasonNumber) in first-occurrence
+    order and the share of each group that is wanted is compared with the
+    episode counts from the series cache:
+
+    - ``SeriesSearch`` once per series when at least ``series_threshold``
+      of the whole series is wanted across two or more seasons;
+    - ``SeasonSearch`` when at least ``season_threshold`` of the season is
+      wanted, or when the season's episode count is unknown (a threshold
+      above 1 never selects it);
+    - ``EpisodeSearch`` for just the wanted episodes otherwise.
+
+    Args:
+        episodes: Filtered episode records from Sonarr API.
+        series: Mapping of seriesId to cached ``SeriesInfo``.
+        season_threshold: Wanted share of a season that selects ``SeasonSearch``.
+        series_threshold: Wanted share of a series that selects ``SeriesSearch``.
+
+    Returns:
+        List of command dicts with ``command``, ``seriesId``,
+        ``seasonNumber`` (None for ``SeriesSearch``), ``episodeIds`` and
+        ``display_name`` keys.
+    """
+    info = series or {}
+    seasons: dict[tuple[int, int], list[int]] = {}
+    for ep in episodes:
+        if ep.series_id is None or ep.season_number is None:
+            continue
+        seasons.setdefault((ep.series_id, ep.season_number), []).append(ep.id)
+
+    series_episodes: dict[int, list[int]] = {}
+    series_season_count: dict[int, int] = {}
+    for (series_id, _), episode_ids in seasons.items():
+        series_episodes.setdefault(series_id, []).extend(episode_ids)
+        series_season_count[series_id] = series_season_count.get(series_id, 0) + 1
+
+    commands: list[dict] = []
+    planned_series: set[int] = set()
+    for (series_id, season_number), episode_ids in seasons.items():
+        if series_id in planned_series:
+            continue
+        meta = info.get(series_id)
+        title = meta.title if meta is not None else f"Series {series_id}"
+
+        if (
+            meta is not None
+            and series_season_count[series_id] > 1
+            and meta.episode_count > 0
+            and len(series_episodes[series_id]) / meta.episode_count >= series_threshold
+        ):
+            planned_series.add(series_id)
+            commands.append(
+                {
+                    "command": "SeriesSearch",
+                    "seriesId": series_id,
+                    "seasonNumber": None,
+                    "episodeIds": series_episodes[series_id],
+                    "display_name": f"{title} - All seasons",
+                }
+            )
+            continue
+
+        season_total = meta.season_episode_counts.get(season_number, 0) if meta is not None else 0
+        if (season_total <= 0 and season_threshold <= 1) or (
+            season_total > 0 and len(episode_ids) / season_total >= season_threshold
+        ):
+            command = "SeasonSearch"
+            display_name = f"{title} - Season {season_number}"
+        else:
+            command = "EpisodeSearch"
+            noun = "episode" if len(episode_ids) == 1 else "episodes"
+            display_name = f"{title} - Season {season_number} ({len(episode_ids)} {noun})"
+        commands.append(
+            {
+                "command": command,
+                "seriesId": series_id,
+                "seasonNumber": season_number,
+                "episodeIds": episode_ids,
+                "display_name": display_name,
+            }
+        )
+    return commands
+
+
+def is_searchable_episode(ep: EpisodeRecord, now: datetime | None = None) -> bool:
+    """Whether a Sonarr episode is monitored and has already aired.
 
+    Episodes without an air date (TBA) are treated as future, and
+    episodes with unparseable air dates are rejected as well.
 
-def slice_batch(items: list, cursor: int, batch_size: int) -> tuple[list, int]:
-    """Slice a batch starting at cursor position with wrap-around.
+    Args:
+        ep: Episode record from Sonarr API.
+        now: Reference time (defaults to the current UTC time).
+    """
+    if not ep.monitored or ep.air_date_utc is None:
+        return False
+    try:
+        air_date = datetime.fromisoformat(ep.air_date_utc.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return False
+    return air_date <= (now or datetime.now(UTC))
 
-    If cursor is past the end of the list, wraps to 0 silently
-    (no log entry for wrap events, per user decision).
+
+def advance_keyset(
+    window: RecordWindow,
+    unit_ids: list[list[int]],
+    processed: int,
+    position: int,
+) -> tuple[int | None, int]:
+    """Compute the keyset cursor after dispatching part of a window.
+
+    ``unit_ids`` lists the record ids each dispatched unit (a movie or a
+    Sonarr command) covers, in dispatch order; the first ``processed``
+    units were handled.  Deferred units stay after the new cursor; a fully
+    handled window that reached the end of the list wraps to the start.
 
     Args:
-        items: Full list of items to batch from.
-        cursor: Current position in the list.
-        batch_size: Maximum number of items to return.
+        window: The window the units were planned from.
+        unit_ids: Record ids covered by each unit.
+        processed: Number of leading units that were handled.
+        position: The cursor's current display position.
 
     Returns:
-        Tuple of (batch, new_cursor). New cursor wraps to 0
-        when it reaches or passes the end of the list.
+        Tuple of (last_id, position): the new keyset cursor (None = start
+        of the list) and its 1-based position in the unfiltered list, for
+        display.
     """
-    if not items:
-        return [], 0
-    if cursor >= len(items):
-        cursor = 0
-    batch = items[cursor : cursor + batch_size]
-    new_cursor = cursor + len(batch)
-    if new_cursor >= len(items):
-        new_cursor = 0
-    return batch, new_cursor
+    if processed < len(unit_ids):
+        next_id = min(min(ids) for ids in unit_ids[processed:])
+        return next_id - 1, window.positions.get(next_id, 1) - 1
+    if window.reached_end:
+        return None, 0
+    if not window.records:
+        return window.after_id, position
+    last_id = window.records[-1].id
+    return last_id, window.positions[last_id]
+
+
+async def _fetch_window(
+    client: RadarrClient | SonarrClient,
+    queue_type: str,
+    app_state: dict,
+    size: int,
+    order: str,
+    **options: Any,
+) -> RecordWindow:
+    """Fetch a queue's next window, wrapping to the start when nothing follows the cursor.
+
+    With ``order="last_searched"`` the *arr sorts the queue by
+    ``lastSearchTime`` and the window is simply its head; the keyset
+    cursor is not used.
+    """
+    if order == "last_searched":
+        return await client.get_wanted_window(queue_type, None, size, order=order, **options)
+    after_id = app_state.get(f"{queue_type}_last_id")
+    window = await client.get_wanted_window(
+        queue_type,
+        after_id,
+        size,
+        position_hint=app_state.get(f"{queue_type}_cursor", 0),
+        **options,
+    )
+    if not window.records and not window.partial and after_id is not None and size > 0:
+        window = await client.get_wanted_window(queue_type, None, size, **options)
+    return window
+
 
+def _select_order(app: str, requested: str, capabilities: ApiCapabilities, sort_key: str | None) -> str:
+    """Return ``requested``, or ``"id"`` if the instance cannot sort by ``lastSearchTime``."""
+    if requested == "last_searched" and not (sort_key and capabilities.supports_sort(sort_key)):
+        logger.warning(
+            "{app}: search_order \"last_searched\" is not supported by this instance -- using id order",
+            app=app,
+        )
+        return "id"
+    return requested
 
-def deduplicate_to_seasons(episodes: list[dict]) -> list[dict]:
-    """Deduplicate Sonarr episode records to unique (seriesId, seasonNumber) pairs.
 
-    Order is preserved (first occurrence wins). Returns dicts with
-    ``seriesId``, ``seasonNumber``, and ``display_name`` keys.
+class _FetchGroup:
+    """A cycle's concurrent fetches, consumed as each one is needed.
+
+    Every fetch starts at once, but ``results`` returns as soon as the
+    named ones are done, so a queue's batch can be dispatched while the
+    other queue is still being fetched.  The group stays all-or-nothing
+    for whatever has not been dispatched yet: the first failure among any
+    of the fetches cancels the rest and is raised from ``results``.
+    """
+
+    def __init__(self, **awaitables: Awaitable[Any]) -> None:
+        self._tasks = {name: asyncio.ensure_future(aw) for name, aw in awaitables.items()}
+
+    async def results(self, *names: str) -> list[Any]:
+        """Wait for the named fetches and return their results in order."""
+        needed = [self._tasks[name] for name in names]
+        try:
+            while True:
+                for task in self._tasks.values():
+                    if task.done() and not task.cancelled() and task.exception() is not None:
+                        raise task.exception()
+                if all(task.done() for task in needed):
+                    return [task.result() for task in needed]
+                await asyncio.wait(
+                    [task for task in self._tasks.values() if not task.done()],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        except BaseException:
+            self.cancel()
+            raise
+
+    def cancel(self) -> None:
+        """Cancel every fetch still running."""
+        for task in self._tasks.values():
+            task.cancel()
+
+
+def record_backlog(
+    client: RadarrClient | SonarrClient,
+    app_state: dict,
+    listed: tuple[int, int],
+    unmonitored: tuple[int, int],
+) -> None:
+    """Store an app's (missing, cutoff) queue sizes and sample its backlog trend.
+
+    ``listed`` are the sizes of the lists the cursors walk (monitored
+    records only when filtered server-side) and ``unmonitored`` the
+    records that filter kept off them.  ``*_count`` is everything wanted
+    and ``*_listed`` what a cursor position is counted against.  Search
+    cycles and the count probe job both store their counts here.
+    """
+    for queue, size, hidden in zip(("missing", "cutoff"), listed, unmonitored, strict=True):
+        app_state[f"{queue}_listed"] = size
+        app_state[f"{queue}_count"] = size + hidden
+    client.backlog.record(app_state["missing_count"], app_state["cutoff_count"])
+
+
+def _traffic_note(traffic: dict[str, int]) -> str:
+    """Cycle summary suffix with the requests a cycle sent (see ``ClientMetrics.since``)."""
+    return (
+        f" -- {traffic['requests']} requests ({traffic['retries']} retries, "
+        f"{traffic['retries_exhausted']} failed after retrying, {traffic['hedges']} hedged, "
+        f"{traffic['hedge_wins']} won by the hedge, {traffic['coalesced']} coalesced), "
+        f"cache {traffic['cache_hits']} hits / {traffic['cache_misses']} misses"
+    )
 
-    Args:
-        episodes: List of episode dicts from Sonarr API.
+
+def _partial_note(skipped_pages: int) -> str:
+    """Cycle summary suffix flagging windows built from a partial page walk."""
+    if not skipped_pages:
+        return ""
+    return f" -- partial list, {skipped_pages} page(s) skipped after failing twice"
+
+
+def _history_entry(app: str, queue_type: str, name: str, outcome: str, detail: str) -> dict:
+    """Build a ``search_history`` row stamped with the current time."""
+    return {
+        "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        "app": app,
+        "queue_type": queue_type,
+        "name": name,
+        "outcome": outcome,
+        "detail": detail,
+    }
+
+
+async def _record_dispatch(db_path: Path, results: list[list[dict] | None]) -> tuple[int, int, int]:
+    """Write the history rows from dispatched jobs and count outcomes.
+
+    Each job returns one history row per item it covered, or None when it
+    was deferred.  All rows are written in one transaction, in job order.
 
     Returns:
-        List of season-level dicts for search commands.
+        Tuple of (searched_count, skipped_count, processed_count), where
+        ``processed_count`` counts the items before the first deferred job.
     """
-    seen: set[tuple[int, int]] = set()
-    seasons: list[dict] = []
-    for ep in episodes:
-        series_id = ep.get("seriesId")
-        season_number = ep.get("seasonNumber")
-        if series_id is None or season_number is None:
-            continue
-        key = (series_id, season_number)
-        if key not in seen:
-            seen.add(key)
-            title = ep.get("series", {}).get("title", f"Series {series_id}")
-            seasons.append(
-                {
-                    "seriesId": series_id,
-                    "seasonNumber": season_number,
-                    "display_name": f"{title} - Season {season_number}",
-                }
+    entries = [entry for result in results if result is not None for entry in result]
+    await insert_search_entries(db_path, entries)
+    searched_count = sum(1 for entry in entries if entry["outcome"] == "searched")
+    processed_count = 0
+    for result in results:
+        if result is None:
+            break
+        processed_count += len(result)
+    return searched_count, len(entries) - searched_count, processed_count
+
+
+async def _search_radarr_batch(
+    client: RadarrClient,
+    movies: list[MovieRecord],
+    queue_type: str,
+    movies_per_command: int,
+    gate: CommandQueueGate,
+    dispatcher: SearchDispatcher,
+    db_path: Path,
+) -> tuple[int, int, int]:
+    """Send ``MoviesSearch`` commands for a batch and record per-movie history.
+
+    Movies are grouped into commands of ``movies_per_command`` ids (0 = the
+    whole batch in one command), which ``dispatcher`` sends concurrently.
+    Each movie still gets its own ``search_history`` row; when a command
+    fails, every movie in it is recorded as failed and the remaining
+    commands are still sent.  Movies whose search is already queued in
+    Radarr are recorded as skipped, and commands are deferred when
+    ``gate`` runs out of time waiting for room.
+
+    Returns:
+        Tuple of (searched_count, skipped_count, processed_count) in movies;
+        movies after ``processed_count`` were deferred to the next cycle.
+    """
+
+    async def search_chunk(chunk: list[MovieRecord]) -> list[dict] | None:
+        queued = [m for m in chunk if gate.is_queued("MoviesSearch", {"movieIds": [m.id]})]
+        pending = [m for m in chunk if m not in queued]
+        if pending and not await gate.acquire():
+            return None
+        entries: list[dict] = []
+        for movie in queued:
+            logger.info("Radarr: Skipped {title} -- search already queued", title=movie.title)
+            entries.append(
+                _history_entry("Radarr", queue_type, movie.title, "skipped", "search already queued")
+            )
+        if not pending:
+            return entries
+        movie_ids = [movie.id for movie in pending]
+        try:
+            await client.search_movies(movie_ids)
+        except Exception as exc:
+            for movie in pending:
+                logger.warning(
+                    "Radarr: Failed to search {title}: {exc}",
+                    title=movie.title,
+                    exc=exc,
+                )
+                entries.append(
+                    _history_entry("Radarr", queue_type, movie.title, "failed", str(exc)[:200])
+                )
+            return entries
+        gate.sent("MoviesSearch", {"movieIds": movie_ids})
+        for movie in pending:
+            logger.info("Radarr: Searched {title} ({queue})", title=movie.title, queue=queue_type)
+            entries.append(
+                _history_entry("Radarr", queue_type, movie.title, "searched", "search triggered")
             )
-    return seasons
+        return entries
 
+    results = await dispatcher.run(
+        [functools.partial(search_chunk, chunk) for chunk in chunk_items(movies, movies_per_command)]
+    )
+    return await _record_dispatch(db_path, results)
 
-def filter_sonarr_episodes(episodes: list[dict]) -> list[dict]:
-    """Filter Sonarr episodes: must be monitored with a past air date.
 
-    Combines monitored filtering AND future/TBA air date filtering.
-    Episodes without an air date (TBA) are treated as future and skipped.
-    Episodes with unparseable air dates are also skipped.
+async def _send_sonarr_command(client: SonarrClient, command: dict) -> None:
+    """Send the Sonarr search command planned by ``plan_sonarr_searches``."""
+    if command["command"] == "EpisodeSearch":
+        await client.search_episodes(command["episodeIds"])
+    elif command["command"] == "SeriesSearch":
+        await client.search_series(command["seriesId"])
+    else:
+        await client.search_season(command["seriesId"], command["seasonNumber"])
 
-    Args:
-        episodes: List of episode dicts from Sonarr API.
+
+def _sonarr_command_body(command: dict) -> dict:
+    """Return the ``/api/v3/command`` body Sonarr records for a planned command."""
+    if command["command"] == "EpisodeSearch":
+        return {"episodeIds": command["episodeIds"]}
+    if command["command"] == "SeriesSearch":
+        return {"seriesId": command["seriesId"]}
+    return {"seriesId": command["seriesId"], "seasonNumber": command["seasonNumber"]}
+
+
+def _season_covered(command: dict, covered: set[tuple[int, int | None]]) -> bool:
+    """Whether an earlier Season/SeriesSearch this round already covers ``command``.
+
+    ``covered`` holds (seriesId, seasonNumber) keys, with a None season
+    for a ``SeriesSearch``.
+    """
+    series_id = command["seriesId"]
+    if (series_id, None) in covered:
+        return True
+    return command["command"] != "SeriesSearch" and (series_id, command["seasonNumber"]) in covered
+
+
+async def _search_sonarr_batch(
+    client: SonarrClient,
+    commands: list[dict],
+    queue_type: str,
+    gate: CommandQueueGate,
+    dispatcher: SearchDispatcher,
+    db_path: Path,
+    covered: set[tuple[int, int | None]],
+) -> tuple[int, int, int]:
+    """Send a batch of planned Sonarr commands and record their history.
+
+    Commands are sent concurrently by ``dispatcher``.  Commands already
+    queued in Sonarr, or whose season was already searched this round
+    (see ``_season_covered``), are recorded as skipped, and commands are
+    deferred when ``gate`` runs out of time waiting for room.  Season and
+    series searches that are sent are added to ``covered``.
 
     Returns:
-        Only monitored episodes with a past air date.
+        Tuple of (searched_count, skipped_count, processed_count) in
+        commands; commands after ``processed_count`` were deferred.
     """
-    now = datetime.now(UTC)
-    result: list[dict] = []
-    for ep in episodes:
-        if not ep.get("monitored", False):
-            continue
-        air_date_str = ep.get("airDateUtc")
-        if air_date_str is None:
-            continue
+
+    async def search_command(command: dict) -> list[dict] | None:
+        name = command["command"]
+        body = _sonarr_command_body(command)
+        display_name = command.get("display_name", "unknown")
+        if _season_covered(command, covered):
+            logger.info("Sonarr: Skipped {name} -- season already searched this round", name=display_name)
+            return [_history_entry("Sonarr", queue_type, display_name, "skipped", "season already searched this round")]
+        if gate.is_queued(name, body):
+            logger.info("Sonarr: Skipped {name} -- search already queued", name=display_name)
+            return [_history_entry("Sonarr", queue_type, display_name, "skipped", "search already queued")]
+        if not await gate.acquire():
+            return None
         try:
-            air_date = datetime.fromisoformat(air_date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            continue
-        if air_date > now:
-            continue
-        result.append(ep)
-    return result
+            await _send_sonarr_command(client, command)
+        except Exception as exc:
+            logger.warning(
+                "Sonarr: Failed to search {name}: {exc}",
+                name=display_name,
+                exc=exc,
+            )
+            return [_history_entry("Sonarr", queue_type, display_name, "failed", str(exc)[:200])]
+        gate.sent(name, body)
+        if name != "EpisodeSearch":
+            covered.add((command["seriesId"], command["seasonNumber"]))
+        logger.info(
+            "Sonarr: Searched {name} ({queue}, {command})",
+            name=display_name,
+            queue=queue_type,
+            command=name,
+        )
+        return [_history_entry("Sonarr", queue_type, display_name, "searched", f"{name} triggered")]
+
+    results = await dispatcher.run(
+        [functools.partial(search_command, command) for command in commands]
+    )
+    return await _record_dispatch(db_path, results)
+
+
+def _is_monitored(movie: MovieRecord) -> bool:
+    """Window filter for Radarr: only monitored movies are searched."""
+    return movie.monitored
 
 
 async def run_radarr_cycle(
@@ -162,13 +539,12 @@ async def run_radarr_cycle(
 ) -> FetcharrState:
     """Run one complete Radarr search cycle: missing batch then cutoff batch.
 
-    Fetches the current wanted-missing and wanted-cutoff lists, filters
-    to monitored items, slices a batch from each queue using independent
-    cursors, triggers ``MoviesSearch`` for each movie, and logs the result.
+    Fetches the next window of monitored movies from each wanted queue,
+    triggers ``MoviesSearch`` for the batch, and logs the result per movie.
 
     Individual search failures are logged and skipped (skip-and-continue).
-    If the fetch calls themselves fail (network/HTTP errors), the entire
-    cycle aborts and cursors remain unchanged.
+    If a fetch fails (network/HTTP errors), the cycle aborts and cursors
+    of queues not yet dispatched remain unchanged.
 
     Args:
         client: Connected Radarr API client.
@@ -180,26 +556,17 @@ async def run_radarr_cycle(
         Updated state with new cursor positions and last_run timestamp.
     """
     cycle_start = time.monotonic()
+    metrics_before = client.metrics.snapshot()
 
-    try:
-        missing = await client.get_wanted_missing()
-        cutoff = await client.get_wanted_cutoff()
-    except (httpx.HTTPError, pydantic.ValidationError) as exc:
-        logger.warning("Radarr: Cycle aborted -- {exc}", exc=exc)
-        state["radarr"]["connected"] = False
-        if not state["radarr"].get("unreachable_since"):
-            state["radarr"]["unreachable_since"] = (
-                datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            )
-        return state
-
-    # Track connection health (WEBU-06)
-    state["radarr"]["connected"] = True
-    state["radarr"]["unreachable_since"] = None
+    app_state = state["radarr"]
 
-    # Cache raw item counts before filtering (WEBU-04)
-    state["radarr"]["missing_count"] = len(missing)
-    state["radarr"]["cutoff_count"] = len(cutoff)
+    # Known down per the background health probe: skip the fetch and its timeouts
+    if client.health.down:
+        logger.warning(
+            "Radarr: Cycle skipped -- unreachable since {since} (health probe)",
+            since=client.health.down_since,
+        )
+        return state
 
     # Apply hard max cap (SRCH-12)
     missing_limit = settings.radarr.search_missing_count
@@ -218,66 +585,104 @@ async def run_radarr_cycle(
     searched_count = 0
     skipped_count = 0
 
-    # --- Missing queue ---
-    missing = filter_monitored(missing)
-    cursor = state["radarr"]["missing_cursor"]
-    batch, new_cursor = slice_batch(missing, cursor, missing_limit)
-    for movie in batch:
-        try:
-            await client.search_movies([movie["id"]])
-            await insert_search_entry(
-                db_path, "Radarr", "missing", movie["title"],
-                outcome="searched", detail="search triggered",
-            )
-            logger.info("Radarr: Searched {title} (missing)", title=movie["title"])
-            searched_count += 1
-        except Exception as exc:
-            logger.warning(
-                "Radarr: Failed to search {title}: {exc}",
-                title=movie.get("title", "unknown"),
-                exc=exc,
-            )
-            await insert_search_entry(
-                db_path, "Radarr", "missing", movie.get("title", "unknown"),
-                outcome="failed", detail=str(exc)[:200],
-            )
-            skipped_count += 1
-    state["radarr"]["missing_cursor"] = new_cursor
-
-    # --- Cutoff queue ---
-    cutoff = filter_monitored(cutoff)
-    cursor = state["radarr"]["cutoff_cursor"]
-    batch, new_cursor = slice_batch(cutoff, cursor, cutoff_limit)
-    for movie in batch:
-        try:
-            await client.search_movies([movie["id"]])
-            await insert_search_entry(
-                db_path, "Radarr", "cutoff", movie["title"],
-                outcome="searched", detail="search triggered",
+    movies_per_command = settings.radarr.movies_per_command
+
+    # Windows, unmonitored counts and the command queue are fetched
+    # concurrently; only the pages covering each batch are requested and
+    # list sizes come from totalRecords.  A page that keeps failing is
+    # skipped (see skipped_pages below); any other failure cancels the
+    # rest and aborts the cycle.
+    fetches: _FetchGroup | None = None
+    try:
+        capabilities = await client.capabilities()
+        # "last_searched" heads the queue sorted by lastSearchTime instead of the cursor
+        order = _select_order(
+            "Radarr", settings.radarr.search_order, capabilities, client.LAST_SEARCH_SORT_KEY
+        )
+        gate = CommandQueueGate.from_config(client, settings.radarr)
+        dispatcher = SearchDispatcher.from_config(settings.radarr)
+        fetches = _FetchGroup(
+            missing=_fetch_window(client, "missing", app_state, missing_limit, order, accept=_is_monitored),
+            cutoff=_fetch_window(client, "cutoff", app_state, cutoff_limit, order, accept=_is_monitored),
+            missing_unmonitored=client.count_unmonitored("missing"),
+            cutoff_unmonitored=client.count_unmonitored("cutoff"),
+            queue=gate.start(),
+        )
+
+        # --- Missing queue, then cutoff queue; each dispatches once its window is in ---
+        # The gate skips searches already queued; items left undispatched when
+        # the queue wait budget runs out stay ahead of the cursor.
+        windows: dict[str, RecordWindow] = {}
+        for queue_type in ("missing", "cutoff"):
+            window, _ = await fetches.results(queue_type, "queue")
+            windows[queue_type] = window
+            searched, skipped, processed = await _search_radarr_batch(
+                client, window.records, queue_type, movies_per_command, gate, dispatcher, db_path
             )
-            logger.info("Radarr: Searched {title} (cutoff)", title=movie["title"])
-            searched_count += 1
-        except Exception as exc:
-            logger.warning(
-                "Radarr: Failed to search {title}: {exc}",
-                title=movie.get("title", "unknown"),
-                exc=exc,
+            searched_count += searched
+            skipped_count += skipped
+            if order == "last_searched":
+                # lastSearchTime is the cursor: searched items sort last next cycle
+                app_state[f"{queue_type}_last_id"] = None
+                app_state[f"{queue_type}_cursor"] = 0
+                continue
+            last_id, position = advance_keyset(
+                window,
+                [[movie.id] for movie in window.records],
+                processed,
+                app_state.get(f"{queue_type}_cursor", 0),
             )
-            await insert_search_entry(
-                db_path, "Radarr", "cutoff", movie.get("title", "unknown"),
-                outcome="failed", detail=str(exc)[:200],
+            app_state[f"{queue_type}_last_id"] = last_id
+            app_state[f"{queue_type}_cursor"] = position
+
+        missing_unmonitored, cutoff_unmonitored = await fetches.results(
+            "missing_unmonitored", "cutoff_unmonitored"
+        )
+    except (httpx.HTTPError, pydantic.ValidationError) as exc:
+        logger.warning("Radarr: Cycle aborted -- {exc}", exc=exc)
+        state["radarr"]["connected"] = False
+        if not state["radarr"].get("unreachable_since"):
+            state["radarr"]["unreachable_since"] = (
+                datetime.now(UTC).isoformat().replace("+00:00", "Z")
             )
-            skipped_count += 1
-    state["radarr"]["cutoff_cursor"] = new_cursor
+        return state
+    finally:
+        if fetches is not None:
+            fetches.cancel()
+
+    # Track connection health (WEBU-06)
+    state["radarr"]["connected"] = True
+    state["radarr"]["unreachable_since"] = None
+
+    # Cache raw item counts before filtering (WEBU-04)
+    record_backlog(
+        client,
+        state["radarr"],
+        (windows["missing"].total_records, windows["cutoff"].total_records),
+        (missing_unmonitored, cutoff_unmonitored),
+    )
+    server_filtered = missing_unmonitored + cutoff_unmonitored
+
+    # Pages that kept failing were left out of the windows (partial coverage)
+    skipped_pages = sum(len(window.skipped_pages) for window in windows.values())
+    state["radarr"]["skipped_pages"] = skipped_pages
 
     # --- Diagnostic summary ---
     elapsed = time.monotonic() - cycle_start
+    state["radarr"]["queue_wait"] = round(gate.waited, 1)
     logger.info(
-        "Radarr: Cycle completed in {elapsed:.1f}s -- {fetched} fetched, {searched} searched, {skipped} skipped",
+        "Radarr: Cycle completed in {elapsed:.1f}s -- {fetched} fetched, {searched} searched, "
+        "{skipped} skipped, {waited:.1f}s waiting on command queue, "
+        "{filtered} unmonitored filtered server-side (~{saved_kib:.0f} KiB saved){traffic}{partial}",
         elapsed=elapsed,
         fetched=state["radarr"]["missing_count"] + state["radarr"]["cutoff_count"],
         searched=searched_count,
         skipped=skipped_count,
+        waited=gate.waited,
+        filtered=server_filtered,
+        saved_kib=server_filtered * client.metrics.bytes_per_record / 1024,
+        traffic=_traffic_note(client.metrics.since(metrics_before)),
+        partial=_partial_note(skipped_pages),
     )
 
     # --- Update last_run ---
@@ -285,6 +690,16 @@ async def run_radarr_cycle(
     return state
 
 
+def _is_plannable_episode(ep: EpisodeRecord) -> bool:
+    """Window filter for Sonarr: searchable episodes with a known season."""
+    return ep.series_id is not None and ep.season_number is not None and is_searchable_episode(ep)
+
+
+def _season_key(ep: EpisodeRecord) -> tuple[int | None, int | None]:
+    """Window grouping for Sonarr: batch sizes count seasons, not episodes."""
+    return (ep.series_id, ep.season_number)
+
+
 async def run_sonarr_cycle(
     client: SonarrClient,
     state: FetcharrState,
@@ -293,14 +708,13 @@ async def run_sonarr_cycle(
 ) -> FetcharrState:
     """Run one complete Sonarr search cycle: missing batch then cutoff batch.
 
-    Fetches the current wanted-missing and wanted-cutoff episode lists,
-    filters to monitored episodes with past air dates, deduplicates to
-    unique seasons, slices a batch from each queue using independent
-    cursors, triggers ``SeasonSearch`` for each season, and logs the result.
+    Fetches the next window of wanted (series, season) groups from each
+    wanted queue, plans one episode, season or series search per group
+    (see ``plan_sonarr_searches``), and sends and logs the commands.
 
     Individual search failures are logged and skipped (skip-and-continue).
-    If the fetch calls themselves fail (network/HTTP errors), the entire
-    cycle aborts and cursors remain unchanged.
+    If a fetch fails (network/HTTP errors), the cycle aborts and cursors
+    of queues not yet dispatched remain unchanged.
 
     Args:
         client: Connected Sonarr API client.
@@ -312,26 +726,17 @@ async def run_sonarr_cycle(
         Updated state with new cursor positions and last_run timestamp.
     """
     cycle_start = time.monotonic()
+    metrics_before = client.metrics.snapshot()
 
-    try:
-        missing_episodes = await client.get_wanted_missing()
-        cutoff_episodes = await client.get_wanted_cutoff()
-    except (httpx.HTTPError, pydantic.ValidationError) as exc:
-        logger.warning("Sonarr: Cycle aborted -- {exc}", exc=exc)
-        state["sonarr"]["connected"] = False
-        if not state["sonarr"].get("unreachable_since"):
-            state["sonarr"]["unreachable_since"] = (
-                datetime.now(UTC).isoformat().replace("+00:00", "Z")
-            )
-        return state
-
-    # Track connection health (WEBU-06)
-    state["sonarr"]["connected"] = True
-    state["sonarr"]["unreachable_since"] = None
+    app_state = state["sonarr"]
 
-    # Cache raw item counts before filtering (WEBU-04)
-    state["sonarr"]["missing_count"] = len(missing_episodes)
-    state["sonarr"]["cutoff_count"] = len(cutoff_episodes)
+    # Known down per the background health probe: skip the fetch and its timeouts
+    if client.health.down:
+        logger.warning(
+            "Sonarr: Cycle skipped -- unreachable since {since} (health probe)",
+            since=client.health.down_since,
+        )
+        return state
 
     # Apply hard max cap (SRCH-12)
     missing_limit = settings.sonarr.search_missing_count
@@ -350,68 +755,119 @@ async def run_sonarr_cycle(
     searched_count = 0
     skipped_count = 0
 
-    # --- Missing queue ---
-    missing_episodes = filter_sonarr_episodes(missing_episodes)
-    missing_seasons = deduplicate_to_seasons(missing_episodes)
-    cursor = state["sonarr"]["missing_cursor"]
-    batch, new_cursor = slice_batch(missing_seasons, cursor, missing_limit)
-    for season in batch:
-        try:
-            await client.search_season(season["seriesId"], season["seasonNumber"])
-            await insert_search_entry(
-                db_path, "Sonarr", "missing", season["display_name"],
-                outcome="searched", detail="search triggered",
-            )
-            logger.info("Sonarr: Searched {name} (missing)", name=season["display_name"])
-            searched_count += 1
-        except Exception as exc:
-            logger.warning(
-                "Sonarr: Failed to search {name}: {exc}",
-                name=season.get("display_name", "unknown"),
-                exc=exc,
-            )
-            await insert_search_entry(
-                db_path, "Sonarr", "missing", season.get("display_name", "unknown"),
-                outcome="failed", detail=str(exc)[:200],
-            )
-            skipped_count += 1
-    state["sonarr"]["missing_cursor"] = new_cursor
-
-    # --- Cutoff queue ---
-    cutoff_episodes = filter_sonarr_episodes(cutoff_episodes)
-    cutoff_seasons = deduplicate_to_seasons(cutoff_episodes)
-    cursor = state["sonarr"]["cutoff_cursor"]
-    batch, new_cursor = slice_batch(cutoff_seasons, cursor, cutoff_limit)
-    for season in batch:
-        try:
-            await client.search_season(season["seriesId"], season["seasonNumber"])
-            await insert_search_entry(
-                db_path, "Sonarr", "cutoff", season["display_name"],
-                outcome="searched", detail="search triggered",
+    # Windows, unmonitored counts and the command queue are fetched
+    # concurrently; only the pages covering each batch are requested and
+    # list sizes come from totalRecords.  A page that keeps failing is
+    # skipped (see skipped_pages below); any other failure cancels the
+    # rest and aborts the cycle.
+    fetches: _FetchGroup | None = None
+    try:
+        capabilities = await client.capabilities()
+        # "last_searched" heads the queue sorted by lastSearchTime instead of the cursor
+        order = _select_order(
+            "Sonarr", settings.sonarr.search_order, capabilities, client.LAST_SEARCH_SORT_KEY
+        )
+        gate = CommandQueueGate.from_config(client, settings.sonarr)
+        dispatcher = SearchDispatcher.from_config(settings.sonarr)
+        window_options = {"accept": _is_plannable_episode, "group": _season_key}
+        fetches = _FetchGroup(
+            missing=_fetch_window(client, "missing", app_state, missing_limit, order, **window_options),
+            cutoff=_fetch_window(client, "cutoff", app_state, cutoff_limit, order, **window_options),
+            missing_unmonitored=client.count_unmonitored("missing"),
+            cutoff_unmonitored=client.count_unmonitored("cutoff"),
+            queue=gate.start(),
+        )
+
+        season_threshold = settings.sonarr.season_search_threshold
+        series_threshold = settings.sonarr.series_search_threshold
+
+        # --- Missing queue, then cutoff queue; each dispatches once its window is in ---
+        # The gate skips searches already queued; items left undispatched when
+        # the queue wait budget runs out stay ahead of the cursor.
+        windows: dict[str, RecordWindow] = {}
+        for queue_type in ("missing", "cutoff"):
+            window, _ = await fetches.results(queue_type, "queue")
+            windows[queue_type] = window
+            series = await client.get_series({ep.series_id for ep in window.records})
+            commands = plan_sonarr_searches(window.records, series, season_threshold, series_threshold)
+            # Windows follow episode ids, so a season with scattered ids can
+            # recur within a round: seasons and series already searched this
+            # round are remembered and commands they cover are skipped.  The
+            # planner only sees this window's episodes, so such a season may
+            # still get an EpisodeSearch.  A window starting at the head of
+            # the list begins a new round.
+            searched_key = f"{queue_type}_searched_seasons"
+            if order == "last_searched" or window.after_id is None:
+                app_state[searched_key] = []
+            covered = {tuple(key) for key in app_state.get(searched_key, [])}
+            searched, skipped, processed = await _search_sonarr_batch(
+                client, commands, queue_type, gate, dispatcher, db_path, covered
             )
-            logger.info("Sonarr: Searched {name} (cutoff)", name=season["display_name"])
-            searched_count += 1
-        except Exception as exc:
-            logger.warning(
-                "Sonarr: Failed to search {name}: {exc}",
-                name=season.get("display_name", "unknown"),
-                exc=exc,
+            app_state[searched_key] = [list(key) for key in covered]
+            searched_count += searched
+            skipped_count += skipped
+            if order == "last_searched":
+                # lastSearchTime is the cursor: searched items sort last next cycle
+                app_state[f"{queue_type}_last_id"] = None
+                app_state[f"{queue_type}_cursor"] = 0
+                continue
+            last_id, position = advance_keyset(
+                window,
+                [command["episodeIds"] for command in commands],
+                processed,
+                app_state.get(f"{queue_type}_cursor", 0),
             )
-            await insert_search_entry(
-                db_path, "Sonarr", "cutoff", season.get("display_name", "unknown"),
-                outcome="failed", detail=str(exc)[:200],
+            app_state[f"{queue_type}_last_id"] = last_id
+            app_state[f"{queue_type}_cursor"] = position
+
+        missing_unmonitored, cutoff_unmonitored = await fetches.results(
+            "missing_unmonitored", "cutoff_unmonitored"
+        )
+    except (httpx.HTTPError, pydantic.ValidationError) as exc:
+        logger.warning("Sonarr: Cycle aborted -- {exc}", exc=exc)
+        state["sonarr"]["connected"] = False
+        if not state["sonarr"].get("unreachable_since"):
+            state["sonarr"]["unreachable_since"] = (
+                datetime.now(UTC).isoformat().replace("+00:00", "Z")
             )
-            skipped_count += 1
-    state["sonarr"]["cutoff_cursor"] = new_cursor
+        return state
+    finally:
+        if fetches is not None:
+            fetches.cancel()
+
+    # Track connection health (WEBU-06)
+    state["sonarr"]["connected"] = True
+    state["sonarr"]["unreachable_since"] = None
+
+    # Cache raw item counts before filtering (WEBU-04)
+    record_backlog(
+        client,
+        state["sonarr"],
+        (windows["missing"].total_records, windows["cutoff"].total_records),
+        (missing_unmonitored, cutoff_unmonitored),
+    )
+    server_filtered = missing_unmonitored + cutoff_unmonitored
+
+    # Pages that kept failing were left out of the windows (partial coverage)
+    skipped_pages = sum(len(window.skipped_pages) for window in windows.values())
+    state["sonarr"]["skipped_pages"] = skipped_pages
 
     # --- Diagnostic summary ---
     elapsed = time.monotonic() - cycle_start
+    state["sonarr"]["queue_wait"] = round(gate.waited, 1)
     logger.info(
-        "Sonarr: Cycle completed in {elapsed:.1f}s -- {fetched} fetched, {searched} searched, {skipped} skipped",
+        "Sonarr: Cycle completed in {elapsed:.1f}s -- {fetched} fetched, {searched} searched, "
+        "{skipped} skipped, {waited:.1f}s waiting on command queue, "
+        "{filtered} unmonitored filtered server-side (~{saved_kib:.0f} KiB saved){traffic}{partial}",
         elapsed=elapsed,
         fetched=state["sonarr"]["missing_count"] + state["sonarr"]["cutoff_count"],
         searched=searched_count,
         skipped=skipped_count,
+        waited=gate.waited,
+        filtered=server_filtered,
+        saved_kib=server_filtered * client.metrics.bytes_per_record / 1024,
+        traffic=_traffic_note(client.metrics.since(metrics_before)),
+        partial=_partial_note(skipped_pages),
     )
 
     # --- Update last_run ---
@@ -5,6 +5,8 @@ FastAPI's lifespan context manager.  Shared state is exposed on ``app.state``
 so that web routes can read it without coupling.  The ``make_search_job``
 factory creates job closures that read from ``app.state`` rather than
 capturing variables, enabling future hot-reload of clients and settings.
+Between cycles, lightweight probe jobs (``schedule_probe_jobs``) keep
+each app's reachability and backlog counts current.
 """
 
 from __future__ import annotations
@@ -15,6 +17,8 @@ from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
+import httpx
+import pydantic
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 from loguru import logger
@@ -22,8 +26,8 @@ from loguru import logger
 from fetcharr.clients.radarr import RadarrClient
 from fetcharr.clients.sonarr import SonarrClient
 from fetcharr.db import init_db, migrate_from_state
-from fetcharr.models.config import Settings
-from fetcharr.search.engine import run_radarr_cycle, run_sonarr_cycle
+from fetcharr.models.config import ArrConfig, Settings
+from fetcharr.search.engine import record_backlog, run_radarr_cycle, run_sonarr_cycle
 from fetcharr.state import FetcharrState, load_state, save_state
 
 
@@ -70,6 +74,97 @@ def make_search_job(
     return job
 
 
+def make_health_job(app: FastAPI, app_name: str) -> Callable[[], Coroutine]:
+    """Create an async job that probes an app's liveness and updates its state.
+
+    Like ``make_search_job`` the closure reads the client from
+    ``app.state`` when it runs.  A successful probe marks the app
+    connected; once the client's ``HealthRecord`` counts it as down it is
+    marked unreachable (keeping the earliest ``unreachable_since``), and
+    search cycles skip their fetch until a probe is answered again.
+
+    Args:
+        app: The FastAPI application instance.
+        app_name: One of "radarr" or "sonarr".
+
+    Returns:
+        An async callable suitable for ``scheduler.add_job()``.
+    """
+
+    async def job() -> None:
+        client = getattr(app.state, f"{app_name}_client", None)
+        if client is None:
+            return
+        ok = await client.probe_health()
+        app_state = app.state.fetcharr_state.setdefault(app_name, {})
+        if ok:
+            app_state["connected"] = True
+            app_state["unreachable_since"] = None
+        elif client.health.down:
+            app_state["connected"] = False
+            if not app_state.get("unreachable_since"):
+                app_state["unreachable_since"] = client.health.down_since
+
+    return job
+
+
+def make_count_job(app: FastAPI, app_name: str) -> Callable[[], Coroutine]:
+    """Create an async job that refreshes an app's backlog counts between cycles.
+
+    Reads ``totalRecords`` of both wanted lists with one-record pages
+    (``ArrClient.count_wanted`` and ``count_unmonitored``) and stores them
+    with ``record_backlog``, exactly as a search cycle does, for the app
+    card and the client's ``BacklogTrend``.  Nothing is sent while the app
+    is known to be down, and a failed probe leaves the previous counts in
+    place.
+
+    Args:
+        app: The FastAPI application instance.
+        app_name: One of "radarr" or "sonarr".
+
+    Returns:
+        An async callable suitable for ``scheduler.add_job()``.
+    """
+
+    async def job() -> None:
+        client = getattr(app.state, f"{app_name}_client", None)
+        if client is None or client.health.down:
+            return
+        try:
+            missing, cutoff, missing_unmonitored, cutoff_unmonitored = await asyncio.gather(
+                client.count_wanted("missing"),
+                client.count_wanted("cutoff"),
+                client.count_unmonitored("missing"),
+                client.count_unmonitored("cutoff"),
+            )
+        except (httpx.HTTPError, pydantic.ValidationError) as exc:
+            logger.debug("{app}: Backlog count probe failed -- {exc}", app=app_name.title(), exc=exc)
+            return
+        app_state = app.state.fetcharr_state.setdefault(app_name, {})
+        record_backlog(client, app_state, (missing, cutoff), (missing_unmonitored, cutoff_unmonitored))
+
+    return job
+
+
+def schedule_probe_jobs(
+    scheduler: AsyncIOScheduler, app: FastAPI, app_name: str, config: ArrConfig | None
+) -> None:
+    """(Re)schedule an app's health and backlog count probes.
+
+    Existing probe jobs are replaced; with ``config`` None (app disabled)
+    or an interval of 0 the job is only removed.
+    """
+    jobs = (
+        (f"{app_name}_health", make_health_job, config.health_check_interval if config else 0),
+        (f"{app_name}_count", make_count_job, config.count_probe_interval if config else 0),
+    )
+    for job_id, factory, interval in jobs:
+        if scheduler.get_job(job_id):
+            scheduler.remove_job(job_id)
+        if interval > 0:
+            scheduler.add_job(factory(app, app_name), "interval", seconds=interval, id=job_id)
+
+
 def create_lifespan(
     settings: Settings, state_path: Path, config_path: Path
 ) -> callable:  # type: ignore[type-arg]
@@ -113,14 +208,21 @@ def create_lifespan(
             radarr_client = RadarrClient(
                 base_url=settings.radarr.url,
                 api_key=settings.radarr.api_key.get_secret_value(),
+                config=settings.radarr,
             )
 
         if settings.sonarr.enabled:
             sonarr_client = SonarrClient(
                 base_url=settings.sonarr.url,
                 api_key=settings.sonarr.api_key.get_secret_value(),
+                config=settings.sonarr,
             )
 
+        # --- Probe each instance's capabilities once on connect (logged) ---
+        await asyncio.gather(
+            *(client.capabilities() for client in (radarr_client, sonarr_client) if client is not None)
+        )
+
         # --- Expose all shared state on app.state ---
         app.state.fetcharr_state = state
         app.state.settings = settings
@@ -149,6 +251,7 @@ def create_lifespan(
                     app=name.title(),
                     interval=app_config.search_interval,
                 )
+                schedule_probe_jobs(scheduler, app, name, app_config)
 
         scheduler.start()
 
@@ -109,6 +109,7 @@ async def validate_connections(settings: Settings) -> dict[str, bool]:
         client = RadarrClient(
             base_url=settings.radarr.url,
             api_key=settings.radarr.api_key.get_secret_value(),
+            config=settings.radarr,
         )
         try:
             results["radarr"] = await client.validate_connection()
@@ -119,16 +120,10 @@ async def validate_connections(settings: Settings) -> dict[str, bool]:
         client = SonarrClient(
             base_url=settings.sonarr.url,
             api_key=settings.sonarr.api_key.get_secret_value(),
+            config=settings.sonarr,
         )
         try:
             results["sonarr"] = await client.validate_connection()
-            if results["sonarr"]:
-                try:
-                    api_version = await client.detect_api_version()
-                    logger.info("Sonarr: Detected API {version}", version=api_version)
-                except Exception:
-                    logger.warning("Sonarr: API version detection failed -- assuming v3")
-                    logger.info("Sonarr: Detected API {version}", version="v3")
         finally:
             await client.close()
 
@@ -22,13 +22,21 @@ STATE_PATH = Path("/config/state.json")
 class AppState(TypedDict, total=False):
     """Per-app cursor and timing state."""
 
-    missing_cursor: int
-    cutoff_cursor: int
+    missing_cursor: int  # Position of missing_last_id in the wanted list (for display)
+    cutoff_cursor: int  # Position of cutoff_last_id in the wanted list (for display)
+    missing_last_id: int | None  # Keyset cursor: id of the last processed missing item
+    cutoff_last_id: int | None  # Keyset cursor: id of the last processed cutoff item
     last_run: str | None  # ISO timestamp
     connected: bool | None  # True after successful fetch, False after failure
     unreachable_since: str | None  # ISO timestamp of first failure, None when healthy
     missing_count: int | None  # Total wanted-missing items (before filtering)
     cutoff_count: int | None  # Total cutoff-unmet items (before filtering)
+    missing_listed: int | None  # Items in the list the missing cursor walks (monitored only if filtered server-side)
+    cutoff_listed: int | None  # Items in the list the cutoff cursor walks
+    queue_wait: float | None  # Seconds the last cycle waited on the app's command queue
+    skipped_pages: int | None  # Wanted-list pages the last cycle skipped after failures (0 = complete)
+    missing_searched_seasons: list[list]  # Sonarr [seriesId, season] searched this round (season None = series)
+    cutoff_searched_seasons: list[list]  # Same for the cutoff queue; cleared when the cursor wraps
 
 
 class FetcharrState(TypedDict, total=False):
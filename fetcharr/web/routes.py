@@ -26,7 +26,7 @@ from fetcharr.log_buffer import log_buffer
 from fetcharr.logging import setup_logging
 from fetcharr.models.config import Settings as SettingsModel
 from fetcharr.search.engine import run_radarr_cycle, run_sonarr_cycle
-from fetcharr.search.scheduler import make_search_job
+from fetcharr.search.scheduler import make_search_job, schedule_probe_jobs
 from fetcharr.startup import collect_secrets
 from fetcharr.state import save_state
 from fetcharr.web.validation import safe_int, safe_log_level, validate_arr_url
@@ -38,6 +38,17 @@ STATIC_DIR = _PKG_DIR / "static"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 router = APIRouter()
 
+# App config fields edited through the settings form.  Anything else in an
+# app section is TOML-only tuning and is carried over unchanged on save.
+FORM_FIELDS: set[str] = {
+    "url",
+    "api_key",
+    "enabled",
+    "search_interval",
+    "search_missing_count",
+    "search_cutoff_count",
+}
+
 
 def _build_app_context(request: Request, app_name: str) -> dict | None:
     """Build a template context dict for a single app.
@@ -49,8 +60,9 @@ def _build_app_context(request: Request, app_name: str) -> dict | None:
         app_name: One of "radarr" or "sonarr".
 
     Returns:
-        Dict with name, last_run, next_run, missing_cursor, cutoff_cursor
-        or None if app is not enabled.
+        Dict with name, last_run, next_run, missing_cursor, cutoff_cursor,
+        connection health and circuit breaker state, or None if app is
+        not enabled.
     """
     settings = request.app.state.settings
     app_config = getattr(settings, app_name, None)
@@ -67,6 +79,10 @@ def _build_app_context(request: Request, app_name: str) -> dict | None:
     if job and job.next_run_time:
         next_run = job.next_run_time.isoformat()
 
+    client = getattr(request.app.state, f"{app_name}_client", None)
+    circuit_state = client.circuit_state if client is not None else None
+    health = client.health if client is not None else None
+
     return {
         "name": app_name,
         "last_run": app_state.get("last_run"),
@@ -75,8 +91,16 @@ def _build_app_context(request: Request, app_name: str) -> dict | None:
         "cutoff_cursor": app_state.get("cutoff_cursor", 0),
         "connected": app_state.get("connected"),
         "unreachable_since": app_state.get("unreachable_since"),
+        "circuit_state": circuit_state,
+        "availability": health.availability if health is not None else None,
+        "latency_ms": health.latency_ms if health is not None else None,
+        "missing_trend": client.backlog.change("missing") if client is not None else None,
+        "cutoff_trend": client.backlog.change("cutoff") if client is not None else None,
         "missing_count": app_state.get("missing_count"),
         "cutoff_count": app_state.get("cutoff_count"),
+        "missing_listed": app_state.get("missing_listed"),
+        "cutoff_listed": app_state.get("cutoff_listed"),
+        "skipped_pages": app_state.get("skipped_pages"),
     }
 
 
@@ -218,6 +242,7 @@ async def save_settings(request: Request) -> RedirectResponse:
             return RedirectResponse(url="/settings", status_code=303)
 
         new_config[name] = {
+            **current_cfg.model_dump(exclude=FORM_FIELDS, exclude_defaults=True),
             "url": url,
             "api_key": submitted_key if submitted_key else current_cfg.api_key.get_secret_value(),
             "enabled": form.get(f"{name}_enabled") == "on",
@@ -258,6 +283,7 @@ async def save_settings(request: Request) -> RedirectResponse:
             # Disable: remove job and close client
             if existing_job:
                 scheduler.remove_job(job_id)
+            schedule_probe_jobs(scheduler, request.app, name, None)
             client = getattr(request.app.state, f"{name}_client", None)
             if client:
                 await client.close()
@@ -282,6 +308,7 @@ async def save_settings(request: Request) -> RedirectResponse:
                 new_client = ClientClass(
                     base_url=new_cfg.url,
                     api_key=new_cfg.api_key.get_secret_value(),
+                    config=new_cfg,
                 )
                 setattr(request.app.state, f"{name}_client", new_client)
 
@@ -307,6 +334,7 @@ async def save_settings(request: Request) -> RedirectResponse:
                     name=name.title(),
                     interval=new_cfg.search_interval,
                 )
+                schedule_probe_jobs(scheduler, request.app, name, new_cfg)
 
     return RedirectResponse(url="/settings", status_code=303)
 
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import inspect
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from fetcharr.clients.base import ArrClient
 from fetcharr.models.config import ArrConfig, Settings
 from fetcharr.state import _default_state
 
+C = TypeVar("C", bound=ArrClient)
+
 
 def make_settings(
     radarr_url: str = "http://radarr:7878",
@@ -49,3 +58,42 @@ def default_state():
     do not need to import internal helpers directly.
     """
     return _default_state()
+
+
+def page_body(request: httpx.Request, total: int, records: list[dict[str, Any]], sort_key: str = "id") -> dict:
+    """Build a paginated *arr response body for a mocked page request.
+
+    ``page`` and ``pageSize`` echo the request, as the *arr does.
+    """
+    return {
+        "page": int(request.url.params.get("page", 1)),
+        "pageSize": int(request.url.params.get("pageSize", len(records))),
+        "sortKey": sort_key,
+        "totalRecords": total,
+        "records": records,
+    }
+
+
+def make_mock_client(
+    handler: Callable[[httpx.Request], Any],
+    client_cls: type[C] = ArrClient,
+    **config: Any,
+) -> tuple[C, list[httpx.Request]]:
+    """Build a client whose requests are answered by ``handler``.
+
+    ``handler`` may be sync or async, as for ``httpx.MockTransport``.
+    Keyword overrides go to the client's ``ArrConfig``.  Returns the
+    client and the list of requests it sent, in order.
+    """
+    requests: list[httpx.Request] = []
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = handler(request)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    client = client_cls(base_url="http://test", api_key="key", config=ArrConfig(**config))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(respond), base_url="http://test")
+    return client, requests
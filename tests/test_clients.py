@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import itertools
+import json
+import threading
+import time
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pydantic
 import pytest
+from loguru import logger
 
+from fetcharr.clients import decode, transport
+from fetcharr.clients.backlog import BacklogTrend
 from fetcharr.clients.base import ArrClient
-from fetcharr.clients.radarr import RadarrClient
-from fetcharr.clients.sonarr import SonarrClient
+from fetcharr.clients.breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from fetcharr.clients.cache import CachedResponse, ResponseCache, cache_key
+from fetcharr.clients.decode import decode_page
+from fetcharr.clients.health import HealthRecord
+from fetcharr.clients.hedge import Hedger
+from fetcharr.clients.metrics import ClientMetrics
+from fetcharr.clients.radarr import MOVIE_PROJECTION, RadarrClient, project_movie
+from fetcharr.clients.retry import RetryPolicy, parse_retry_after
+from fetcharr.clients.sonarr import EPISODE_PROJECTION, SonarrClient
+from fetcharr.clients.tuning import PageSample, PageSizeTuner
+from fetcharr.models.arr import EpisodeRecord, MovieRecord, SeriesInfo
+from fetcharr.models.config import ArrConfig
+from tests.conftest import make_mock_client, page_body
 
 
 def test_arr_client_sets_api_key_header() -> None:
@@ -27,6 +47,32 @@ def test_arr_client_sets_timeout() -> None:
     assert client._client.timeout.read == 30
 
 
+def test_arr_client_uses_configured_timeouts() -> None:
+    """Connect and read timeouts come from the app config when not overridden."""
+    client = ArrClient(base_url="http://x", api_key="key", config=ArrConfig(connect_timeout=3, read_timeout=45))
+    assert client._client.timeout.connect == 3
+    assert client._client.timeout.read == 45
+
+
+def test_arr_client_builds_transport_from_config(monkeypatch) -> None:
+    """Pool limits, keep-alive and the Unix socket reach the httpx transport."""
+    captured: dict = {}
+    monkeypatch.setattr(transport.httpx, "AsyncHTTPTransport", lambda **kwargs: captured.update(kwargs))
+    monkeypatch.setattr(transport, "h2", None)
+    config = ArrConfig(
+        pool_max_connections=8,
+        pool_max_keepalive=4,
+        keepalive_expiry=60,
+        http2=True,
+        socket_path="/run/radarr.sock",
+    )
+    transport.build_transport(config)
+    assert captured["limits"] == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60)
+    assert captured["uds"] == "/run/radarr.sock"
+    # h2 is not installed: HTTP/2 falls back to HTTP/1.1
+    assert captured["http2"] is False
+
+
 def test_arr_client_sets_content_type() -> None:
     """ArrClient sets Content-Type: application/json in default headers."""
     client = ArrClient(base_url="http://localhost:7878", api_key="key")
@@ -126,6 +172,132 @@ async def test_request_with_retry_reraises_when_retry_fails() -> None:
         await client.close()
 
 
+async def test_request_with_retry_does_not_retry_client_errors() -> None:
+    """A 404 is raised immediately without sleeping or retrying."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, request=request)
+
+    client, requests = make_mock_client(handler, retry_max_attempts=5)
+    try:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep, pytest.raises(httpx.HTTPStatusError):
+            await client._request_with_retry("POST", "/api/v3/command")
+        assert len(requests) == 1
+        sleep.assert_not_called()
+        assert client.metrics.retries == 0
+    finally:
+        await client.close()
+
+
+async def test_request_with_retry_honors_retry_after() -> None:
+    """A 429 with Retry-After waits the server-requested time before retrying."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if len(requests) == 1:
+            return httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    client, requests = make_mock_client(handler)
+    try:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            response = await client._request_with_retry("GET", "/test")
+        assert response.status_code == 200
+        sleep.assert_awaited_once_with(7.0)
+        assert client.metrics.retries == 1
+    finally:
+        await client.close()
+
+
+async def test_request_with_retry_backs_off_exponentially() -> None:
+    """Successive retries wait longer, each within its jitter window."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client, _ = make_mock_client(handler, retry_max_attempts=4, retry_base_delay=1.0, retry_budget=100)
+    try:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep, pytest.raises(httpx.ConnectError):
+            await client._request_with_retry("GET", "/test")
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(delays) == 3
+        for delay, full in zip(delays, (1.0, 2.0, 4.0), strict=True):
+            assert full / 2 <= delay <= full
+        assert client.metrics.retries == 3
+        assert client.metrics.retries_exhausted == 1
+    finally:
+        await client.close()
+
+
+def test_retry_policy_respects_time_budget() -> None:
+    """No retry is scheduled when its wait would overrun the budget."""
+    policy = RetryPolicy(max_attempts=5, budget=10.0)
+    response = httpx.Response(503, headers={"Retry-After": "30"}, request=httpx.Request("GET", "http://t"))
+    exc = httpx.HTTPStatusError("busy", request=response.request, response=response)
+    assert policy.next_delay(1, exc, elapsed=0.0) is None
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Retry-After accepts an HTTP-date in the past as zero seconds."""
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("garbage") is None
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+def test_circuit_breaker_opens_after_threshold_and_probes() -> None:
+    """The circuit opens after N failures, half-opens later, closes on success."""
+    now = 0.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=lambda: now)
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    now = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    breaker.before_request()  # the probe is admitted
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # ...but only one at a time
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breaker_failed_probe_doubles_wait() -> None:
+    """A failed half-open probe re-opens the circuit for twice as long."""
+    now = 0.0
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=lambda: now)
+    breaker.record_failure()
+    now = 10.0
+    breaker.before_request()
+    breaker.record_failure()
+    now = 25.0
+    assert breaker.state is CircuitState.OPEN
+    now = 30.0
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+async def test_open_circuit_fails_fast_without_request() -> None:
+    """Once the circuit opens, later calls raise without touching the network."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client, requests = make_mock_client(handler, retry_max_attempts=1, breaker_failure_threshold=2)
+    try:
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await client.post("/api/v3/command", json_data={})
+        assert client.circuit_state == "open"
+        with pytest.raises(CircuitOpenError):
+            await client.post("/api/v3/command", json_data={})
+        assert len(requests) == 2
+    finally:
+        await client.close()
+
+
 # ---------------------------------------------------------------------------
 # Async tests: get_paginated
 # ---------------------------------------------------------------------------
@@ -213,6 +385,41 @@ async def test_get_paginated_empty_results() -> None:
         await client.close()
 
 
+async def test_get_paginated_concurrent_pages_preserve_order() -> None:
+    """get_paginated fetches later pages concurrently but returns them in id order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        page = int(request.url.params["page"])
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later pages answer first to exercise reassembly
+        await asyncio.sleep(0.01 * (10 - page))
+        in_flight -= 1
+        ids = [i for i in range((page - 1) * 2 + 1, page * 2 + 1) if i <= 19]
+        body = {
+            "page": page,
+            "pageSize": 2,
+            "sortKey": "id",
+            "totalRecords": 19,
+            "records": [{"id": i} for i in ids],
+        }
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    client = ArrClient(base_url="http://test", api_key="key", config=ArrConfig(page_concurrency=3))
+    client._app_name = "Test"
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        result = await client.get_paginated("/items", page_size=2)
+        assert [r["id"] for r in result] == list(range(1, 20))
+        assert max_in_flight == 3
+    finally:
+        await client.close()
+
+
 async def test_get_paginated_malformed_response() -> None:
     """get_paginated raises ValidationError on malformed API response."""
 
@@ -230,6 +437,979 @@ async def test_get_paginated_malformed_response() -> None:
         await client.close()
 
 
+async def test_get_paginated_skips_page_that_keeps_failing() -> None:
+    """With ``skipped`` a failing page is retried once, then left out of the list."""
+    requested: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        if page == 2:
+            return httpx.Response(404)
+        body = page_body(request, 6, [{"id": i} for i in range((page - 1) * 2 + 1, page * 2 + 1)])
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    client = ArrClient(base_url="http://test", api_key="key")
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_paginated("/items", page_size=2)
+
+        requested.clear()
+        skipped: list[int] = []
+        result = await client.get_paginated("/items", page_size=2, skipped=skipped)
+        assert [r["id"] for r in result] == [1, 2, 5, 6]
+        assert skipped == [2]
+        assert sorted(requested) == [1, 2, 2, 3]
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Record projection
+# ---------------------------------------------------------------------------
+
+
+def test_project_movie_keeps_only_engine_fields() -> None:
+    """project_movie drops unused fields and defaults monitored to False."""
+    record = project_movie({"id": 3, "title": "Movie C", "images": [{"url": "x"}]})
+    assert record == MovieRecord(id=3, title="Movie C", monitored=False)
+
+
+async def test_sonarr_wanted_fetch_omits_include_series() -> None:
+    """Sonarr wanted fetches no longer request embedded series objects."""
+    seen_params: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_params.append(dict(request.url.params))
+        body = {
+            "page": 1,
+            "pageSize": 50,
+            "sortKey": "id",
+            "totalRecords": 1,
+            "records": [{"id": 1, "seriesId": 7, "seasonNumber": 1, "monitored": True}],
+        }
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    client = SonarrClient(base_url="http://test", api_key="key")
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        window = await client.get_wanted_window("missing", None, 5)
+        assert window.records[0].series_id == 7
+        assert "includeSeries" not in seen_params[0]
+    finally:
+        await client.close()
+
+
+def _series_handler(series: list[dict]):
+    """Answer every request (/api/v3/series) with ``series``."""
+    return lambda request: httpx.Response(200, json=series)
+
+
+async def test_series_cached_between_calls() -> None:
+    """get_series loads /api/v3/series once and reuses it within the TTL."""
+    series = [{"id": 7, "title": "Show A", "overview": "..."}]
+    client, requests = make_mock_client(_series_handler(series), SonarrClient, series_cache_ttl=60)
+    try:
+        assert await client.get_series({7}) == {7: SeriesInfo(title="Show A")}
+        assert await client.get_series({7}) == {7: SeriesInfo(title="Show A")}
+        assert len(requests) == 1
+    finally:
+        await client.close()
+
+
+async def test_series_keeps_season_episode_counts() -> None:
+    """Season statistics from /api/v3/series feed the search planner."""
+    series = [
+        {
+            "id": 7,
+            "title": "Show A",
+            "seasons": [
+                {"seasonNumber": 1, "statistics": {"episodeCount": 10, "totalEpisodeCount": 12}},
+                {"seasonNumber": 2},
+            ],
+        }
+    ]
+    client, _ = make_mock_client(_series_handler(series), SonarrClient, series_cache_ttl=60)
+    try:
+        info = (await client.get_series({7}))[7]
+        assert info.season_episode_counts == {1: 10}
+        assert info.episode_count == 10
+    finally:
+        await client.close()
+
+
+async def test_series_reload_on_ttl_and_unknown_id() -> None:
+    """The series cache reloads after the TTL or for an unknown id (rate-limited)."""
+    series = [{"id": 7, "title": "Show A"}]
+    client, requests = make_mock_client(_series_handler(series), SonarrClient, series_cache_ttl=60)
+    try:
+        with patch("fetcharr.clients.sonarr.time.monotonic", return_value=1000.0):
+            await client.get_series({7})
+        # Unknown id within the rate-limit window: no reload
+        with patch("fetcharr.clients.sonarr.time.monotonic", return_value=1030.0):
+            await client.get_series({8})
+        assert len(requests) == 1
+        # Unknown id after the rate-limit window: reload
+        with patch("fetcharr.clients.sonarr.time.monotonic", return_value=1100.0):
+            await client.get_series({8})
+        assert len(requests) == 2
+        # Known id after the TTL (60 minutes): reload
+        with patch("fetcharr.clients.sonarr.time.monotonic", return_value=1100.0 + 3600):
+            await client.get_series({7})
+        assert len(requests) == 3
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Page decoding backends
+# ---------------------------------------------------------------------------
+
+
+def _episode_page(*records: dict) -> bytes:
+    return json.dumps(
+        {"page": 1, "pageSize": 50, "sortKey": "id", "totalRecords": 9, "records": list(records)}
+    ).encode()
+
+
+EPISODES = (
+    {"id": 1, "seriesId": 10, "seasonNumber": 2, "monitored": True, "airDateUtc": "2020-01-01T00:00:00Z"},
+    {"id": 2, "title": "extra fields are ignored", "monitored": False},
+)
+
+
+@pytest.mark.parametrize("fast", ["msgspec", "orjson", None])
+def test_decode_page_backends_agree(monkeypatch, fast) -> None:
+    """Every backend yields the same records as the pydantic path."""
+    if fast is not None and getattr(decode, fast) is None:
+        pytest.skip(f"{fast} not installed")
+    for name in ("msgspec", "orjson"):
+        if name != fast:
+            monkeypatch.setattr(decode, name, None)
+    body = _episode_page(*EPISODES)
+    expected = decode_page(body, EPISODE_PROJECTION, backend="pydantic")
+    assert decode_page(body, EPISODE_PROJECTION) == expected
+    assert expected[0] == 9
+    assert expected[1][0] == EpisodeRecord(1, 10, 2, True, "2020-01-01T00:00:00Z")
+    assert expected[2] == "id"
+    assert decode_page(body) == decode_page(body, backend="pydantic")
+
+
+def test_decode_page_typed_falls_back_on_unexpected_types() -> None:
+    """A record the typed decoder rejects is projected from the raw dict instead."""
+    body = _episode_page({"id": 1, "title": None, "monitored": 1})
+    assert decode_page(body, MOVIE_PROJECTION) == (9, [MovieRecord(1, None, True)], "id")
+
+
+MALFORMED_PAGES = (
+    {"page": 1, "pageSize": 50, "sortKey": "id", "totalRecords": "many", "records": {}},
+    {"totalRecords": 1, "records": [{"id": 1}]},
+    {"page": 1, "pageSize": 50, "totalRecords": 1, "records": [{"id": 1}]},
+    {"page": 1, "pageSize": 50, "sortKey": None, "totalRecords": 1, "records": [{"id": 1}]},
+)
+
+
+@pytest.mark.parametrize("body", MALFORMED_PAGES)
+@pytest.mark.parametrize("fast", ["msgspec", "orjson", None])
+def test_decode_page_malformed_envelope_raises_validation_error(monkeypatch, fast, body) -> None:
+    """Every backend rejects the envelopes ``PaginatedResponse`` rejects."""
+    if fast is not None and getattr(decode, fast) is None:
+        pytest.skip(f"{fast} not installed")
+    for name in ("msgspec", "orjson"):
+        if name != fast:
+            monkeypatch.setattr(decode, name, None)
+    content = json.dumps(body).encode()
+    for project in (MOVIE_PROJECTION, project_movie, None):
+        with pytest.raises(pydantic.ValidationError):
+            decode_page(content, project)
+
+
+# ---------------------------------------------------------------------------
+# Page size tuning
+# ---------------------------------------------------------------------------
+
+
+def test_page_size_tuner_grows_on_fast_pages() -> None:
+    """Fast, small pages double the page size (bounded step)."""
+    tuner = PageSizeTuner(minimum=10, maximum=1000)
+    sample = PageSample(pages=4, records=200, seconds=0.2, bytes=20_000)
+    assert tuner.observe("/items", 50, sample) == 100
+    assert tuner.size_for("/items") == 100
+
+
+def test_page_size_tuner_shrinks_on_slow_pages() -> None:
+    """Pages slower than the target shrink towards it."""
+    tuner = PageSizeTuner(minimum=10, maximum=1000)
+    sample = PageSample(pages=2, records=100, seconds=8.0, bytes=10_000)
+    assert tuner.observe("/items", 50, sample) == 25
+
+
+def test_page_size_tuner_respects_bounds() -> None:
+    """Tuned sizes never leave the configured min/max range."""
+    tuner = PageSizeTuner(minimum=40, maximum=60)
+    fast = PageSample(pages=1, records=50, seconds=0.01, bytes=500)
+    assert tuner.observe("/fast", 50, fast) == 60
+    slow = PageSample(pages=1, records=50, seconds=30.0, bytes=500)
+    assert tuner.observe("/slow", 50, slow) == 40
+
+
+def test_page_size_tuner_ignores_partial_fetch() -> None:
+    """A fetch smaller than one page leaves the size unchanged."""
+    tuner = PageSizeTuner(minimum=10, maximum=1000)
+    sample = PageSample(pages=1, records=3, seconds=0.01, bytes=300)
+    assert tuner.observe("/items", 50, sample) == 50
+
+
+async def test_get_paginated_remembers_tuned_page_size() -> None:
+    """get_paginated without page_size uses and updates the tuned size per path."""
+    seen_sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        size = int(request.url.params["pageSize"])
+        seen_sizes.append(size)
+        body = {
+            "page": 1,
+            "pageSize": size,
+            "sortKey": "id",
+            "totalRecords": size,
+            "records": [{"id": i} for i in range(size)],
+        }
+        return httpx.Response(200, json=body)
+
+    transport = httpx.MockTransport(handler)
+    client = ArrClient(base_url="http://test", api_key="key")
+    client._app_name = "Test"
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        await client.get_paginated("/items")
+        await client.get_paginated("/items")
+        assert seen_sizes == [50, 100]
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+def _page_body(ids: list[int]) -> dict:
+    """Build a single-page paginated body containing ``ids``."""
+    return {
+        "page": 1,
+        "pageSize": 50,
+        "sortKey": "id",
+        "totalRecords": len(ids),
+        "records": [{"id": i} for i in ids],
+    }
+
+
+async def test_get_paginated_revalidates_with_etag() -> None:
+    """A 304 for a page with an ETag reuses the cached parsed records."""
+    seen_if_none_match: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, json=_page_body([1, 2]), headers={"ETag": '"v1"'})
+
+    transport = httpx.MockTransport(handler)
+    client = ArrClient(base_url="http://test", api_key="key")
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        first = await client.get_paginated("/items", page_size=50)
+        second = await client.get_paginated("/items", page_size=50)
+        assert first == second == [{"id": 1}, {"id": 2}]
+        assert seen_if_none_match == [None, '"v1"']
+        assert (client.metrics.cache_hits, client.metrics.cache_misses) == (1, 1)
+    finally:
+        await client.close()
+
+
+async def test_get_paginated_skips_parsing_unchanged_body() -> None:
+    """Without validators, an identical page body skips projection/validation."""
+    projected: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_page_body([1, 2]))
+
+    def project(record: dict) -> int:
+        projected.append(record["id"])
+        return record["id"]
+
+    transport = httpx.MockTransport(handler)
+    client = ArrClient(base_url="http://test", api_key="key")
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    try:
+        assert await client.get_paginated("/items", page_size=50, project=project) == [1, 2]
+        assert await client.get_paginated("/items", page_size=50, project=project) == [1, 2]
+        assert projected == [1, 2]
+        assert client.metrics.cache_hits == 1
+    finally:
+        await client.close()
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """ResponseCache never holds more than max_entries entries."""
+    cache = ResponseCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.put(cache_key(name, None), CachedResponse(None, None, b"", name))
+    assert len(cache) == 2
+    assert cache.get(cache_key("a", None)) is None
+    assert cache.get(cache_key("c", None)).value == "c"
+
+
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+
+
+def _gated_handler(release: asyncio.Event):
+    """Answer once ``release`` is set: 404 for /fail, else the call number."""
+    calls = itertools.count(1)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        value = next(calls)
+        await release.wait()
+        if request.url.path == "/fail":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"value": value})
+
+    return handler
+
+
+async def test_concurrent_identical_gets_share_one_request() -> None:
+    release = asyncio.Event()
+    client, requests = make_mock_client(_gated_handler(release))
+    try:
+        first = asyncio.create_task(client.get_cached("/items", {"page": 1}, lambda r: r.json()))
+        second = asyncio.create_task(client.get_cached("/items", {"page": 1}, lambda r: r.json()))
+        other = asyncio.create_task(client.get_cached("/items", {"page": 2}, lambda r: r.json()))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        a, b, _ = await asyncio.gather(first, second, other)
+        assert a is b
+        assert [request.url.path for request in requests] == ["/items", "/items"]
+        assert client.metrics.coalesced == 1
+    finally:
+        await client.close()
+
+
+async def test_coalesced_callers_share_errors_and_next_call_refetches() -> None:
+    release = asyncio.Event()
+    client, requests = make_mock_client(_gated_handler(release))
+    try:
+        tasks = [asyncio.create_task(client.get_cached("/fail", None, lambda r: r.json())) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert len(requests) == 1
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_cached("/fail", None, lambda r: r.json())
+        assert len(requests) == 2
+    finally:
+        await client.close()
+
+
+async def test_cancelled_caller_does_not_cancel_shared_request() -> None:
+    release = asyncio.Event()
+    client, requests = make_mock_client(_gated_handler(release))
+    try:
+        first = asyncio.create_task(client.get_cached("/items", None, lambda r: r.json()))
+        second = asyncio.create_task(client.get_cached("/items", None, lambda r: r.json()))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"value": 1}
+        assert len(requests) == 1
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Keyset windows
+# ---------------------------------------------------------------------------
+
+
+def _id_pages(ids: list[int], page_size: int, failures: dict[int, int] | None = None):
+    """Serve ``ids`` as id-sorted pages; page ``n`` fails ``failures[n]`` times (-1 = always)."""
+    failures = failures if failures is not None else {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["sortKey"] == "id"
+        assert request.url.params["sortDirection"] == "ascending"
+        page = int(request.url.params["page"])
+        if failures.get(page, 0):
+            failures[page] -= 1
+            return httpx.Response(404)
+        records = [{"id": i} for i in ids[(page - 1) * page_size : page * page_size]]
+        return httpx.Response(200, json=page_body(request, len(ids), records))
+
+    return handler
+
+
+def _pages(requests: list[httpx.Request]) -> list[int]:
+    """Return the page number of each request, in order."""
+    return [int(request.url.params["page"]) for request in requests]
+
+
+def _record(raw: dict) -> MovieRecord:
+    return MovieRecord(id=raw["id"], title=str(raw["id"]), monitored=True)
+
+
+async def test_get_window_from_start_reads_first_pages_only() -> None:
+    """Without a cursor the window comes from the head of the list."""
+    client, requests = make_mock_client(_id_pages(list(range(1, 101)), 10), page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", None, 12, project=_record)
+        assert [r.id for r in window.records] == list(range(1, 13))
+        assert window.total_records == 100
+        assert window.reached_end is False
+        assert window.positions[12] == 12
+        # Page 3 is at most prefetched while page 2 is read
+        assert _pages(requests)[:2] == [1, 2]
+        assert len(requests) <= 3
+    finally:
+        await client.close()
+
+
+async def test_get_window_binary_searches_for_cursor() -> None:
+    """The window after a cursor is located without walking earlier pages."""
+    ids = list(range(2, 202, 2))  # 100 even ids, 10 pages
+    client, requests = make_mock_client(_id_pages(ids, 10), page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 151, 3, project=_record)
+        assert [r.id for r in window.records] == [152, 154, 156]
+        assert window.positions[152] == 76
+        fetched = _pages(requests)
+        assert len(fetched) < 10
+        assert fetched[0] == 1
+        assert sorted(set(fetched)) == sorted(fetched)
+    finally:
+        await client.close()
+
+
+async def test_get_window_position_hint_probes_cursor_page_first() -> None:
+    """An accurate position hint finds the window without a full binary search."""
+    client, requests = make_mock_client(_id_pages(list(range(1, 101)), 10), page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 45, 3, project=_record, position_hint=45)
+        assert [r.id for r in window.records] == [46, 47, 48]
+        assert _pages(requests) == [1, 5]
+
+        # Cursor was the last record of its page: the next page is probed
+        requests.clear()
+        window = await client.get_window("/items", 40, 3, project=_record, position_hint=40)
+        assert [r.id for r in window.records] == [41, 42, 43]
+        assert _pages(requests) == [1, 4, 5]
+    finally:
+        await client.close()
+
+
+async def test_get_window_skips_failing_page_and_keeps_the_rest() -> None:
+    """A page that fails twice in the forward walk is skipped, not fatal."""
+    ids = list(range(1, 31))
+    attempts: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2:
+            attempts.append(page)
+            return httpx.Response(404)
+        records = [{"id": i} for i in ids[(page - 1) * 10 : page * 10]]
+        body = page_body(request, len(ids), records)
+        return httpx.Response(200, json=body)
+
+    client, _ = make_mock_client(handler, page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 8, 5, project=_record)
+        assert [r.id for r in window.records] == [9, 10, 21, 22, 23]
+        assert window.skipped_pages == [2]
+        assert window.partial is True
+        assert attempts == [2, 2]
+
+        # Nothing collected at all: the error is raised
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_window("/items", 10, 5, project=_record, accept=lambda r: r.id < 21)
+    finally:
+        await client.close()
+
+
+async def test_get_window_tunes_page_size_between_windows() -> None:
+    """Fast full pages read by a window grow the page size used by the next one."""
+    ids = list(range(1, 2001))
+    sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page, size = int(request.url.params["page"]), int(request.url.params["pageSize"])
+        sizes.append(size)
+        records = [{"id": i} for i in ids[(page - 1) * size : page * size]]
+        return httpx.Response(200, json=page_body(request, len(ids), records))
+
+    client, _ = make_mock_client(handler)
+    try:
+        for _ in range(3):
+            await client.get_window("/items", None, 200, project=_record)
+        assert sizes[0] == 50
+        assert client._page_sizes.size_for("/items") > 50
+        assert sizes[-1] > 50
+    finally:
+        await client.close()
+
+
+async def test_get_window_prefetches_forward_pages() -> None:
+    """A window spanning many pages has several of them in flight at once."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        page = int(request.url.params["page"])
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        records = [{"id": i} for i in range((page - 1) * 10 + 1, page * 10 + 1)]
+        return httpx.Response(200, json=page_body(request, 200, records))
+
+    client, _ = make_mock_client(handler, page_size_min=10, page_size_max=10, page_concurrency=3)
+    try:
+        window = await client.get_window("/items", None, 120, project=_record)
+        assert [r.id for r in window.records] == list(range(1, 121))
+        assert max_in_flight == 3
+    finally:
+        await client.close()
+
+
+async def test_get_window_falls_back_to_whole_list_when_sort_key_ignored() -> None:
+    """Pages that come back in another order are not binary searched."""
+    ids = [7, 3, 9, 1, 5, 8, 2, 6, 4, 10]  # the instance's own order
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        records = [{"id": i} for i in ids[(page - 1) * 3 : page * 3]]
+        return httpx.Response(200, json=page_body(request, len(ids), records, sort_key="title"))
+
+    client, _ = make_mock_client(handler, page_size_min=3, page_size_max=3)
+    try:
+        window = await client.get_window("/items", 4, 3, project=_record, position_hint=4)
+        assert [r.id for r in window.records] == [5, 6, 7]
+        assert window.positions[5] == 5
+        assert window.reached_end is False
+    finally:
+        await client.close()
+
+
+async def test_get_window_stops_fetching_once_full() -> None:
+    """Pages prefetched past a full window are cancelled and nothing further is requested."""
+    requested: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested.append(page)
+        await asyncio.sleep(0.01)
+        records = [{"id": i} for i in range((page - 1) * 2 + 1, page * 2 + 1)]
+        return httpx.Response(200, json=page_body(request, 100, records))
+
+    client, _ = make_mock_client(handler, page_size_min=2, page_size_max=2, page_concurrency=2)
+    try:
+        window = await client.get_window("/items", None, 6, project=_record)
+        await asyncio.sleep(0.05)
+        assert [r.id for r in window.records] == [1, 2, 3, 4, 5, 6]
+        # At most the lookahead (2 x page_concurrency) was requested past page 4
+        assert max(requested) <= 4 + 4
+        assert len(requested) < 50
+    finally:
+        await client.close()
+
+
+async def test_get_window_retries_first_page_and_probes() -> None:
+    """Page 1 and binary-search probes get the same single retry as the walk."""
+    handler = _id_pages(list(range(1, 101)), 10, failures={1: 1, 5: 1})
+    client, requests = make_mock_client(handler, page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 45, 3, project=_record, position_hint=45)
+        assert [r.id for r in window.records] == [46, 47, 48]
+        assert window.skipped_pages == []
+        assert _pages(requests) == [1, 1, 5, 5]
+    finally:
+        await client.close()
+
+
+async def test_get_window_searches_around_a_failing_probe() -> None:
+    """A probe that keeps failing narrows the search instead of aborting it."""
+    handler = _id_pages(list(range(1, 101)), 10, failures={5: -1})
+    client, requests = make_mock_client(handler, page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 45, 3, project=_record, position_hint=45)
+        # Records 46-50 sit on the failed page and are skipped this round
+        assert [r.id for r in window.records] == [51, 52, 53]
+        assert window.skipped_pages == [5]
+        assert _pages(requests).count(5) == 2
+
+        # The cursor page itself is readable: the failed page is never reached
+        window = await client.get_window("/items", 62, 3, project=_record, position_hint=45)
+        assert [r.id for r in window.records] == [63, 64, 65]
+        assert window.skipped_pages == []
+    finally:
+        await client.close()
+
+
+async def test_get_window_reaches_end_of_list() -> None:
+    """A window that runs off the last page is marked as reaching the end."""
+    client, requests = make_mock_client(_id_pages(list(range(1, 26)), 10), page_size_min=10, page_size_max=10)
+    try:
+        window = await client.get_window("/items", 22, 5, project=_record)
+        assert [r.id for r in window.records] == [23, 24, 25]
+        assert window.reached_end is True
+    finally:
+        await client.close()
+
+
+async def test_get_wanted_window_last_searched_sorts_server_side() -> None:
+    """order="last_searched" asks Radarr for lastSearchTime order and reads the head only."""
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v3/system/status":
+            return httpx.Response(200, json={"version": "3.2.2.5080"})
+        seen.append(dict(request.url.params))
+        body = {
+            "page": 1,
+            "pageSize": 50,
+            "sortKey": "movies.lastSearchTime",
+            "totalRecords": 500,
+            "records": [{"id": i, "title": str(i), "monitored": True} for i in (42, 7, 19)],
+        }
+        return httpx.Response(200, json=body)
+
+    client, _ = make_mock_client(handler, RadarrClient)
+    try:
+        window = await client.get_wanted_window("missing", 99, 2, order="last_searched")
+        assert [m.id for m in window.records] == [42, 7]
+        assert window.total_records == 500
+        pages = [params for params in seen if params["pageSize"] != "1"]  # skip the capability probe
+        assert len(pages) == 1
+        assert pages[0]["sortKey"] == "movies.lastSearchTime"
+        assert pages[0]["sortDirection"] == "ascending"
+    finally:
+        await client.close()
+
+
+async def test_get_window_rejects_cursor_without_id_order() -> None:
+    """A keyset cursor only makes sense for id-sorted pages."""
+    client, requests = make_mock_client(_id_pages([1, 2, 3], 10), page_size_min=10, page_size_max=10)
+    try:
+        with pytest.raises(ValueError):
+            await client.get_window("/items", 1, 2, project=_record, sort_key="title")
+    finally:
+        await client.close()
+
+
+@pytest.mark.parametrize("workers", [2, 0])
+async def test_get_window_filters_large_pages_in_decode_pool(workers) -> None:
+    """Large pages are decoded and filtered off the event loop unless decode_workers = 0."""
+    threads: set[str] = set()
+
+    def project(raw: dict) -> MovieRecord:
+        threads.add(threading.current_thread().name)
+        return _record(raw)
+
+    def accept(record: MovieRecord) -> bool:
+        threads.add(threading.current_thread().name)
+        return record.id % 3 == 0
+
+    ids = list(range(1, 1201))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        records = [{"id": i, "title": "x" * 500} for i in ids[(page - 1) * 600 : page * 600]]
+        return httpx.Response(200, json=page_body(request, len(ids), records))
+
+    client, _ = make_mock_client(handler, page_size_min=600, page_size_max=600, decode_workers=workers)
+    try:
+        window = await client.get_window("/items", 10, 250, project=project, accept=accept)
+        assert [r.id for r in window.records] == list(range(12, 760, 3))
+        assert window.positions[759] == 759
+        offloaded = any(name.startswith("fetcharr-decode") for name in threads)
+        assert offloaded is (workers > 0)
+        if not workers:
+            assert threads == {threading.current_thread().name}
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Hedged requests
+# ---------------------------------------------------------------------------
+
+
+def test_hedger_waits_for_samples_then_uses_percentile() -> None:
+    hedger = Hedger(percentile=90.0, budget=1.0, metrics=ClientMetrics())
+    for seconds in range(1, 10):
+        hedger.observe("/items", seconds / 10)
+    assert hedger.delay_for("/items") is None
+    hedger.observe("/items", 1.0)
+    assert hedger.delay_for("/items") == pytest.approx(0.9)
+    assert hedger.delay_for("/other") is None
+
+
+def test_hedger_budget_caps_share_of_hedged_requests() -> None:
+    metrics = ClientMetrics(requests=19)
+    hedger = Hedger(percentile=95.0, budget=0.1, metrics=metrics)
+    assert hedger.try_hedge() is True
+    assert hedger.try_hedge() is False
+    assert metrics.hedges == 1
+
+
+def _delayed_handler(delays: list[float]):
+    """Answer the n-th request after ``delays[n]`` with its call number."""
+    calls = itertools.count(1)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        call = next(calls)
+        await asyncio.sleep(delays[call - 1])
+        return httpx.Response(200, json={"call": call})
+
+    return handler
+
+
+def _prime_hedger(client: ArrClient) -> None:
+    """Teach the client's hedger that GET /items answers in 10 ms."""
+    for _ in range(10):
+        client._hedger.observe(Hedger.key_for("/items", None), 0.01)
+
+
+async def test_slow_get_is_hedged_and_first_answer_wins() -> None:
+    client, requests = make_mock_client(_delayed_handler([5.0, 0.0]), hedge_requests=True, hedge_budget=1.0)
+    _prime_hedger(client)
+    try:
+        started = time.monotonic()
+        response = await client.get("/items")
+        assert time.monotonic() - started < 1.0
+        assert response.json() == {"call": 2}
+        assert len(requests) == 2
+        assert (client.metrics.hedges, client.metrics.hedge_wins) == (1, 1)
+    finally:
+        await client.close()
+
+
+async def test_fast_get_is_not_hedged() -> None:
+    client, requests = make_mock_client(_delayed_handler([0.0, 0.0]), hedge_requests=True, hedge_budget=1.0)
+    _prime_hedger(client)
+    try:
+        assert (await client.get("/items")).json() == {"call": 1}
+        assert len(requests) == 1
+        assert client.metrics.hedges == 0
+    finally:
+        await client.close()
+
+
+async def test_count_probe_latency_does_not_hedge_full_pages() -> None:
+    handler = _delayed_handler([0.0] * 10 + [0.3, 0.0])
+    client, requests = make_mock_client(handler, hedge_requests=True, hedge_budget=1.0)
+    _prime_hedger(client)
+    try:
+        for _ in range(10):
+            await client.get("/items", {"page": 1, "pageSize": 1})
+        assert client._hedger.delay_for(Hedger.key_for("/items", {"pageSize": 1})) is not None
+        assert client._hedger.delay_for(Hedger.key_for("/items", {"pageSize": 50})) is None
+        await client.get("/items", {"page": 1, "pageSize": 50})
+        assert client.metrics.hedges == 0
+    finally:
+        await client.close()
+
+
+def test_hedging_is_off_by_default() -> None:
+    assert ArrClient(base_url="http://test", api_key="key")._hedger is None
+
+
+# ---------------------------------------------------------------------------
+# Health probes
+# ---------------------------------------------------------------------------
+
+
+def test_health_record_tracks_availability_and_down_since() -> None:
+    times = iter(["t1", "t2", "t3"])
+    health = HealthRecord(clock=lambda: next(times))
+    health.record(True, 0.010)
+    health.record(True, 0.030)
+    health.record(False, 5.0)
+    assert health.down is False
+    health.record(False, 5.0)
+    assert health.down is True
+    assert health.down_since == "t1"
+    assert health.availability == 0.5
+    assert health.latency_ms == pytest.approx(20.0)
+    health.record(True, 0.010)
+    assert (health.down, health.down_since) == (False, None)
+
+
+async def test_probe_health_records_result_with_short_timeout() -> None:
+    seen_timeouts: list[dict] = []
+    up = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_timeouts.append(request.extensions["timeout"])
+        if not up:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, json={"version": "4.0.0"})
+
+    client, _ = make_mock_client(handler, health_check_timeout=2.5)
+    try:
+        assert await client.probe_health() is True
+        up = False
+        assert await client.probe_health() is False
+        assert await client.probe_health() is False
+        assert client.health.down is True
+        assert len(seen_timeouts) == 3  # no retries
+        assert seen_timeouts[0]["read"] == 2.5
+    finally:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Backlog counts
+# ---------------------------------------------------------------------------
+
+
+async def test_count_wanted_reads_total_from_one_record_page() -> None:
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v3/system/status":
+            return httpx.Response(500, request=request)
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json=page_body(request, 1234, [{"id": 1}]))
+
+    client, _ = make_mock_client(handler, retry_max_attempts=1)
+    try:
+        assert await client.count_wanted("cutoff") == 1234
+        assert seen == [{"page": "1", "pageSize": "1", "sortKey": "id", "sortDirection": "ascending"}]
+    finally:
+        await client.close()
+
+
+def test_backlog_trend_compares_latest_with_oldest_in_span() -> None:
+    now = [0.0]
+    trend = BacklogTrend(clock=lambda: now[0])
+    trend.record(100, 10)
+    assert trend.change("missing") is None
+    for seconds, missing, cutoff in ((1800, 104, 9), (3000, 107, 9)):
+        now[0] = seconds
+        trend.record(missing, cutoff)
+    assert (trend.change("missing"), trend.change("cutoff")) == (7, -1)
+    assert trend.change("missing", seconds=1500) == 3
+
+
+# ---------------------------------------------------------------------------
+# Capabilities and server-side monitored filter
+# ---------------------------------------------------------------------------
+
+
+def _versioned_handler(version: str | None, *, sorts: bool = True, reject_unmonitored: bool = False):
+    """Fake a Sonarr reporting ``version`` (None = status fails).
+
+    ``sorts=False`` makes the fake ignore ``sortKey``;
+    ``reject_unmonitored=True`` answers ``monitored=false`` with a 400.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v3/system/status":
+            if version is None:
+                return httpx.Response(500, request=request)
+            return httpx.Response(200, json={"version": version})
+        params = request.url.params
+        if reject_unmonitored and params.get("monitored") == "false":
+            return httpx.Response(400, request=request)
+        total = 7 if params.get("monitored") == "false" else 1
+        records = [{"id": 1, "seriesId": 10, "seasonNumber": 1, "monitored": True}]
+        return httpx.Response(200, json=page_body(request, total, records, params["sortKey"] if sorts else "id"))
+
+    return handler
+
+
+async def test_probe_capabilities_on_v4() -> None:
+    client, _ = make_mock_client(_versioned_handler("4.0.1.929"), SonarrClient, retry_max_attempts=1)
+    try:
+        caps = await client.capabilities()
+        assert caps.major == 4
+        assert caps.monitored_filter is True
+        assert caps.supports_sort("episodes.lastSearchTime")
+        assert await client.capabilities() is caps  # cached
+    finally:
+        await client.close()
+
+
+async def test_probe_capabilities_ignored_sort_key_is_unsupported() -> None:
+    handler = _versioned_handler("3.0.10.1567", sorts=False)
+    client, _ = make_mock_client(handler, SonarrClient, retry_max_attempts=1)
+    try:
+        caps = await client.capabilities()
+        assert caps.monitored_filter is False
+        assert caps.sort_keys == frozenset()
+    finally:
+        await client.close()
+
+
+async def test_probe_capabilities_failure_falls_back_to_baseline() -> None:
+    client, requests = make_mock_client(_versioned_handler(None), SonarrClient, retry_max_attempts=1)
+    try:
+        caps = await client.capabilities()
+        assert caps.version is None
+        assert await client.wanted_filter_params() == {}
+        # Not re-probed before the retry interval
+        assert [request.url.path for request in requests].count("/api/v3/system/status") == 1
+    finally:
+        await client.close()
+
+
+async def test_wanted_window_filters_monitored_server_side_on_v4() -> None:
+    client, requests = make_mock_client(_versioned_handler("4.0.1.929"), SonarrClient, retry_max_attempts=1)
+    try:
+        await client.get_wanted_window("missing", None, 5)
+        assert requests[-1].url.params["monitored"] == "true"
+        assert await client.count_unmonitored("missing") == 7
+        assert requests[-1].url.params["monitored"] == "false"
+        assert requests[-1].url.params["pageSize"] == "1"
+        # The listed count uses the same filter as the cycle's window
+        assert await client.count_wanted("missing") == 1
+        assert requests[-1].url.params["monitored"] == "true"
+    finally:
+        await client.close()
+
+
+async def test_count_unmonitored_failure_reports_zero() -> None:
+    handler = _versioned_handler("4.0.1.929", reject_unmonitored=True)
+    client, requests = make_mock_client(handler, SonarrClient, retry_max_attempts=1)
+    try:
+        assert await client.count_unmonitored("missing") == 0
+        assert requests[-1].url.params["monitored"] == "false"
+    finally:
+        await client.close()
+
+
+async def test_wanted_window_keeps_client_side_filter_on_v3() -> None:
+    client, requests = make_mock_client(_versioned_handler("3.0.10.1567"), SonarrClient, retry_max_attempts=1)
+    try:
+        await client.get_wanted_window("missing", None, 5)
+        sent = len(requests)
+        assert "monitored" not in requests[-1].url.params
+        assert await client.count_unmonitored("missing") == 0
+        assert len(requests) == sent
+    finally:
+        await client.close()
+
+
 # ---------------------------------------------------------------------------
 # Async tests: validate_connection
 # ---------------------------------------------------------------------------
@@ -287,7 +1467,7 @@ async def test_validate_connection_connect_error() -> None:
 
 
 async def test_validate_connection_timeout() -> None:
-    """validate_connection returns False on TimeoutException."""
+    """validate_connection returns False on TimeoutException and logs the configured timeouts."""
 
     def handler(request: httpx.Request) -> httpx.Response:
         raise httpx.TimeoutException("timed out")
@@ -295,9 +1475,16 @@ async def test_validate_connection_timeout() -> None:
     transport = httpx.MockTransport(handler)
     client = ArrClient(base_url="http://test", api_key="key")
     client._app_name = "Test"
-    client._client = httpx.AsyncClient(transport=transport, base_url="http://test")
+    client._client = httpx.AsyncClient(
+        transport=transport, base_url="http://test", timeout=httpx.Timeout(20.0, connect=3.0)
+    )
+    sink = io.StringIO()
+    handler_id = logger.add(sink, format="{message}", level="WARNING")
     try:
         result = await client.validate_connection()
         assert result is False
     finally:
+        logger.remove(handler_id)
         await client.close()
+
+    assert "Connection timed out (connect 3.0s, read 20.0s)" in sink.getvalue()
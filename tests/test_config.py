@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import re
+import tomllib
 from pathlib import Path
 
 import pytest
 
-from fetcharr.config import ensure_config, generate_default_config, load_settings
+from fetcharr.config import DEFAULT_CONFIG, ensure_config, generate_default_config, load_settings
 from fetcharr.models.config import ArrConfig
 
 VALID_TOML = """\
@@ -103,6 +105,16 @@ def test_default_config_generation(tmp_path: Path) -> None:
     assert "[sonarr]" in content
 
 
+def test_default_config_documents_app_options_with_their_defaults() -> None:
+    """Uncommenting the template's app options leaves every setting at its default."""
+    data = tomllib.loads(re.sub(r"^# (\w+ = )", r"\1", DEFAULT_CONFIG, flags=re.MULTILINE))
+    for app in ("radarr", "sonarr"):
+        documented = {key: value for key, value in data[app].items() if key not in ("url", "api_key", "enabled")}
+        assert {"retry_max_delay", "pool_max_keepalive", "hedge_budget"} <= documented.keys()
+        for key, value in documented.items():
+            assert value == ArrConfig.model_fields[key].default, key
+
+
 def test_api_key_never_in_str() -> None:
     """API key value must not appear in str(), repr(), or model_dump_json()."""
     secret = "super-secret-api-key-value"
@@ -126,3 +138,9 @@ def test_ensure_config_exits_on_missing(tmp_path: Path) -> None:
     content = config_file.read_text()
     assert "[radarr]" in content
     assert "[sonarr]" in content
+
+
+def test_page_size_bounds_must_be_ordered() -> None:
+    """page_size_min greater than page_size_max is rejected."""
+    with pytest.raises(ValueError, match="page_size_min"):
+        ArrConfig(page_size_min=500, page_size_max=100)
@@ -8,7 +8,14 @@ from __future__ import annotations
 
 import aiosqlite
 
-from fetcharr.db import get_recent_searches, get_search_history, init_db, insert_search_entry, migrate_from_state
+from fetcharr.db import (
+    get_recent_searches,
+    get_search_history,
+    init_db,
+    insert_search_entries,
+    insert_search_entry,
+    migrate_from_state,
+)
 
 
 async def test_init_db_creates_table(tmp_path):
@@ -49,6 +56,33 @@ async def test_insert_and_retrieve(tmp_path):
         assert "queue_type" in entry
 
 
+async def test_insert_search_entries_batch(tmp_path):
+    """A batch insert keeps order, outcomes and supplied timestamps."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    await insert_search_entries(
+        db_path,
+        [
+            {"app": "Radarr", "queue_type": "missing", "name": "Movie A", "outcome": "searched", "detail": ""},
+            {
+                "timestamp": "2026-01-01T00:00:00Z",
+                "app": "Radarr",
+                "queue_type": "missing",
+                "name": "Movie B",
+                "outcome": "failed",
+                "detail": "boom",
+            },
+        ],
+    )
+    await insert_search_entries(db_path, [])
+
+    results = await get_recent_searches(db_path)
+    assert [(r["name"], r["outcome"]) for r in results] == [("Movie B", "failed"), ("Movie A", "searched")]
+    assert results[0]["timestamp"] == "2026-01-01T00:00:00Z"
+    assert results[0]["detail"] == "boom"
+
+
 async def test_get_recent_searches_limit(tmp_path):
     """get_recent_searches respects the limit parameter."""
     db_path = tmp_path / "test.db"
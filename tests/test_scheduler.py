@@ -1,6 +1,8 @@
-"""Tests for the scheduler job factory (make_search_job).
+"""Tests for the scheduler job factories (make_search_job, make_health_job).
 
-Covers: client-None early return and unhandled exception swallowing.
+Covers: client-None early return, unhandled exception swallowing,
+health and backlog count probe state updates, and the capability probe
+when the lifespan creates its clients.
 """
 
 from __future__ import annotations
@@ -11,7 +13,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import FastAPI
 
-from fetcharr.search.scheduler import make_search_job
+from fetcharr.clients.backlog import BacklogTrend
+from fetcharr.clients.health import HealthRecord
+from fetcharr.search.scheduler import create_lifespan, make_count_job, make_health_job, make_search_job
 from fetcharr.state import _default_state
 from tests.conftest import make_settings
 
@@ -48,3 +52,72 @@ async def test_make_search_job_exception_swallowed():
         job = make_search_job(app, "radarr", Path("/tmp/state.json"))
         # Should NOT raise -- exception is caught internally
         await job()
+
+
+async def test_make_health_job_tracks_reachability():
+    """Health job marks the app unreachable once down and connected again on recovery."""
+    app = FastAPI()
+    client = MagicMock()
+    client.health = HealthRecord(clock=lambda: "2026-01-01T00:00:00Z")
+    answers = [False, False, True]
+
+    async def probe_health() -> bool:
+        ok = answers.pop(0)
+        client.health.record(ok, 0.01)
+        return ok
+
+    client.probe_health = probe_health
+    app.state.radarr_client = client
+    app.state.fetcharr_state = _default_state()
+    job = make_health_job(app, "radarr")
+
+    await job()
+    assert app.state.fetcharr_state["radarr"].get("connected") is None  # one miss is not down yet
+    await job()
+    assert app.state.fetcharr_state["radarr"]["connected"] is False
+    assert app.state.fetcharr_state["radarr"]["unreachable_since"] == "2026-01-01T00:00:00Z"
+    await job()
+    assert app.state.fetcharr_state["radarr"]["connected"] is True
+    assert app.state.fetcharr_state["radarr"]["unreachable_since"] is None
+
+
+async def test_make_count_job_refreshes_backlog_counts():
+    """Count job stores listed and raw totals and samples the trend; it is idle while the app is down."""
+    app = FastAPI()
+    client = MagicMock()
+    client.health = HealthRecord()
+    client.backlog = BacklogTrend()
+    client.count_wanted = AsyncMock(side_effect=lambda queue: {"missing": 40, "cutoff": 6}[queue])
+    client.count_unmonitored = AsyncMock(side_effect=lambda queue: {"missing": 3, "cutoff": 0}[queue])
+    app.state.radarr_client = client
+    app.state.fetcharr_state = _default_state()
+    job = make_count_job(app, "radarr")
+
+    await job()
+    assert app.state.fetcharr_state["radarr"]["missing_listed"] == 40
+    assert app.state.fetcharr_state["radarr"]["missing_count"] == 43
+    assert app.state.fetcharr_state["radarr"]["cutoff_listed"] == 6
+    assert app.state.fetcharr_state["radarr"]["cutoff_count"] == 6
+    assert len(client.backlog._samples) == 1
+
+    client.health.record(False, 5.0)
+    client.health.record(False, 5.0)
+    client.count_wanted.reset_mock()
+    await job()
+    client.count_wanted.assert_not_awaited()
+
+
+async def test_lifespan_probes_capabilities_of_long_lived_clients(tmp_path):
+    """Each enabled app's capabilities are probed (and cached) when its client is created."""
+    clients = {name: AsyncMock() for name in ("radarr", "sonarr")}
+    app = FastAPI()
+    lifespan = create_lifespan(make_settings(), tmp_path / "state.json", tmp_path / "fetcharr.toml")
+
+    with (
+        patch("fetcharr.search.scheduler.RadarrClient", return_value=clients["radarr"]),
+        patch("fetcharr.search.scheduler.SonarrClient", return_value=clients["sonarr"]),
+        patch("fetcharr.search.scheduler.AsyncIOScheduler", return_value=MagicMock()),
+    ):
+        async with lifespan(app):
+            for client in clients.values():
+                client.capabilities.assert_awaited_once()
@@ -1,185 +1,164 @@
 """Comprehensive tests for search engine utility functions and cycle orchestrators.
 
-Tests cover: filtering (monitored, air dates), batch slicing (normal,
-wrap, empty, past-end cursor), deduplication (collapse, order, display
-name, fallback), Sonarr-specific filtering (unmonitored, future, null,
-past, malformed), async cycle orchestration (happy path, network
-failure, per-item skip, cursor advancement) for both run_radarr_cycle
-and run_sonarr_cycle, and per-cycle diagnostic summary logging.
+Tests cover: chunking, Sonarr search planning, Sonarr episode
+searchability (unmonitored, future, null, past, malformed), async cycle
+orchestration (happy path, network failure, per-item skip, cursor
+advancement) for both run_radarr_cycle and run_sonarr_cycle, and
+per-cycle diagnostic summary logging.
 """
 
 from __future__ import annotations
 
+import asyncio
 import io
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import httpx
 from loguru import logger
 
+from fetcharr.clients.backlog import BacklogTrend
+from fetcharr.clients.capabilities import ApiCapabilities
+from fetcharr.clients.health import HealthRecord
+from fetcharr.clients.keyset import window_from_records
+from fetcharr.clients.metrics import ClientMetrics
 from fetcharr.db import init_db
+from fetcharr.models.arr import CommandResource, EpisodeRecord, MovieRecord, SeriesInfo
+from fetcharr.search.backpressure import CommandQueueGate, command_targets
+from fetcharr.search.dispatch import SearchDispatcher, TokenBucket
 from fetcharr.search.engine import (
+    advance_keyset,
     cap_batch_sizes,
-    deduplicate_to_seasons,
-    filter_monitored,
-    filter_sonarr_episodes,
+    chunk_items,
+    is_searchable_episode,
+    plan_sonarr_searches,
     run_radarr_cycle,
     run_sonarr_cycle,
-    slice_batch,
 )
 from fetcharr.state import _default_state
 from tests.conftest import make_settings
 
 # ---------------------------------------------------------------------------
-# filter_monitored
+# chunk_items
 # ---------------------------------------------------------------------------
 
 
-def test_filter_monitored_keeps_only_monitored():
-    items = [
-        {"id": 1, "monitored": True},
-        {"id": 2, "monitored": False},
-        {"id": 3},  # missing key
-        {"id": 4, "monitored": True},
-    ]
-    result = filter_monitored(items)
-    assert len(result) == 2
-    assert result[0]["id"] == 1
-    assert result[1]["id"] == 4
+def test_chunk_items_fixed_size():
+    assert chunk_items([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
 
 
-def test_filter_monitored_empty_list():
-    assert filter_monitored([]) == []
+def test_chunk_items_zero_means_single_chunk():
+    assert chunk_items([1, 2, 3], 0) == [[1, 2, 3]]
+    assert chunk_items([], 0) == []
 
 
 # ---------------------------------------------------------------------------
-# slice_batch
+# plan_sonarr_searches
 # ---------------------------------------------------------------------------
 
 
-def test_slice_batch_normal():
-    items = list(range(10))
-    batch, new_cursor = slice_batch(items, cursor=3, batch_size=2)
-    assert batch == [3, 4]
-    assert new_cursor == 5
-
-
-def test_slice_batch_wraps_at_end():
-    items = list(range(5))
-    batch, new_cursor = slice_batch(items, cursor=3, batch_size=3)
-    assert batch == [3, 4]
-    assert new_cursor == 0
-
-
-def test_slice_batch_cursor_past_end():
-    items = list(range(5))
-    batch, new_cursor = slice_batch(items, cursor=99, batch_size=2)
-    assert batch == [0, 1]
-    assert new_cursor == 2
+def _ep(series_id: int, season_number: int, episode_id: int = 1) -> EpisodeRecord:
+    """Build a minimal monitored, aired EpisodeRecord."""
+    return EpisodeRecord(
+        id=episode_id,
+        series_id=series_id,
+        season_number=season_number,
+        monitored=True,
+        air_date_utc="2020-01-01T00:00:00Z",
+    )
 
 
-def test_slice_batch_empty_list():
-    batch, new_cursor = slice_batch([], cursor=0, batch_size=5)
-    assert batch == []
-    assert new_cursor == 0
+def test_plan_few_missing_uses_episode_search():
+    """One of ten episodes missing -> EpisodeSearch for just that episode."""
+    series = {1: SeriesInfo(title="Show A", season_episode_counts={1: 10, 2: 10})}
+    commands = plan_sonarr_searches([_ep(1, 1, episode_id=5)], series)
+    assert len(commands) == 1
+    assert commands[0]["command"] == "EpisodeSearch"
+    assert commands[0]["episodeIds"] == [5]
+    assert commands[0]["display_name"] == "Show A - Season 1 (1 episode)"
 
 
-def test_slice_batch_batch_larger_than_remaining():
-    items = list(range(3))
-    batch, new_cursor = slice_batch(items, cursor=1, batch_size=10)
-    assert batch == [1, 2]
-    assert new_cursor == 0
+def test_plan_most_of_season_uses_season_search():
+    series = {1: SeriesInfo(title="Show A", season_episode_counts={1: 4, 2: 10})}
+    episodes = [_ep(1, 1, episode_id=i) for i in range(1, 4)]
+    commands = plan_sonarr_searches(episodes, series, season_threshold=0.5)
+    assert [c["command"] for c in commands] == ["SeasonSearch"]
+    assert commands[0]["seasonNumber"] == 1
+    assert commands[0]["display_name"] == "Show A - Season 1"
 
 
-# ---------------------------------------------------------------------------
-# deduplicate_to_seasons
-# ---------------------------------------------------------------------------
+def test_plan_most_of_series_uses_one_series_search():
+    series = {1: SeriesInfo(title="Show A", season_episode_counts={1: 2, 2: 2})}
+    episodes = [_ep(1, 1, 1), _ep(1, 2, 2), _ep(1, 1, 3), _ep(1, 2, 4)]
+    commands = plan_sonarr_searches(episodes, series, series_threshold=0.75)
+    assert len(commands) == 1
+    assert commands[0]["command"] == "SeriesSearch"
+    assert commands[0]["seasonNumber"] is None
+    assert commands[0]["display_name"] == "Show A - All seasons"
 
 
-def test_deduplicate_to_seasons_removes_duplicates():
-    episodes = [
-        {"seriesId": 1, "seasonNumber": 2, "series": {"title": "Show A"}},
-        {"seriesId": 1, "seasonNumber": 2, "series": {"title": "Show A"}},
-        {"seriesId": 1, "seasonNumber": 3, "series": {"title": "Show A"}},
-    ]
-    result = deduplicate_to_seasons(episodes)
-    assert len(result) == 2
-    assert result[0]["seasonNumber"] == 2
-    assert result[1]["seasonNumber"] == 3
+def test_plan_single_season_series_prefers_season_search():
+    """A fully missing one-season series stays a SeasonSearch."""
+    series = {1: SeriesInfo(title="Show A", season_episode_counts={1: 2})}
+    commands = plan_sonarr_searches([_ep(1, 1, 1), _ep(1, 1, 2)], series)
+    assert [c["command"] for c in commands] == ["SeasonSearch"]
 
 
-def test_deduplicate_to_seasons_preserves_order():
-    episodes = [
-        {"seriesId": 2, "seasonNumber": 1, "series": {"title": "Show B"}},
-        {"seriesId": 1, "seasonNumber": 3, "series": {"title": "Show A"}},
-        {"seriesId": 2, "seasonNumber": 1, "series": {"title": "Show B"}},
-    ]
-    result = deduplicate_to_seasons(episodes)
-    assert len(result) == 2
-    assert result[0]["seriesId"] == 2
-    assert result[1]["seriesId"] == 1
-
+def test_plan_unknown_counts_fall_back_to_season_search():
+    """Without statistics (or an unknown series) each season is a SeasonSearch."""
+    commands = plan_sonarr_searches(
+        [_ep(1, 1, 1), _ep(2, 3, 2)], {1: SeriesInfo(title="Show A")}
+    )
+    assert [c["command"] for c in commands] == ["SeasonSearch", "SeasonSearch"]
+    assert commands[1]["display_name"] == "Series 2 - Season 3"
 
-def test_deduplicate_to_seasons_display_name_format():
-    episodes = [
-        {"seriesId": 5, "seasonNumber": 3, "series": {"title": "Breaking Bad"}},
-    ]
-    result = deduplicate_to_seasons(episodes)
-    assert result[0]["display_name"] == "Breaking Bad - Season 3"
 
-
-def test_deduplicate_to_seasons_missing_series_data():
-    episodes = [
-        {"seriesId": 42, "seasonNumber": 1},
-    ]
-    result = deduplicate_to_seasons(episodes)
-    assert result[0]["display_name"] == "Series 42 - Season 1"
+def test_plan_zero_season_threshold_always_season_search():
+    series = {1: SeriesInfo(title="Show A", season_episode_counts={1: 100, 2: 100})}
+    commands = plan_sonarr_searches([_ep(1, 1, 1)], series, season_threshold=0.0)
+    assert [c["command"] for c in commands] == ["SeasonSearch"]
 
 
 # ---------------------------------------------------------------------------
-# filter_sonarr_episodes
+# is_searchable_episode
 # ---------------------------------------------------------------------------
 
 
 def _make_episode(
     monitored: bool = True,
     air_date_utc: str | None = "2020-01-01T00:00:00Z",
-) -> dict:
-    """Helper to build a Sonarr episode dict."""
-    ep: dict = {"monitored": monitored, "seriesId": 1, "seasonNumber": 1}
-    if air_date_utc is not None:
-        ep["airDateUtc"] = air_date_utc
-    return ep
+) -> EpisodeRecord:
+    """Helper to build a Sonarr episode record."""
+    return EpisodeRecord(
+        id=1,
+        series_id=1,
+        season_number=1,
+        monitored=monitored,
+        air_date_utc=air_date_utc,
+    )
 
 
-def test_filter_sonarr_episodes_excludes_unmonitored():
-    episodes = [_make_episode(monitored=False)]
-    assert filter_sonarr_episodes(episodes) == []
+def test_is_searchable_episode_excludes_unmonitored():
+    assert is_searchable_episode(_make_episode(monitored=False)) is False
 
 
-def test_filter_sonarr_episodes_excludes_future_air_date():
+def test_is_searchable_episode_excludes_future_air_date():
     future = (datetime.now(UTC) + timedelta(days=30)).isoformat().replace("+00:00", "Z")
-    episodes = [_make_episode(air_date_utc=future)]
-    assert filter_sonarr_episodes(episodes) == []
+    assert is_searchable_episode(_make_episode(air_date_utc=future)) is False
 
 
-def test_filter_sonarr_episodes_excludes_null_air_date():
-    ep = _make_episode()
-    del ep["airDateUtc"]  # simulate missing / TBA
-    assert filter_sonarr_episodes([ep]) == []
+def test_is_searchable_episode_excludes_null_air_date():
+    ep = _make_episode(air_date_utc=None)  # simulate missing / TBA
+    assert is_searchable_episode(ep) is False
 
 
-def test_filter_sonarr_episodes_keeps_past_monitored():
-    episodes = [_make_episode(monitored=True, air_date_utc="2020-06-15T12:00:00Z")]
-    result = filter_sonarr_episodes(episodes)
-    assert len(result) == 1
-    assert result[0]["airDateUtc"] == "2020-06-15T12:00:00Z"
+def test_is_searchable_episode_keeps_past_monitored():
+    ep = _make_episode(monitored=True, air_date_utc="2020-06-15T12:00:00Z")
+    assert is_searchable_episode(ep) is True
 
 
-def test_filter_sonarr_episodes_handles_unparseable_date():
-    episodes = [_make_episode(air_date_utc="not-a-date")]
-    result = filter_sonarr_episodes(episodes)
-    assert result == []
+def test_is_searchable_episode_handles_unparseable_date():
+    assert is_searchable_episode(_make_episode(air_date_utc="not-a-date")) is False
 
 
 # ---------------------------------------------------------------------------
@@ -187,6 +166,37 @@ def test_filter_sonarr_episodes_handles_unparseable_date():
 # ---------------------------------------------------------------------------
 
 
+# Capabilities of a current instance that supports every strategy
+FULL_CAPABILITIES = ApiCapabilities(
+    version="4.0.0",
+    monitored_filter=True,
+    sort_keys=frozenset({"movies.lastSearchTime", "episodes.lastSearchTime"}),
+)
+
+
+def _wanted_client() -> AsyncMock:
+    """Build a mock *arr client for cycle tests.
+
+    Windowed wanted-list reads are served from the full lists the test
+    assigns to ``wanted_missing`` / ``wanted_cutoff``, selected with the
+    same rules the real client uses.
+    """
+    client = AsyncMock()
+
+    async def get_wanted_window(queue, after_id, size, *, position_hint=0, order="id", **options):
+        fetch = client.wanted_missing if queue == "missing" else client.wanted_cutoff
+        return window_from_records(await fetch(), after_id, size, **options)
+
+    client.get_wanted_window = AsyncMock(side_effect=get_wanted_window)
+    client.count_unmonitored = AsyncMock(return_value=0)
+    client.capabilities = AsyncMock(return_value=FULL_CAPABILITIES)
+    client.LAST_SEARCH_SORT_KEY = "movies.lastSearchTime"
+    client.metrics = ClientMetrics()
+    client.health = HealthRecord()
+    client.backlog = BacklogTrend()
+    return client
+
+
 def _cycle_settings(missing_count: int = 2, cutoff_count: int = 2):
     """Build Settings tuned for predictable batching in cycle tests."""
     return make_settings(
@@ -199,14 +209,14 @@ async def test_run_radarr_cycle_happy_path(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         return_value=[
-            {"id": 1, "title": "Movie A", "monitored": True},
-            {"id": 2, "title": "Movie B", "monitored": True},
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
         ]
     )
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_movies = AsyncMock()
 
     state = _default_state()
@@ -225,12 +235,188 @@ async def test_run_radarr_cycle_happy_path(tmp_path):
     assert result["radarr"]["missing_cursor"] == 0
 
 
+async def test_run_radarr_cycle_batches_movies_per_command(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
+        return_value=[MovieRecord(id=i, title=f"Movie {i}", monitored=True) for i in range(1, 6)]
+    )
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.search_movies = AsyncMock(side_effect=[None, Exception("boom"), None])
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=5, cutoff_count=0)
+    settings.radarr.movies_per_command = 2
+
+    await run_radarr_cycle(client, state, settings, db_path)
+
+    assert [call.args[0] for call in client.search_movies.call_args_list] == [[1, 2], [3, 4], [5]]
+    from fetcharr.db import get_recent_searches
+
+    searches = await get_recent_searches(db_path)
+    outcomes = {entry["name"]: entry["outcome"] for entry in searches}
+    assert outcomes == {
+        "Movie 1": "searched",
+        "Movie 2": "searched",
+        "Movie 3": "failed",
+        "Movie 4": "failed",
+        "Movie 5": "searched",
+    }
+
+
+async def test_run_radarr_cycle_fetches_queues_concurrently(tmp_path):
+    """The cutoff fetch starts before the missing fetch has finished."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+    cutoff_started = asyncio.Event()
+
+    async def get_missing():
+        await asyncio.wait_for(cutoff_started.wait(), timeout=1)
+        return [MovieRecord(id=1, title="Movie A", monitored=True)]
+
+    async def get_cutoff():
+        cutoff_started.set()
+        return []
+
+    client = _wanted_client()
+    client.wanted_missing = get_missing
+    client.wanted_cutoff = get_cutoff
+
+    result = await run_radarr_cycle(client, _default_state(), _cycle_settings(), db_path)
+
+    assert result["radarr"]["connected"] is True
+    client.search_movies.assert_awaited_once_with([1])
+
+
+async def test_run_radarr_cycle_failed_fetch_cancels_other(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+    cancelled = asyncio.Event()
+
+    async def get_missing():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client = _wanted_client()
+    client.wanted_missing = get_missing
+    client.wanted_cutoff = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+    state = _default_state()
+    state["radarr"]["missing_cursor"] = 3
+    result = await run_radarr_cycle(client, state, _cycle_settings(), db_path)
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
+    assert result["radarr"]["connected"] is False
+    assert result["radarr"]["missing_cursor"] == 3
+    client.search_movies.assert_not_awaited()
+
+
+async def test_run_radarr_cycle_dispatches_missing_before_cutoff_fetched(tmp_path):
+    """The missing batch is searched while the cutoff window is still loading."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+    missing_searched = asyncio.Event()
+
+    async def get_cutoff():
+        await asyncio.wait_for(missing_searched.wait(), timeout=1)
+        return [MovieRecord(id=9, title="Movie Z", monitored=True)]
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=[MovieRecord(id=1, title="Movie A", monitored=True)])
+    client.wanted_cutoff = get_cutoff
+    client.search_movies = AsyncMock(side_effect=lambda ids: missing_searched.set())
+
+    result = await run_radarr_cycle(client, _default_state(), _cycle_settings(), db_path)
+
+    assert result["radarr"]["connected"] is True
+    assert [call.args[0] for call in client.search_movies.call_args_list] == [[1], [9]]
+
+
+async def test_run_radarr_cycle_cutoff_failure_keeps_dispatched_missing(tmp_path):
+    """A cutoff fetch failing after the missing batch went out only keeps the cutoff cursor."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+    missing_searched = asyncio.Event()
+
+    async def get_cutoff():
+        await missing_searched.wait()
+        raise httpx.ConnectError("refused")
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(1, 2, 3))
+    client.wanted_cutoff = get_cutoff
+    client.search_movies = AsyncMock(side_effect=lambda ids: missing_searched.set())
+
+    state = _default_state()
+    state["radarr"]["cutoff_last_id"] = 7
+    result = await run_radarr_cycle(client, state, _cycle_settings(missing_count=2), db_path)
+
+    assert result["radarr"]["connected"] is False
+    assert result["radarr"]["missing_last_id"] == 2
+    assert result["radarr"]["cutoff_last_id"] == 7
+
+
+async def test_run_radarr_cycle_goes_ahead_on_partial_window(tmp_path):
+    """Skipped pages still dispatch the rest and are flagged in state and summary."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(1, 2))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    window_for = client.get_wanted_window.side_effect
+
+    async def partial_window(queue, *args, **kwargs):
+        window = await window_for(queue, *args, **kwargs)
+        if queue == "missing":
+            window.skipped_pages = [3]
+        return window
+
+    client.get_wanted_window.side_effect = partial_window
+
+    sink = io.StringIO()
+    handler_id = logger.add(sink, format="{message}", level="INFO")
+    try:
+        result = await run_radarr_cycle(client, _default_state(), _cycle_settings(), db_path)
+    finally:
+        logger.remove(handler_id)
+
+    assert result["radarr"]["connected"] is True
+    assert result["radarr"]["skipped_pages"] == 1
+    assert client.search_movies.await_count == 2
+    assert "partial list, 1 page(s) skipped" in sink.getvalue()
+
+
+async def test_run_radarr_cycle_skips_fetch_while_known_down(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.health.record(False, 5.0)
+    client.health.record(False, 5.0)
+
+    state = _default_state()
+    state["radarr"]["missing_cursor"] = 4
+    result = await run_radarr_cycle(client, state, _cycle_settings(), db_path)
+
+    client.get_wanted_window.assert_not_awaited()
+    client.capabilities.assert_not_awaited()
+    assert result["radarr"]["missing_cursor"] == 4
+    assert result["radarr"]["last_run"] is None
+
+
 async def test_run_radarr_cycle_network_failure(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         side_effect=httpx.ConnectError("refused")
     )
 
@@ -250,14 +436,14 @@ async def test_run_radarr_cycle_per_item_skip(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         return_value=[
-            {"id": 1, "title": "Movie A", "monitored": True},
-            {"id": 2, "title": "Movie B", "monitored": True},
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
         ]
     )
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_cutoff = AsyncMock(return_value=[])
     # First search raises, second succeeds
     client.search_movies = AsyncMock(
         side_effect=[Exception("boom"), None]
@@ -287,16 +473,16 @@ async def test_run_radarr_cycle_cursor_advancement(tmp_path):
     await init_db(db_path)
 
     movies = [
-        {"id": i, "title": f"Movie {i}", "monitored": True}
+        MovieRecord(id=i, title=f"Movie {i}", monitored=True)
         for i in range(1, 6)
     ]
 
     settings = _cycle_settings(missing_count=2, cutoff_count=2)
 
     # --- Run 1: cursor 0 -> 2 ---
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=movies)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=movies)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_movies = AsyncMock()
 
     state = _default_state()
@@ -304,22 +490,25 @@ async def test_run_radarr_cycle_cursor_advancement(tmp_path):
 
     result = await run_radarr_cycle(client, state, settings, db_path)
     assert result["radarr"]["missing_cursor"] == 2
+    assert result["radarr"]["missing_last_id"] == 2
 
     # --- Run 2: cursor 2 -> 4 ---
-    client.get_wanted_missing = AsyncMock(return_value=movies)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_missing = AsyncMock(return_value=movies)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_movies = AsyncMock()
 
     result = await run_radarr_cycle(client, result, settings, db_path)
     assert result["radarr"]["missing_cursor"] == 4
+    assert result["radarr"]["missing_last_id"] == 4
 
     # --- Run 3: cursor 4 -> wraps to 0 (only 1 item left, then wraps) ---
-    client.get_wanted_missing = AsyncMock(return_value=movies)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_missing = AsyncMock(return_value=movies)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_movies = AsyncMock()
 
     result = await run_radarr_cycle(client, result, settings, db_path)
     assert result["radarr"]["missing_cursor"] == 0
+    assert result["radarr"]["missing_last_id"] is None
 
 
 # ---------------------------------------------------------------------------
@@ -330,18 +519,15 @@ async def test_run_radarr_cycle_cursor_advancement(tmp_path):
 def _make_sonarr_episode(
     series_id: int,
     season_number: int,
-    series_title: str = "Show",
     episode_id: int = 1,
-) -> dict:
-    """Build a Sonarr episode dict suitable for cycle tests."""
-    return {
-        "id": episode_id,
-        "seriesId": series_id,
-        "seasonNumber": season_number,
-        "monitored": True,
-        "airDateUtc": "2020-01-01T00:00:00Z",
-        "series": {"title": series_title},
-    }
+) -> EpisodeRecord:
+    """Build a Sonarr episode record suitable for cycle tests."""
+    return _ep(series_id, season_number, episode_id)
+
+
+# Series cache contents served by the mocked ``get_series`` (no statistics,
+# so every wanted season is planned as a SeasonSearch)
+SERIES = {10: SeriesInfo(title="Show A"), 20: SeriesInfo(title="Show B")}
 
 
 async def test_run_sonarr_cycle_happy_path(tmp_path):
@@ -349,14 +535,15 @@ async def test_run_sonarr_cycle_happy_path(tmp_path):
     await init_db(db_path)
 
     episodes = [
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show A", episode_id=100),
-        _make_sonarr_episode(series_id=10, season_number=2, series_title="Show A", episode_id=101),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        _make_sonarr_episode(series_id=10, season_number=2, episode_id=101),
     ]
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_season = AsyncMock()
+    client.get_series = AsyncMock(return_value=SERIES)
 
     state = _default_state()
     settings = _cycle_settings(missing_count=2, cutoff_count=2)
@@ -371,12 +558,114 @@ async def test_run_sonarr_cycle_happy_path(tmp_path):
     assert result["sonarr"]["last_run"] is not None
 
 
+async def test_run_sonarr_cycle_dispatches_planned_commands(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    episodes = [
+        # One of ten episodes of Show A season 1 -> EpisodeSearch
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        # All of Show B across two seasons -> SeriesSearch
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
+        _make_sonarr_episode(series_id=20, season_number=2, episode_id=201),
+    ]
+    series = {
+        10: SeriesInfo(title="Show A", season_episode_counts={1: 10}),
+        20: SeriesInfo(title="Show B", season_episode_counts={1: 1, 2: 1}),
+    }
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.get_series = AsyncMock(return_value=series)
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=5, cutoff_count=0)
+
+    await run_sonarr_cycle(client, state, settings, db_path)
+
+    client.search_episodes.assert_awaited_once_with([100])
+    client.search_series.assert_awaited_once_with(20)
+    client.search_season.assert_not_awaited()
+
+
+async def test_run_sonarr_cycle_searches_each_season_once_per_round(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    # Show A season 1 has scattered ids, so it shows up in two windows
+    episodes = [
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=300),
+    ]
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.search_season = AsyncMock()
+    client.get_series = AsyncMock(return_value=SERIES)
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=1, cutoff_count=0)
+
+    for _ in range(3):
+        state = await run_sonarr_cycle(client, state, settings, db_path)
+
+    assert [call.args for call in client.search_season.await_args_list] == [(10, 1), (20, 1)]
+    # The repeat is skipped but still passed by the cursor
+    assert state["sonarr"]["missing_last_id"] is None
+    from fetcharr.db import get_recent_searches
+
+    searches = await get_recent_searches(db_path)
+    assert searches[0]["outcome"] == "skipped"
+    assert "already searched this round" in searches[0]["detail"]
+
+    # The next round starts with a clean slate
+    state = await run_sonarr_cycle(client, state, settings, db_path)
+    assert client.search_season.await_args_list[-1].args == (10, 1)
+    assert state["sonarr"]["missing_searched_seasons"] == [[10, 1]]
+
+
+async def test_run_sonarr_cycle_series_search_covers_later_seasons(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    episodes = [
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
+        _make_sonarr_episode(series_id=20, season_number=2, episode_id=201),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=250),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=300),
+    ]
+    series = {
+        10: SeriesInfo(title="Show A", season_episode_counts={1: 1}),
+        20: SeriesInfo(title="Show B", season_episode_counts={1: 2, 2: 1}),
+    }
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.get_series = AsyncMock(return_value=series)
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+    # Two of Show B's three wanted episodes fall in the first window
+    settings.sonarr.series_search_threshold = 0.5
+
+    state = await run_sonarr_cycle(client, state, settings, db_path)
+    state = await run_sonarr_cycle(client, state, settings, db_path)
+
+    client.search_series.assert_awaited_once_with(20)
+    client.search_season.assert_awaited_once_with(10, 1)
+    client.search_episodes.assert_not_awaited()
+
+
 async def test_run_sonarr_cycle_network_failure(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         side_effect=httpx.ConnectError("refused")
     )
 
@@ -397,17 +686,18 @@ async def test_run_sonarr_cycle_per_item_skip(tmp_path):
 
     # Two episodes from different series -> 2 unique seasons after dedup
     episodes = [
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show A", episode_id=100),
-        _make_sonarr_episode(series_id=20, season_number=1, series_title="Show B", episode_id=200),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
     ]
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     # First season search raises, second succeeds
     client.search_season = AsyncMock(
         side_effect=[Exception("boom"), None]
     )
+    client.get_series = AsyncMock(return_value=SERIES)
 
     state = _default_state()
     settings = _cycle_settings(missing_count=2, cutoff_count=2)
@@ -433,19 +723,20 @@ async def test_run_sonarr_cycle_cursor_advancement(tmp_path):
 
     # 4 episodes that deduplicate to 3 seasons
     episodes = [
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show A", episode_id=100),
-        _make_sonarr_episode(series_id=10, season_number=2, series_title="Show A", episode_id=101),
-        _make_sonarr_episode(series_id=20, season_number=1, series_title="Show B", episode_id=200),
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show A", episode_id=102),  # dup
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        _make_sonarr_episode(series_id=10, season_number=2, episode_id=101),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=102),  # dup
     ]
 
     settings = _cycle_settings(missing_count=2, cutoff_count=2)
 
     # --- Run 1: cursor 0 -> 2 ---
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_season = AsyncMock()
+    client.get_series = AsyncMock(return_value=SERIES)
 
     state = _default_state()
     state["sonarr"]["missing_cursor"] = 0
@@ -454,9 +745,10 @@ async def test_run_sonarr_cycle_cursor_advancement(tmp_path):
     assert result["sonarr"]["missing_cursor"] == 2
 
     # --- Run 2: cursor 2 -> wraps to 0 (only 1 season left) ---
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_season = AsyncMock()
+    client.get_series = AsyncMock(return_value=SERIES)
 
     result = await run_sonarr_cycle(client, result, settings, db_path)
     assert result["sonarr"]["missing_cursor"] == 0
@@ -507,6 +799,157 @@ def test_cap_batch_sizes_very_small_max():
     assert cap_batch_sizes(1, 1, 1) == (0, 1)
 
 
+# ---------------------------------------------------------------------------
+# Keyset cursor
+# ---------------------------------------------------------------------------
+
+
+def _movies(*ids: int, unmonitored: tuple[int, ...] = ()) -> list[MovieRecord]:
+    return [MovieRecord(id=i, title=f"Movie {i}", monitored=i not in unmonitored) for i in ids]
+
+
+def test_window_from_records_starts_after_cursor():
+    window = window_from_records(_movies(1, 3, 5, 7, 9), after_id=3, size=2)
+    assert [m.id for m in window.records] == [5, 7]
+    assert window.positions == {5: 3, 7: 4}
+    assert window.total_records == 5
+    assert window.reached_end is False
+
+
+def test_window_from_records_skips_rejected_records():
+    window = window_from_records(
+        _movies(1, 2, 3, 4, unmonitored=(2,)),
+        after_id=None,
+        size=2,
+        accept=lambda m: m.monitored,
+    )
+    assert [m.id for m in window.records] == [1, 3]
+    assert window.positions[3] == 3
+
+
+def test_window_from_records_groups_count_once():
+    episodes = [
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=1),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=2),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=3),
+        _make_sonarr_episode(series_id=30, season_number=1, episode_id=4),
+    ]
+    window = window_from_records(
+        episodes, None, 2, group=lambda ep: (ep.series_id, ep.season_number)
+    )
+    assert [ep.id for ep in window.records] == [1, 2, 3]
+    assert window.reached_end is False
+
+
+def test_window_from_records_zero_size_keeps_cursor():
+    window = window_from_records(_movies(1, 2), after_id=1, size=0)
+    assert window.records == []
+    assert window.reached_end is False
+    assert advance_keyset(window, [], 0, position=1) == (1, 1)
+
+
+def test_advance_keyset_moves_to_last_record():
+    window = window_from_records(_movies(1, 2, 3, 4), after_id=None, size=2)
+    assert advance_keyset(window, [[1], [2]], 2, position=0) == (2, 2)
+
+
+def test_advance_keyset_wraps_at_end():
+    window = window_from_records(_movies(1, 2, 3), after_id=1, size=5)
+    assert window.reached_end is True
+    assert advance_keyset(window, [[2], [3]], 2, position=1) == (None, 0)
+
+
+def test_advance_keyset_stops_before_deferred_units():
+    window = window_from_records(_movies(1, 2, 3, 4, 5), after_id=1, size=3)
+    # Units for ids 2 and [3, 4]; only the first was handled
+    assert advance_keyset(window, [[2], [4, 3]], 1, position=1) == (2, 2)
+
+
+async def test_run_radarr_cycle_keyset_ignores_items_added_ahead(tmp_path):
+    """Items added before the cursor do not shift which items are searched next."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(10, 20, 30, 40))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+
+    result = await run_radarr_cycle(client, _default_state(), settings, db_path)
+    assert result["radarr"]["missing_last_id"] == 20
+
+    # Two new movies land ahead of the cursor between cycles
+    client.wanted_missing = AsyncMock(return_value=_movies(5, 6, 10, 20, 30, 40))
+    client.search_movies.reset_mock()
+    result = await run_radarr_cycle(client, result, settings, db_path)
+
+    searched = [call.args[0] for call in client.search_movies.call_args_list]
+    assert sorted(i for ids in searched for i in ids) == [30, 40]
+    assert result["radarr"]["missing_cursor"] == 0  # reached the end and wrapped
+
+
+async def test_run_radarr_cycle_restarts_when_cursor_passes_end(tmp_path):
+    """A cursor past every remaining item starts over from the head of the list."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(1, 2, 3))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+
+    state = _default_state()
+    state["radarr"]["missing_last_id"] = 99
+    result = await run_radarr_cycle(client, state, settings, db_path)
+
+    searched = [call.args[0] for call in client.search_movies.call_args_list]
+    assert sorted(i for ids in searched for i in ids) == [1, 2]
+    assert result["radarr"]["missing_last_id"] == 2
+
+
+async def test_run_radarr_cycle_last_searched_order_ignores_cursor(tmp_path):
+    """search_order = "last_searched" takes the head of the list and keeps no cursor."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(7, 3, 9))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+    settings.radarr.search_order = "last_searched"
+
+    state = _default_state()
+    state["radarr"]["missing_last_id"] = 5
+    state["radarr"]["missing_cursor"] = 1
+    result = await run_radarr_cycle(client, state, settings, db_path)
+
+    searched = [call.args[0] for call in client.search_movies.call_args_list]
+    assert sorted(i for ids in searched for i in ids) == [3, 7]
+    for call in client.get_wanted_window.call_args_list:
+        assert call.args[1] is None
+        assert call.kwargs["order"] == "last_searched"
+    assert result["radarr"]["missing_last_id"] is None
+    assert result["radarr"]["missing_cursor"] == 0
+
+
+async def test_run_radarr_cycle_last_searched_falls_back_without_sort_support(tmp_path):
+    """An instance that cannot sort by lastSearchTime keeps the id keyset walk."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.capabilities = AsyncMock(return_value=ApiCapabilities(version="3.2.2"))
+    client.wanted_missing = AsyncMock(return_value=_movies(1, 2, 3))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+    settings.radarr.search_order = "last_searched"
+
+    result = await run_radarr_cycle(client, _default_state(), settings, db_path)
+
+    assert client.get_wanted_window.call_args.kwargs.get("order", "id") == "id"
+    assert result["radarr"]["missing_last_id"] == 2
+
+
 # ---------------------------------------------------------------------------
 # Diagnostic cycle logging
 # ---------------------------------------------------------------------------
@@ -517,18 +960,18 @@ async def test_radarr_cycle_logs_diagnostic_summary(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         return_value=[
-            {"id": 1, "title": "Movie A", "monitored": True},
-            {"id": 2, "title": "Movie B", "monitored": True},
-            {"id": 3, "title": "Movie C", "monitored": True},
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
+            MovieRecord(id=3, title="Movie C", monitored=True),
         ]
     )
-    client.get_wanted_cutoff = AsyncMock(
+    client.wanted_cutoff = AsyncMock(
         return_value=[
-            {"id": 4, "title": "Movie D", "monitored": True},
-            {"id": 5, "title": "Movie E", "monitored": True},
+            MovieRecord(id=4, title="Movie D", monitored=True),
+            MovieRecord(id=5, title="Movie E", monitored=True),
         ]
     )
     client.search_movies = AsyncMock()
@@ -556,15 +999,16 @@ async def test_sonarr_cycle_logs_diagnostic_summary(tmp_path):
     await init_db(db_path)
 
     episodes = [
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show A", episode_id=100),
-        _make_sonarr_episode(series_id=10, season_number=2, series_title="Show A", episode_id=101),
-        _make_sonarr_episode(series_id=20, season_number=1, series_title="Show B", episode_id=200),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+        _make_sonarr_episode(series_id=10, season_number=2, episode_id=101),
+        _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
     ]
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_season = AsyncMock()
+    client.get_series = AsyncMock(return_value=SERIES)
 
     state = _default_state()
     settings = _cycle_settings(missing_count=5, cutoff_count=5)
@@ -589,15 +1033,15 @@ async def test_radarr_cycle_counts_skipped_on_search_failure(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         return_value=[
-            {"id": 1, "title": "Movie A", "monitored": True},
-            {"id": 2, "title": "Movie B", "monitored": True},
-            {"id": 3, "title": "Movie C", "monitored": True},
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
+            MovieRecord(id=3, title="Movie C", monitored=True),
         ]
     )
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_cutoff = AsyncMock(return_value=[])
     # First search fails, second and third succeed
     client.search_movies = AsyncMock(
         side_effect=[Exception("boom"), None, None]
@@ -620,6 +1064,59 @@ async def test_radarr_cycle_counts_skipped_on_search_failure(tmp_path):
     assert "1 skipped" in output
 
 
+async def test_radarr_cycle_reports_server_side_filtering(tmp_path):
+    """Unmonitored items filtered by the *arr still count and are logged as saved."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(1, 2))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.count_unmonitored = AsyncMock(side_effect=lambda queue: 8 if queue == "missing" else 0)
+    client.metrics.page_records, client.metrics.page_bytes = 4, 4096
+
+    sink = io.StringIO()
+    handler_id = logger.add(sink, format="{message}", level="INFO")
+    try:
+        result = await run_radarr_cycle(
+            client, _default_state(), _cycle_settings(2, 0), db_path
+        )
+    finally:
+        logger.remove(handler_id)
+
+    assert result["radarr"]["missing_count"] == 10
+    assert "8 unmonitored filtered server-side (~8 KiB saved)" in sink.getvalue()
+
+
+async def test_radarr_cycle_reports_requests_sent_during_the_cycle(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=_movies(1))
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.metrics.requests, client.metrics.cache_hits = 40, 7  # earlier cycles
+
+    async def fetch_window(queue, after_id, size, **options):
+        client.metrics.requests += 3
+        client.metrics.retries += 1
+        client.metrics.cache_hits += 2
+        return window_from_records(_movies(1), after_id, size)
+
+    client.get_wanted_window = AsyncMock(side_effect=fetch_window)
+
+    sink = io.StringIO()
+    handler_id = logger.add(sink, format="{message}", level="INFO")
+    try:
+        await run_radarr_cycle(client, _default_state(), _cycle_settings(1, 0), db_path)
+    finally:
+        logger.remove(handler_id)
+
+    output = sink.getvalue()
+    assert "6 requests (2 retries, 0 failed after retrying, 0 hedged" in output
+    assert "cache 4 hits / 0 misses" in output
+
+
 # ---------------------------------------------------------------------------
 # Outcome logging in DB (failed searches)
 # ---------------------------------------------------------------------------
@@ -630,13 +1127,13 @@ async def test_radarr_cycle_logs_failed_search_to_db(tmp_path):
     db_path = tmp_path / "test.db"
     await init_db(db_path)
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
         return_value=[
-            {"id": 1, "title": "Movie Fail", "monitored": True},
+            MovieRecord(id=1, title="Movie Fail", monitored=True),
         ]
     )
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_movies = AsyncMock(side_effect=Exception("API timeout"))
 
     state = _default_state()
@@ -659,13 +1156,14 @@ async def test_sonarr_cycle_logs_failed_search_to_db(tmp_path):
     await init_db(db_path)
 
     episodes = [
-        _make_sonarr_episode(series_id=10, season_number=1, series_title="Show Fail", episode_id=100),
+        _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
     ]
 
-    client = AsyncMock()
-    client.get_wanted_missing = AsyncMock(return_value=episodes)
-    client.get_wanted_cutoff = AsyncMock(return_value=[])
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=episodes)
+    client.wanted_cutoff = AsyncMock(return_value=[])
     client.search_season = AsyncMock(side_effect=Exception("Connection refused"))
+    client.get_series = AsyncMock(return_value={10: SeriesInfo(title="Show Fail")})
 
     state = _default_state()
     settings = _cycle_settings(missing_count=2, cutoff_count=2)
@@ -679,3 +1177,236 @@ async def test_sonarr_cycle_logs_failed_search_to_db(tmp_path):
     assert "Show Fail" in searches[0]["name"]
     assert searches[0]["outcome"] == "failed"
     assert "Connection refused" in searches[0]["detail"]
+
+
+# ---------------------------------------------------------------------------
+# Command queue backpressure
+# ---------------------------------------------------------------------------
+
+
+def _command(name: str, status: str = "queued", **body) -> CommandResource:
+    return CommandResource(name=name, status=status, body=body)
+
+
+def test_command_targets_per_item_for_multi_id_commands():
+    assert command_targets("MoviesSearch", {"movieIds": [1, 2]}) == {("movie", 1), ("movie", 2)}
+    assert command_targets("SeasonSearch", {"seriesId": 5, "seasonNumber": 2}) == {("season", 5, 2)}
+    assert command_targets("RefreshMonitoredDownloads", {}) == set()
+
+
+async def test_gate_counts_only_outstanding_search_commands():
+    client = AsyncMock()
+    client.get_commands = AsyncMock(
+        return_value=[
+            _command("MoviesSearch", movieIds=[1]),
+            _command("MoviesSearch", status="started", movieIds=[2]),
+            _command("MoviesSearch", status="completed", movieIds=[3]),
+            _command("RssSync"),
+        ]
+    )
+    gate = CommandQueueGate(client, limit=10, max_wait=0, poll_interval=1)
+    await gate.refresh()
+
+    assert gate.is_queued("MoviesSearch", {"movieIds": [2]})
+    assert not gate.is_queued("MoviesSearch", {"movieIds": [3]})
+    assert not gate.is_queued("MoviesSearch", {"movieIds": [1, 4]})
+
+
+async def test_gate_waits_until_queue_drains():
+    client = AsyncMock()
+    client.get_commands = AsyncMock(
+        side_effect=[
+            [_command("MoviesSearch", movieIds=[1]), _command("MoviesSearch", movieIds=[2])],
+            [_command("MoviesSearch", movieIds=[2])],
+        ]
+    )
+    gate = CommandQueueGate(client, limit=2, max_wait=60, poll_interval=5)
+    await gate.refresh()
+
+    with patch("fetcharr.search.backpressure.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await gate.acquire() is True
+    sleep.assert_awaited_once_with(5)
+    assert client.get_commands.await_count == 2
+
+
+async def test_gate_gives_up_after_wait_budget():
+    client = AsyncMock()
+    client.get_commands = AsyncMock(return_value=[_command("MoviesSearch", movieIds=[1])])
+    gate = CommandQueueGate(client, limit=1, max_wait=0, poll_interval=5)
+    await gate.refresh()
+
+    assert await gate.acquire() is False
+
+
+async def test_gate_disabled_never_reads_queue():
+    client = AsyncMock()
+    gate = CommandQueueGate(client, limit=0, max_wait=0, poll_interval=5)
+    await gate.refresh()
+
+    assert await gate.acquire() is True
+    client.get_commands.assert_not_awaited()
+
+
+async def test_run_radarr_cycle_dispatches_when_queue_unreadable(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(return_value=[MovieRecord(id=1, title="Movie A", monitored=True)])
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    request = httpx.Request("GET", "http://radarr:7878/api/v3/command")
+    client.get_commands = AsyncMock(
+        side_effect=httpx.HTTPStatusError(
+            "Server error '500 Internal Server Error'", request=request, response=httpx.Response(500, request=request)
+        )
+    )
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=1, cutoff_count=0)
+
+    result = await run_radarr_cycle(client, state, settings, db_path)
+
+    client.search_movies.assert_awaited_once_with([1])
+    assert result["radarr"]["connected"] is True
+
+
+async def test_run_radarr_cycle_skips_already_queued_search(tmp_path):
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
+        return_value=[
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
+        ]
+    )
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.get_commands = AsyncMock(return_value=[_command("MoviesSearch", movieIds=[1])])
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+
+    await run_radarr_cycle(client, state, settings, db_path)
+
+    client.search_movies.assert_awaited_once_with([2])
+    from fetcharr.db import get_recent_searches
+
+    outcomes = {e["name"]: e["outcome"] for e in await get_recent_searches(db_path)}
+    assert outcomes == {"Movie A": "skipped", "Movie B": "searched"}
+
+
+async def test_run_sonarr_cycle_defers_when_queue_stays_full(tmp_path):
+    """Commands not sent before the wait budget runs out stay ahead of the cursor."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
+        return_value=[
+            _make_sonarr_episode(series_id=10, season_number=1, episode_id=100),
+            _make_sonarr_episode(series_id=20, season_number=1, episode_id=200),
+            _make_sonarr_episode(series_id=30, season_number=1, episode_id=300),
+        ]
+    )
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.get_series = AsyncMock(return_value=SERIES)
+    client.get_commands = AsyncMock(
+        return_value=[_command("SeasonSearch", seriesId=99, seasonNumber=1)]
+    )
+
+    state = _default_state()
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+    settings.sonarr.command_queue_limit = 1
+    settings.sonarr.command_queue_max_wait = 0
+
+    result = await run_sonarr_cycle(client, state, settings, db_path)
+
+    client.search_season.assert_not_awaited()
+    # Nothing was dispatched, so the cursor did not move past the batch (0 -> 2)
+    assert result["sonarr"]["missing_cursor"] == 0
+    assert result["sonarr"]["missing_last_id"] == 99  # next cycle resumes at episode 100
+    assert result["sonarr"]["queue_wait"] == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Search dispatch (concurrency limit and token bucket)
+# ---------------------------------------------------------------------------
+
+
+async def test_dispatcher_limits_concurrency_and_keeps_order():
+    running = 0
+    peak = 0
+
+    async def job(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (3 - value % 3))
+        running -= 1
+        return value
+
+    dispatcher = SearchDispatcher(concurrency=2, rate=0, burst=1)
+    results = await dispatcher.run([lambda v=v: job(v) for v in range(6)])
+
+    assert results == list(range(6))
+    assert peak == 2
+
+
+async def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        now[0] += delay
+
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0])
+    with patch("fetcharr.search.dispatch.asyncio.sleep", new=fake_sleep):
+        for _ in range(4):
+            await bucket.acquire()
+
+    # Burst of 2 is free, then one token every 0.5s
+    assert sleeps == [0.5, 0.5]
+
+
+async def test_token_bucket_zero_rate_is_unlimited():
+    bucket = TokenBucket(rate=0, capacity=1)
+    with patch("fetcharr.search.dispatch.asyncio.sleep", new=AsyncMock()) as sleep:
+        for _ in range(10):
+            await bucket.acquire()
+    sleep.assert_not_awaited()
+
+
+async def test_run_radarr_cycle_sends_searches_concurrently(tmp_path):
+    """With search_concurrency > 1, a slow search does not hold up the next one."""
+    db_path = tmp_path / "test.db"
+    await init_db(db_path)
+    second_started = asyncio.Event()
+
+    async def search_movies(movie_ids: list[int]) -> None:
+        if movie_ids == [1]:
+            await asyncio.wait_for(second_started.wait(), timeout=1)
+        else:
+            second_started.set()
+
+    client = _wanted_client()
+    client.wanted_missing = AsyncMock(
+        return_value=[
+            MovieRecord(id=1, title="Movie A", monitored=True),
+            MovieRecord(id=2, title="Movie B", monitored=True),
+        ]
+    )
+    client.wanted_cutoff = AsyncMock(return_value=[])
+    client.search_movies = search_movies
+
+    settings = _cycle_settings(missing_count=2, cutoff_count=0)
+    settings.radarr.search_concurrency = 2
+
+    await run_radarr_cycle(client, _default_state(), settings, db_path)
+
+    from fetcharr.db import get_recent_searches
+
+    searches = await get_recent_searches(db_path)
+    # History keeps batch order regardless of completion order
+    assert [(e["name"], e["outcome"]) for e in searches] == [("Movie B", "searched"), ("Movie A", "searched")]
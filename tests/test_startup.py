@@ -1,14 +1,12 @@
-"""Tests for startup localhost URL detection and Sonarr version detection."""
+"""Tests for startup localhost URL detection, secret collection and connection validation."""
 
 from __future__ import annotations
 
 import io
 from unittest.mock import AsyncMock, patch
 
-import httpx
 from loguru import logger
 
-from fetcharr.clients.sonarr import SonarrClient
 from fetcharr.models.config import ArrConfig, Settings
 from fetcharr.startup import check_localhost_urls, collect_secrets, validate_connections
 
@@ -148,130 +146,19 @@ def test_collect_secrets_extracts_all_api_keys() -> None:
 
 
 # ---------------------------------------------------------------------------
-# Sonarr API version detection -- unit tests on SonarrClient
+# validate_connections
 # ---------------------------------------------------------------------------
 
 
-async def test_detect_api_version_parses_v3() -> None:
-    """SonarrClient.detect_api_version returns 'v3' for v3 version strings."""
-
-    async def _handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(200, json={"version": "3.0.10.1567"})
-
-    transport = httpx.MockTransport(_handler)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-        sonarr = SonarrClient("http://test", "fake-key")
-        sonarr._client = client
-        result = await sonarr.detect_api_version()
-
-    assert result == "v3"
-
-
-async def test_detect_api_version_parses_v4() -> None:
-    """SonarrClient.detect_api_version returns 'v4' for v4 version strings."""
-
-    async def _handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(200, json={"version": "4.0.1.929"})
-
-    transport = httpx.MockTransport(_handler)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-        sonarr = SonarrClient("http://test", "fake-key")
-        sonarr._client = client
-        result = await sonarr.detect_api_version()
-
-    assert result == "v4"
-
-
-async def test_detect_api_version_handles_error() -> None:
-    """SonarrClient.detect_api_version falls back to 'v3' on error."""
-
-    async def _handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(500, text="Internal Server Error")
-
-    transport = httpx.MockTransport(_handler)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
-        sonarr = SonarrClient("http://test", "fake-key")
-        sonarr._client = client
-
-        sink = io.StringIO()
-        handler_id = logger.add(sink, format="{message}", level="WARNING")
-        try:
-            result = await sonarr.detect_api_version()
-        finally:
-            logger.remove(handler_id)
-
-    assert result == "v3"
-    assert "version detection failed" in sink.getvalue()
-
-
-# ---------------------------------------------------------------------------
-# Sonarr API version detection -- integration tests via validate_connections
-# ---------------------------------------------------------------------------
-
-
-async def test_sonarr_version_detection_v3() -> None:
-    """Startup logs 'Detected API v3' after successful Sonarr connection."""
-    settings = _make_settings(sonarr_enabled=True, radarr_enabled=False)
-
-    with patch("fetcharr.startup.SonarrClient") as MockSonarrCls:
-        mock_client = AsyncMock()
-        mock_client.validate_connection = AsyncMock(return_value=True)
-        mock_client.detect_api_version = AsyncMock(return_value="v3")
-        mock_client.close = AsyncMock()
-        MockSonarrCls.return_value = mock_client
-
-        sink = io.StringIO()
-        handler_id = logger.add(sink, format="{message}", level="INFO")
-        try:
-            results = await validate_connections(settings)
-        finally:
-            logger.remove(handler_id)
-
-    assert results["sonarr"] is True
-    assert "Detected API v3" in sink.getvalue()
-
-
-async def test_sonarr_version_detection_v4() -> None:
-    """Startup logs 'Detected API v4' after successful Sonarr connection."""
-    settings = _make_settings(sonarr_enabled=True, radarr_enabled=False)
-
-    with patch("fetcharr.startup.SonarrClient") as MockSonarrCls:
-        mock_client = AsyncMock()
-        mock_client.validate_connection = AsyncMock(return_value=True)
-        mock_client.detect_api_version = AsyncMock(return_value="v4")
-        mock_client.close = AsyncMock()
-        MockSonarrCls.return_value = mock_client
-
-        sink = io.StringIO()
-        handler_id = logger.add(sink, format="{message}", level="INFO")
-        try:
-            results = await validate_connections(settings)
-        finally:
-            logger.remove(handler_id)
-
-    assert results["sonarr"] is True
-    assert "Detected API v4" in sink.getvalue()
-
-
-async def test_sonarr_version_detection_failure() -> None:
-    """When detect_api_version raises, startup still completes (fallback to v3)."""
-    settings = _make_settings(sonarr_enabled=True, radarr_enabled=False)
+async def test_validate_connections_reports_each_enabled_app() -> None:
+    settings = _make_settings(radarr_enabled=False)
 
     with patch("fetcharr.startup.SonarrClient") as MockSonarrCls:
         mock_client = AsyncMock()
         mock_client.validate_connection = AsyncMock(return_value=True)
-        mock_client.detect_api_version = AsyncMock(
-            side_effect=httpx.ConnectError("refused")
-        )
-        mock_client.close = AsyncMock()
         MockSonarrCls.return_value = mock_client
 
-        sink = io.StringIO()
-        handler_id = logger.add(sink, format="{message}", level="INFO")
-        try:
-            results = await validate_connections(settings)
-        finally:
-            logger.remove(handler_id)
+        results = await validate_connections(settings)
 
-    # Connection still validated successfully
-    assert results["sonarr"] is True
+    assert results == {"sonarr": True}
+    mock_client.close.assert_awaited_once()
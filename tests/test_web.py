@@ -41,8 +41,10 @@ async def test_app(tmp_path):
             "last_run": "2026-01-15T10:30:00Z",
             "connected": True,
             "unreachable_since": None,
-            "missing_count": 42,
+            "missing_count": 45,
             "cutoff_count": 7,
+            "missing_listed": 42,
+            "cutoff_listed": 7,
         },
         "sonarr": {
             "missing_cursor": 0,
@@ -52,6 +54,8 @@ async def test_app(tmp_path):
             "unreachable_since": None,
             "missing_count": None,
             "cutoff_count": None,
+            "missing_listed": None,
+            "cutoff_listed": None,
         },
         "search_log": [],
     }
@@ -150,6 +154,30 @@ def test_app_card_partial_has_htmx_attributes(client):
     assert "every 5s" in response.text, "Card should poll every 5 seconds"
 
 
+def test_app_card_shows_open_circuit(client, test_app):
+    """App card shows a circuit-open badge when the client's breaker is open."""
+    test_app.state.radarr_client.circuit_state = "open"
+    response = client.get("/partials/app-card/radarr")
+    assert "Circuit open" in response.text
+
+
+def test_app_card_flags_partial_fetch(client, test_app):
+    """App card shows a partial badge when the last cycle skipped pages."""
+    assert "Partial" not in client.get("/partials/app-card/radarr").text
+    test_app.state.fetcharr_state["radarr"]["skipped_pages"] = 2
+    response = client.get("/partials/app-card/radarr")
+    assert "Partial" in response.text
+    assert "2 wanted-list page(s)" in response.text
+
+
+def test_app_card_shows_backlog_trend(client, test_app):
+    """App card shows how the backlog moved over the last hour."""
+    test_app.state.radarr_client.backlog.change = lambda queue, seconds=3600: {"missing": 5, "cutoff": -2}[queue]
+    response = client.get("/partials/app-card/radarr")
+    assert "+5 in 1h" in response.text
+    assert "-2 in 1h" in response.text
+
+
 def test_search_log_partial_returns_200(client):
     """GET /partials/search-log returns 200."""
     response = client.get("/partials/search-log")
@@ -244,6 +272,33 @@ def test_save_settings_replaces_api_key_when_provided(client, test_app, tmp_path
     assert "test-radarr-key" not in content, "Old radarr key should be replaced"
 
 
+def test_save_settings_preserves_toml_only_fields(client, test_app, tmp_path):
+    """POST /settings carries over app tuning fields the form does not expose."""
+    test_app.state.settings.radarr.model_dump.return_value = {"page_concurrency": 8}
+    response = client.post(
+        "/settings",
+        data={
+            "log_level": "info",
+            "radarr_url": "http://radarr:7878",
+            "radarr_api_key": "",
+            "radarr_enabled": "on",
+            "radarr_search_interval": "30",
+            "radarr_search_missing_count": "5",
+            "radarr_search_cutoff_count": "5",
+            "sonarr_url": "",
+            "sonarr_api_key": "",
+            "sonarr_search_interval": "30",
+            "sonarr_search_missing_count": "5",
+            "sonarr_search_cutoff_count": "5",
+        },
+        follow_redirects=False,
+    )
+    assert response.status_code == 303
+
+    content = test_app.state.config_path.read_text()
+    assert "page_concurrency = 8" in content
+
+
 def test_save_settings_rejects_both_zero_counts(client, test_app, tmp_path):
     """POST /settings with both counts=0 for enabled app redirects without writing config."""
     response = client.post(
@@ -329,9 +384,10 @@ def test_dashboard_shows_position_x_of_y(client):
     """Dashboard app card shows position in 'X of Y' format (WEBU-09)."""
     response = client.get("/")
     assert response.status_code == 200
-    # Radarr mock state: missing_cursor=3, missing_count=42
+    # Radarr mock state: missing_cursor=3, missing_listed=42 (missing_count=45
+    # also counts unmonitored items, which the cursor never walks)
     assert "3 of 42" in response.text, "Missing position should show 'X of Y' format"
-    # Radarr mock state: cutoff_cursor=1, cutoff_count=7
+    # Radarr mock state: cutoff_cursor=1, cutoff_listed=7
     assert "1 of 7" in response.text, "Cutoff position should show 'X of Y' format"
 
 